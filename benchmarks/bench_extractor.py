@@ -0,0 +1,75 @@
+"""Compare `dataclasses.asdict` with cached field extractor used on writes
+
+Usage:
+    python -m benchmarks.bench_extractor [entities...]
+"""
+
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List
+
+from dbrepos.core.extractors import field_extractor
+
+COLUMNS = frozenset({"id", "name", "is_deleted", "payload", "tags"})
+
+
+@dataclass
+class Item:
+    sku: str
+    quantity: int
+
+
+@dataclass
+class Entity:
+    id: int
+    name: str
+    is_deleted: bool
+    payload: Dict[str, Any] = field(default_factory=dict)
+    tags: List[str] = field(default_factory=list)
+    items: List[Item] = field(default_factory=list)  # NOTE: not a column
+
+
+def make(n: int) -> List[Entity]:
+    return [
+        Entity(
+            id=i,
+            name=f"name{i}",
+            is_deleted=False,
+            payload={"source": "csv", "attrs": {"a": [1, 2, 3], "b": {"c": "d"}}},
+            tags=["x", "y", "z"],
+            items=[Item(sku=f"sku{j}", quantity=j) for j in range(3)],
+        )
+        for i in range(n)
+    ]
+
+
+def timed(label: str, func) -> float:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<12} {elapsed:8.4f}s")
+    return elapsed
+
+
+def main(sizes: List[int]) -> None:
+    for n in sizes:
+        entities = make(n)
+        print(f"{n} entities")
+
+        def with_asdict():
+            for entity in entities:
+                values = asdict(entity)
+                {key: value for key, value in values.items() if key in COLUMNS}
+
+        def with_extractor():
+            for entity in entities:
+                field_extractor(type(entity), COLUMNS)(entity)
+
+        baseline = timed("asdict", with_asdict)
+        fast = timed("extractor", with_extractor)
+        print(f"{'speedup':<12} {baseline / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 100_000])
@@ -0,0 +1,131 @@
+"""Compare per-call overhead of stacked decorators with fused `repo_method`
+
+Stacked variant mirrors previous `AlchemyRepo.get_by_pk`, which re-entered
+decorated `get_by_field` (handle_error -> strict -> session -> convert)
+from its own decorators.
+
+Usage:
+    python -m benchmarks.bench_repo_method [calls]
+"""
+
+import sys
+import timeit
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import sqlalchemy as sa
+import sqlalchemy.orm as orm
+from sqlalchemy.pool import StaticPool
+
+from dbrepos.decorators import convert, handle_error, repo_method, session, strict
+from dbrepos.sqlalchemy.repo import AlchemyRepo
+
+metadata = sa.MetaData()
+BenchTable = sa.Table(
+    "bench",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("name", sa.String(100)),
+)
+
+
+@dataclass
+class BenchEntity:
+    id: int
+    name: str
+
+
+class StackedRepo(AlchemyRepo):
+    @handle_error
+    @strict
+    @session
+    @convert(orm="alchemy")
+    def get_by_field(self, *, name, value, convert_to=None, strict=True, **kwargs):
+        return self._get_by_field(
+            name, value, strict=strict, extra=None, session=kwargs["session"]
+        )
+
+    @handle_error
+    @session
+    def get_by_pk(self, pk, *, convert_to=None, strict=True, **kwargs):
+        return self.get_by_field(
+            name=self.pk_field_name,
+            value=pk,
+            strict=strict,
+            session=kwargs["session"],
+            convert_to=convert_to,
+        )
+
+
+class Noop:
+    session_factory: Any = None
+
+    def call(self, *, convert_to=None, strict=True, session=None):
+        return (1, "name")
+
+
+def measure(label: str, call: Callable[[], Any], calls: int) -> float:
+    # NOTE: best of several runs is the least noisy estimate of overhead
+    elapsed = min(timeit.repeat(call, number=calls, repeat=5)) / calls
+    print(f"{label:<32}{elapsed * 1e6:8.2f}us/call")
+    return elapsed
+
+
+def main(calls: int) -> None:
+    engine = sa.create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    metadata.create_all(engine)
+    maker = orm.sessionmaker(bind=engine)
+
+    @contextmanager
+    def session_factory():
+        with maker() as session, session.begin():
+            yield session
+
+    with session_factory() as session_:
+        session_.execute(sa.insert(BenchTable), [{"name": "name"}])
+
+    noop = Noop()
+    noop.session_factory = lambda: nullcontext(object())
+    stacked_noop = handle_error(strict(session(convert(Noop.call, orm="alchemy"))))
+    fused_noop = repo_method(
+        Noop.call, strict=True, session=True, convert=True, orm="alchemy"
+    )
+
+    print("wrapper overhead (no query):")
+    measure(
+        "  stacked decorators",
+        lambda: stacked_noop(noop, convert_to=BenchEntity),
+        calls,
+    )
+    measure(
+        "  repo_method",
+        lambda: fused_noop(noop, convert_to=BenchEntity),
+        calls,
+    )
+
+    stacked = StackedRepo(table_class=BenchTable, session_factory=session_factory)
+    fused = AlchemyRepo(table_class=BenchTable, session_factory=session_factory)
+    assert stacked.get_by_pk(1, convert_to=BenchEntity) == fused.get_by_pk(
+        1, convert_to=BenchEntity
+    )
+
+    print("get_by_pk (in-memory SQLite):")
+    measure(
+        "  stacked decorators",
+        lambda: stacked.get_by_pk(1, convert_to=BenchEntity),
+        calls // 10,
+    )
+    measure(
+        "  repo_method + fast path",
+        lambda: fused.get_by_pk(1, convert_to=BenchEntity),
+        calls // 10,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,75 @@
+"""Compare sequential `all()` with `scan_partitions()` on a SQLite table
+
+Usage:
+    python -m benchmarks.bench_scan_partitions [rows] [partitions]
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+import sqlalchemy as sa
+import sqlalchemy.orm as orm
+
+from dbrepos.sqlalchemy.repo import AlchemyRepo
+
+metadata = sa.MetaData()
+BenchTable = sa.Table(
+    "bench",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("name", sa.String(100)),
+)
+
+
+def digest(row):
+    # NOTE: CPU-heavy converter to show process pool effect
+    value = str(tuple(row)).encode()
+    for _ in range(200):
+        value = hashlib.sha256(value).digest()
+    return value
+
+
+def main(rows: int, partitions: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = sa.create_engine(f"sqlite:///{path}")
+    metadata.create_all(engine)
+    maker = orm.sessionmaker(bind=engine)
+
+    @contextmanager
+    def session_factory():
+        with maker() as session, session.begin():
+            yield session
+
+    with session_factory() as session:
+        session.execute(
+            sa.insert(BenchTable), [{"name": f"name{i}"} for i in range(rows)]
+        )
+
+    repo = AlchemyRepo(table_class=BenchTable, session_factory=session_factory)
+
+    start = time.perf_counter()
+    sequential = [digest(row) for row in repo.all()]
+    print(f"all() + convert:           {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    threaded = list(repo.scan_partitions(partitions, transform=digest))
+    print(f"scan_partitions (threads): {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    processed = list(
+        repo.scan_partitions(partitions, transform=digest, processes=partitions)
+    )
+    print(f"scan_partitions (procs):   {time.perf_counter() - start:.3f}s")
+
+    assert sequential == threaded == processed
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+    )
@@ -0,0 +1,193 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Set, Tuple
+
+from dbrepos.core.types import CacheStats
+
+
+def _approximate_size(result: Any) -> int:
+    """Approximate memory size of cached result in bytes
+
+    Collections are measured with their items, items with their attributes,
+    but attribute values are not followed further.
+
+    Args:
+        result (Any): Cached result
+
+    Returns:
+        int: Approximate size in bytes
+    """
+
+    def sizeof(value: Any) -> int:
+        size = sys.getsizeof(value)
+        if hasattr(value, "__dict__"):
+            size += sum(map(sys.getsizeof, vars(value).values()))
+        elif isinstance(value, tuple):
+            size += sum(map(sys.getsizeof, value))
+        return size
+
+    if isinstance(result, (list, set, frozenset)):
+        return sys.getsizeof(result) + sum(map(sizeof, result))
+    return sizeof(result)
+
+
+class ResultCache:
+    """In-memory cache of repository read results
+
+    Entries are keyed by table, table generation and call fingerprint.
+    Any write through a repository sharing the cache bumps table generation
+    and drops all cached results of that table at once.
+    Expired entries are dropped on lookup, the rest are evicted in LRU order
+    once there are more than `maxsize` entries or their approximate size
+    exceeds `maxbytes`.
+
+    Concurrent misses of the same key are coalesced with per-key locks,
+    so only one of them runs the query (stampede protection).
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1024,
+        maxbytes: int | None = None,
+        ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            maxsize (int, optional): Maximum number of cached results.
+                Defaults to 1024
+            maxbytes (int | None, optional): Maximum approximate size
+                of cached results in bytes, larger results are not cached.
+                Defaults to None (meaning size is not bounded)
+            ttl (float, optional): Time to live of cached result in seconds.
+                Defaults to 5.0
+            clock (Callable[[], float], optional): Time source.
+                Defaults to time.monotonic
+        """
+        assert maxsize > 0, "Cache size must be positive."
+        assert ttl > 0, "Cache TTL must be positive."
+        assert maxbytes is None or maxbytes > 0, "Cache bytes must be positive."
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, Tuple[float, int, Any]] = OrderedDict()
+        self._generations: Dict[Hashable, int] = {}
+        self._keys: Dict[Hashable, Set[Hashable]] = {}
+        self._bytes = 0
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_load(
+        self, table: Hashable, key: Hashable, load: Callable[[], Any]
+    ) -> Any:
+        """Get cached result or load and cache it
+
+        Args:
+            table (Hashable): Table the result is loaded from
+            key (Hashable): Call fingerprint
+            load (Callable[[], Any]): Result loader
+
+        Returns:
+            Any: Cached or just loaded result
+        """
+        with self._lock:
+            full_key = (table, self._generations.get(table, 0), key)
+            found, result = self._get(full_key)
+            if found:
+                self._hits += 1
+                return result
+            lock = self._locks.setdefault(full_key, threading.Lock())
+
+        with lock:
+            with self._lock:
+                found, result = self._get(full_key)
+                if found:
+                    self._hits += 1
+                    return result
+                self._misses += 1
+
+            try:
+                result = load()
+                size = 0 if self.maxbytes is None else _approximate_size(result)
+                with self._lock:
+                    # NOTE: table could be invalidated while result was loaded
+                    if full_key[1] != self._generations.get(table, 0) or (
+                        self.maxbytes is not None and size > self.maxbytes
+                    ):
+                        return result
+                    self._put(full_key, (self._clock() + self.ttl, size, result))
+                return result
+            finally:
+                with self._lock:
+                    self._locks.pop(full_key, None)
+
+    def invalidate(self, table: Hashable) -> None:
+        """Invalidate all cached results of the table
+
+        Args:
+            table (Hashable): Table to invalidate
+        """
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            # NOTE: results of older generations are never hit again
+            for full_key in self._keys.pop(table, ()):
+                self._bytes -= self._entries.pop(full_key)[1]
+
+    def stats(self) -> CacheStats:
+        """Cache hit/miss statistics
+
+        Returns:
+            CacheStats: Current statistics
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Drop all cached results and reset statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def _get(self, full_key: Tuple[Hashable, int, Hashable]) -> Tuple[bool, Any]:
+        entry = self._entries.get(full_key, None)
+        if entry is None:
+            return False, None
+        expires_at, _, result = entry
+        if expires_at <= self._clock():
+            self._pop(full_key)
+            return False, None
+        self._entries.move_to_end(full_key)
+        return True, result
+
+    def _put(
+        self, full_key: Tuple[Hashable, int, Hashable], entry: Tuple[float, int, Any]
+    ) -> None:
+        if full_key in self._entries:
+            self._pop(full_key)
+        self._entries[full_key] = entry
+        self._keys.setdefault(full_key[0], set()).add(full_key)
+        self._bytes += entry[1]
+        while len(self._entries) > self.maxsize or (
+            self.maxbytes is not None and self._bytes > self.maxbytes
+        ):
+            self._pop(next(iter(self._entries)))
+
+    def _pop(self, full_key: Tuple[Hashable, int, Hashable]) -> None:
+        self._bytes -= self._entries.pop(full_key)[1]
+        keys = self._keys[full_key[0]]
+        keys.discard(full_key)
+        if not keys:
+            del self._keys[full_key[0]]
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 from contextlib import AbstractContextManager
+from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
     Iterable,
+    Iterator,
     Literal,
     Mapping,
     Protocol,
     Self,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -19,7 +25,14 @@ from typing import (
 if TYPE_CHECKING:
     from _typeshed import DataclassInstance
 
-from dbrepos.core.types import Extra, mode, operator
+from dbrepos.core.types import (
+    Extra,
+    SoftDeleteMarker,
+    StreamStats,
+    mode,
+    operator,
+    returning,
+)
 
 # NOTE: basically, we have 2 types of results:
 #   1. TResultDataclass, when conver_to param is specified;
@@ -37,6 +50,7 @@ TResultORM = TypeVar("TResultORM", covariant=True)
 TCompiledFilter = TypeVar("TCompiledFilter", covariant=True)
 TPrimaryKey = TypeVar("TPrimaryKey", int, str, covariant=True)
 TFieldValue = TypeVar("TFieldValue")
+TNumber = int | float | Decimal
 TSession = TypeVar("TSession", covariant=True)
 
 
@@ -46,6 +60,8 @@ class IRepo(Protocol[TTable, TResultORM]):
     is_soft_deletable: bool
     default_ordering: Tuple[str, ...]
     session_factory: AbstractContextManager | None
+    soft_delete_marker: SoftDeleteMarker
+    version_column: str | None
 
     def __init__(
         self,
@@ -55,6 +71,8 @@ class IRepo(Protocol[TTable, TResultORM]):
         is_soft_deletable: bool = False,
         default_ordering: Tuple[str, ...] = ("id",),
         session_factory: AbstractContextManager | None = None,
+        soft_delete_marker: SoftDeleteMarker | None = None,
+        version_column: str | None = None,
     ) -> None:
         """Construct a repo instance
 
@@ -69,6 +87,12 @@ class IRepo(Protocol[TTable, TResultORM]):
             session_factory (AbstractContextManager | None, optional):
                 Factory for the session.
                 Currently supported to SQLAlchemy
+            soft_delete_marker (SoftDeleteMarker | None, optional):
+                Column and values that mark row as soft deleted.
+                Defaults to None (meaning `is_deleted` boolean column)
+            version_column (str | None, optional): Integer column
+                for optimistic locking, incremented on every update.
+                Defaults to None (meaning table is not versioned)
         """
 
     @overload
@@ -76,12 +100,15 @@ class IRepo(Protocol[TTable, TResultORM]):
         self,
         entity: TEntity,
         *,
+        returning_: Literal[returning.row] = returning.row,
         session: TSession | None = None,
     ) -> TResultORM:
         """Insert row
 
         Args:
             entity (TEntity): Entity that should be inserted
+            returning_ (returning): What to return for inserted row.
+                Defaults to returning.row
             session (TSession | None): Session to use for DB queries.
                 Defaults to None.
                 Currently supported for SQLAlchemy
@@ -96,6 +123,7 @@ class IRepo(Protocol[TTable, TResultORM]):
         entity: TEntity,
         *,
         convert_to: Type[TResultDataclass],
+        returning_: Literal[returning.row] = returning.row,
         session: TSession | None = None,
     ) -> TResultDataclass:
         """Insert row
@@ -103,6 +131,8 @@ class IRepo(Protocol[TTable, TResultORM]):
         Args:
             entity (TEntity): Entity that should be inserted
             convert_to (Type[TResultDataclass]): Convert result to
+            returning_ (returning): What to return for inserted row.
+                Defaults to returning.row
             session (TSession | None): Session to use for DB queries.
                 Defaults to None.
                 Currently supported for SQLAlchemy
@@ -111,6 +141,179 @@ class IRepo(Protocol[TTable, TResultORM]):
             TResultDataclass: Inserted row
         """
 
+    @overload
+    def create(
+        self,
+        entity: TEntity,
+        *,
+        returning_: Literal[returning.pk],
+        session: TSession | None = None,
+    ) -> int | str:
+        """Insert row and fetch its primary key only
+
+        Args:
+            entity (TEntity): Entity that should be inserted
+            returning_ (returning): What to return for inserted row
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            int | str: Primary key of inserted row
+        """
+
+    @overload
+    def create(
+        self,
+        entity: TEntity,
+        *,
+        returning_: Literal[returning.none],
+        session: TSession | None = None,
+    ) -> None:
+        """Insert row without fetching anything back
+
+        Args:
+            entity (TEntity): Entity that should be inserted
+            returning_ (returning): What to return for inserted row
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+        """
+
+    @overload
+    def bulk_create(
+        self,
+        entities: Sequence[TEntity],
+        *,
+        batch_size: int = 1000,
+        returning_: Literal[returning.none] = returning.none,
+        session: TSession | None = None,
+    ) -> int:
+        """Insert rows with multi-row inserts
+
+        Args:
+            entities (Sequence[TEntity]): Entities that should be inserted
+            batch_size (int, optional): Maximum number of rows in one insert.
+                Defaults to 1000
+            returning_ (returning): What to return for inserted rows.
+                Defaults to returning.none
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            int: Number of inserted rows
+        """
+
+    @overload
+    def bulk_create(
+        self,
+        entities: Sequence[TEntity],
+        *,
+        batch_size: int = 1000,
+        returning_: Literal[returning.pk],
+        session: TSession | None = None,
+    ) -> Sequence[int | str]:
+        """Insert rows with multi-row inserts and fetch their primary keys
+
+        Args:
+            entities (Sequence[TEntity]): Entities that should be inserted
+            batch_size (int, optional): Maximum number of rows in one insert.
+                Defaults to 1000
+            returning_ (returning): What to return for inserted rows
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Sequence[int | str]: Primary keys of inserted rows in entities order
+        """
+
+    @overload
+    def bulk_create(
+        self,
+        entities: Sequence[TEntity],
+        *,
+        batch_size: int = 1000,
+        returning_: Literal[returning.row],
+        session: TSession | None = None,
+    ) -> Sequence[TResultORM]:
+        """Insert rows with multi-row inserts and fetch them back
+
+        Args:
+            entities (Sequence[TEntity]): Entities that should be inserted
+            batch_size (int, optional): Maximum number of rows in one insert.
+                Defaults to 1000
+            returning_ (returning): What to return for inserted rows
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Sequence[TResultORM]: Inserted rows in entities order
+        """
+
+    @overload
+    def bulk_create(
+        self,
+        entities: Sequence[TEntity],
+        *,
+        convert_to: Type[TResultDataclass],
+        batch_size: int = 1000,
+        returning_: Literal[returning.row],
+        session: TSession | None = None,
+    ) -> Sequence[TResultDataclass]:
+        """Insert rows with multi-row inserts and fetch them back
+
+        Args:
+            entities (Sequence[TEntity]): Entities that should be inserted
+            convert_to (Type[TResultDataclass]): Convert result to
+            batch_size (int, optional): Maximum number of rows in one insert.
+                Defaults to 1000
+            returning_ (returning): What to return for inserted rows
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Sequence[TResultDataclass]: Inserted rows in entities order
+        """
+
+    def create_stream(
+        self,
+        entities: Iterable[TEntity],
+        *,
+        batch_size: int = 1000,
+        commit_every: int = 1,
+        flush_interval: float | None = None,
+        on_progress: Callable[[StreamStats], None] | None = None,
+        session: TSession | None = None,
+    ) -> StreamStats:
+        """Insert rows pulled lazily from iterable
+
+        Only one batch of entities is kept in memory at a time.
+
+        Args:
+            entities (Iterable[TEntity]): Entities that should be inserted,
+                e.g. a generator
+            batch_size (int, optional): Maximum number of rows in one insert.
+                Defaults to 1000
+            commit_every (int, optional): Number of batches per transaction.
+                Ignored if session is passed. Defaults to 1
+            flush_interval (float | None, optional): Insert incomplete batch
+                if this many seconds passed since the previous insert.
+                Defaults to None
+            on_progress (Callable[[StreamStats], None] | None, optional):
+                Called with current statistics after every insert.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Caller is responsible for commit. Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            StreamStats: Final statistics
+        """
+
     @overload
     def get_by_field(
         self,
@@ -139,7 +342,7 @@ class IRepo(Protocol[TTable, TResultORM]):
             TResultORM: Found row
 
         Raises:
-            BaseRepoException: If row is not found
+            NotFoundError: If row is not found
         """
 
     @overload
@@ -172,7 +375,7 @@ class IRepo(Protocol[TTable, TResultORM]):
             TResultDataclass: Found row
 
         Raises:
-            BaseRepoException: If row is not found
+            NotFoundError: If row is not found
         """
 
     @overload
@@ -259,7 +462,7 @@ class IRepo(Protocol[TTable, TResultORM]):
             TResultORM: Found row
 
         Raises:
-            BaseRepoException: If row is not found
+            NotFoundError: If row is not found
         """
 
     @overload
@@ -290,7 +493,7 @@ class IRepo(Protocol[TTable, TResultORM]):
             TResultDataclass: Found row
 
         Raises:
-            BaseRepoException: If row is not found
+            NotFoundError: If row is not found
         """
 
     @overload
@@ -373,7 +576,7 @@ class IRepo(Protocol[TTable, TResultORM]):
             TResultORM: Found row
 
         Raises:
-            BaseRepoException: If row is not found
+            NotFoundError: If row is not found
         """
 
     @overload
@@ -404,7 +607,7 @@ class IRepo(Protocol[TTable, TResultORM]):
             TResultDataclass: Found row
 
         Raises:
-            BaseRepoException: If row is not found
+            NotFoundError: If row is not found
         """
 
     @overload
@@ -461,6 +664,130 @@ class IRepo(Protocol[TTable, TResultORM]):
             TResultDataclass: Found row
         """
 
+    @overload
+    def get_many_by_field(
+        self,
+        name: str,
+        values: Iterable[TFieldValue],
+        *,
+        extra: Extra | None = None,
+        batch_size: int = 1000,
+        session: TSession | None = None,
+    ) -> Mapping[Any, TResultORM]:
+        """Get rows by many values of the field
+
+        Values are deduplicated and looked up with one query per batch.
+        Field is expected to be unique, otherwise the first row
+        in ordering is kept.
+
+        Args:
+            name (str): Name of the field
+            values (Iterable[TFieldValue]): Values to look up
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            batch_size (int, optional): Maximum number of values
+                looked up with one query. Defaults to 1000
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Mapping[Any, TResultORM]: Found rows by lookup value,
+                in order of passed values. Missing values are skipped
+        """
+
+    @overload
+    def get_many_by_field(
+        self,
+        name: str,
+        values: Iterable[TFieldValue],
+        *,
+        convert_to: Type[TResultDataclass],
+        extra: Extra | None = None,
+        batch_size: int = 1000,
+        session: TSession | None = None,
+    ) -> Mapping[Any, TResultDataclass]:
+        """Get rows by many values of the field
+
+        Values are deduplicated and looked up with one query per batch.
+        Field is expected to be unique, otherwise the first row
+        in ordering is kept.
+
+        Args:
+            name (str): Name of the field
+            values (Iterable[TFieldValue]): Values to look up
+            convert_to (Type[TResultDataclass]): Convert result to
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            batch_size (int, optional): Maximum number of values
+                looked up with one query. Defaults to 1000
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Mapping[Any, TResultDataclass]: Found rows by lookup value,
+                in order of passed values. Missing values are skipped
+        """
+
+    @overload
+    def get_many_by_pks(
+        self,
+        pks: Iterable[TPrimaryKey],
+        *,
+        extra: Extra | None = None,
+        batch_size: int = 1000,
+        session: TSession | None = None,
+    ) -> Mapping[Any, TResultORM]:
+        """Get rows by primary keys
+
+        Primary keys are deduplicated and looked up with one query per batch.
+
+        Args:
+            pks (Iterable[TPrimaryKey]): Primary key values
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            batch_size (int, optional): Maximum number of values
+                looked up with one query. Defaults to 1000
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Mapping[Any, TResultORM]: Found rows by lookup value,
+                in order of passed values. Missing values are skipped
+        """
+
+    @overload
+    def get_many_by_pks(
+        self,
+        pks: Iterable[TPrimaryKey],
+        *,
+        convert_to: Type[TResultDataclass],
+        extra: Extra | None = None,
+        batch_size: int = 1000,
+        session: TSession | None = None,
+    ) -> Mapping[Any, TResultDataclass]:
+        """Get rows by primary keys
+
+        Primary keys are deduplicated and looked up with one query per batch.
+
+        Args:
+            pks (Iterable[TPrimaryKey]): Primary key values
+            convert_to (Type[TResultDataclass]): Convert result to
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            batch_size (int, optional): Maximum number of values
+                looked up with one query. Defaults to 1000
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Mapping[Any, TResultDataclass]: Found rows by lookup value,
+                in order of passed values. Missing values are skipped
+        """
+
     @overload
     def all(
         self,
@@ -645,117 +972,682 @@ class IRepo(Protocol[TTable, TResultORM]):
             Iterable[TResultDataclass]: Found rows
         """
 
-    def update(
+    @overload
+    def pluck(
         self,
-        pk: TPrimaryKey,
+        field: str,
         *,
-        values: Mapping[str, TFieldValue],
+        filters: IFilterSeq | None = None,
         extra: Extra | None = None,
+        distinct: bool = False,
+        flat: bool = True,
+        chunk_size: None = None,
         session: TSession | None = None,
-    ) -> None:
-        """Update row
+    ) -> Sequence[Any]:
+        """Select values of one column
+
+        Only this column is selected and rows are not converted,
+        which is much cheaper than reading full rows, e.g. to collect ids.
 
         Args:
-            pk (TPrimaryKey): Primary key of row to update
-            values (Mapping[str, TFieldValue]): Mapping with
-                format {field_name:new_value}
+            field (str): Name of the column
+            filters (IFilterSeq | None, optional): Filter sequence.
+                Defaults to None
             extra (Extra | None, optional): Extra params.
                 Defaults to None
+            distinct (bool, optional): Select distinct values only,
+                ordered by selected columns unless `extra.ordering` is set.
+                Defaults to False
+            flat (bool, optional): Return scalars instead of 1-tuples.
+                Defaults to True
+            chunk_size (None, optional): Fetch all rows at once.
+                Defaults to None
             session (TSession | None): Session to use for DB queries.
                 Defaults to None.
                 Currently supported for SQLAlchemy
+
+        Returns:
+            Sequence[Any]: Selected values
         """
 
-    def multi_update(
+    @overload
+    def pluck(
         self,
-        pks: Sequence[TPrimaryKey],
+        field: str,
         *,
-        values: Mapping[str, TFieldValue],
+        filters: IFilterSeq | None = None,
         extra: Extra | None = None,
+        distinct: bool = False,
+        flat: bool = True,
+        chunk_size: int,
         session: TSession | None = None,
-    ) -> None:
-        """Update rows
+    ) -> Iterator[Any]:
+        """Select values of one column
+
+        Only this column is selected and rows are not converted,
+        which is much cheaper than reading full rows, e.g. to collect ids.
 
         Args:
-            pks (Sequence[TPrimaryKey]): Primary keys of rows to update
-            values (Mapping[str, TFieldValue]): Mapping with
-                format {field_name:new_value}
+            field (str): Name of the column
+            filters (IFilterSeq | None, optional): Filter sequence.
+                Defaults to None
             extra (Extra | None, optional): Extra params.
                 Defaults to None
+            distinct (bool, optional): Select distinct values only,
+                ordered by selected columns unless `extra.ordering` is set.
+                Defaults to False
+            flat (bool, optional): Return scalars instead of 1-tuples.
+                Defaults to True
+            chunk_size (int): Stream rows, fetching this many at a time
             session (TSession | None): Session to use for DB queries.
                 Defaults to None.
                 Currently supported for SQLAlchemy
+
+        Returns:
+            Iterator[Any]: Selected values
         """
 
-    def delete(
+    @overload
+    def values(
         self,
-        pk: TPrimaryKey,
+        fields: Sequence[str],
         *,
+        filters: IFilterSeq | None = None,
         extra: Extra | None = None,
+        distinct: bool = False,
+        chunk_size: None = None,
         session: TSession | None = None,
-    ) -> None:
-        """Delete row by pk
+    ) -> Sequence[Tuple[Any, ...]]:
+        """Select tuples of column values
+
+        Only these columns are selected and rows are not converted,
+        which is much cheaper than reading full rows, e.g. to collect ids.
 
         Args:
-            pk (TPrimaryKey): Primary key of row to delete
+            fields (Sequence[str]): Names of the columns
+            filters (IFilterSeq | None, optional): Filter sequence.
+                Defaults to None
             extra (Extra | None, optional): Extra params.
                 Defaults to None
+            distinct (bool, optional): Select distinct values only,
+                ordered by selected columns unless `extra.ordering` is set.
+                Defaults to False
+            chunk_size (None, optional): Fetch all rows at once.
+                Defaults to None
             session (TSession | None): Session to use for DB queries.
                 Defaults to None.
                 Currently supported for SQLAlchemy
+
+        Returns:
+            Sequence[Tuple[Any, ...]]: Selected values
         """
 
-    def delete_by_field(
+    @overload
+    def values(
         self,
+        fields: Sequence[str],
         *,
-        name: str,
-        value: TFieldValue,
+        filters: IFilterSeq | None = None,
         extra: Extra | None = None,
+        distinct: bool = False,
+        chunk_size: int,
         session: TSession | None = None,
-    ) -> None:
-        """Delete row by field:value
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Select tuples of column values
+
+        Only these columns are selected and rows are not converted,
+        which is much cheaper than reading full rows, e.g. to collect ids.
 
         Args:
-            name (str): Name of the field
-            value (TFieldValue): Value of the field
+            fields (Sequence[str]): Names of the columns
+            filters (IFilterSeq | None, optional): Filter sequence.
+                Defaults to None
             extra (Extra | None, optional): Extra params.
                 Defaults to None
+            distinct (bool, optional): Select distinct values only,
+                ordered by selected columns unless `extra.ordering` is set.
+                Defaults to False
+            chunk_size (int): Stream rows, fetching this many at a time
             session (TSession | None): Session to use for DB queries.
                 Defaults to None.
                 Currently supported for SQLAlchemy
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: Selected values
         """
 
-    def exists_by_field(
+    def update(
         self,
+        pk: TPrimaryKey,
         *,
-        name: str,
-        value: TFieldValue,
+        values: Mapping[str, TFieldValue],
+        expected_version: int | None = None,
         extra: Extra | None = None,
         session: TSession | None = None,
-    ) -> bool:
-        """Check if row exists by field:value
+    ) -> None:
+        """Update row
 
         Args:
-            name (str): Name of the field
-            value (TFieldValue): Value of the field
+            pk (TPrimaryKey): Primary key of row to update
+            values (Mapping[str, TFieldValue]): Mapping with
+                format {field_name:new_value}
+            expected_version (int | None, optional): Update row only if
+                its `version_column` still has this value.
+                Defaults to None (meaning no version check)
             extra (Extra | None, optional): Extra params.
                 Defaults to None
             session (TSession | None): Session to use for DB queries.
                 Defaults to None.
                 Currently supported for SQLAlchemy
 
-        Returns:
-            bool: Row existence
+        Raises:
+            VersionConflictError: If row version differs from expected one
         """
 
-    def exists_by_filters(
+    def save(
         self,
+        entity: TEntity,
         *,
-        filters: IFilterSeq,
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> bool:
-        """Check if row exists by filters
+        """Update changed columns of the entity row
+
+        Entities loaded with `convert_to` are snapshotted by repo
+        `change_tracker`, so only fields changed since loading are updated
+        and unchanged entity emits no statement at all.
+        Untracked entities are updated with all fields.
+        For versioned tables, entity version is checked and incremented.
+
+        Args:
+            entity (TEntity): Entity with primary key field
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Raises:
+            VersionConflictError: If row version differs from entity one
+
+        Returns:
+            bool: Whether UPDATE was emitted
+        """
+
+    def multi_update(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        values: Mapping[str, TFieldValue],
+        expected_versions: Mapping[Any, int] | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> None:
+        """Update rows
+
+        Args:
+            pks (Sequence[TPrimaryKey]): Primary keys of rows to update
+            values (Mapping[str, TFieldValue]): Mapping with
+                format {field_name:new_value}
+            expected_versions (Mapping[Any, int] | None, optional): Mapping with
+                format {pk:version}. Rows are updated only if all of them
+                still have expected versions in `version_column`.
+                Defaults to None (meaning no version check)
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Raises:
+            BaseRepoException: If `expected_versions` are passed for not versioned
+                table or miss any of `pks`
+            VersionConflictError: If any row version differs from expected one
+        """
+
+    def update_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        values: Mapping[str, TFieldValue],
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        """Update rows by filters with a single UPDATE ... WHERE
+
+        Args:
+            filters (IFilterSeq): Filters of rows to update
+            values (Mapping[str, TFieldValue]): Mapping with
+                format {field_name:new_value}
+            batch_size (int | None, optional): Update matching rows
+                in pk-ordered chunks of this size, one statement per chunk.
+                Without passed session every chunk is committed separately.
+                Defaults to None (meaning all rows at once)
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            int: Number of updated rows
+        """
+
+    def bulk_update(
+        self,
+        values: Mapping[Any, Mapping[str, TFieldValue]],
+        *,
+        deltas: Mapping[Any, Mapping[str, TNumber]] | None = None,
+        expected_versions: Mapping[Any, int] | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        """Update rows with different values per row with one UPDATE
+
+        Changed columns are set with CASE over primary key,
+        so rows are not read before write.
+
+        Args:
+            values (Mapping[Any, Mapping[str, TFieldValue]]): Mapping with
+                format {pk:{field_name:new_value}}
+            deltas (Mapping[Any, Mapping[str, TNumber]] | None, optional):
+                Mapping with format {pk:{field_name:delta}}, added atomically
+                like in `increment` (after `values`, if field is in both).
+                Defaults to None
+            expected_versions (Mapping[Any, int] | None, optional): Mapping with
+                format {pk:version}. Rows are updated only if all of them
+                still have expected versions in `version_column`.
+                Defaults to None (meaning no version check)
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            int: Number of updated rows
+
+        Raises:
+            BaseRepoException: If `expected_versions` are passed for not versioned
+                table or miss any of updated rows
+            VersionConflictError: If any row version differs from expected one
+        """
+
+    @overload
+    def increment(
+        self,
+        pk: TPrimaryKey,
+        field: str,
+        *,
+        by: TNumber = 1,
+        return_new: Literal[False] = False,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> None:
+        """Atomically add `by` to column value with SET field = field + :by
+
+        Args:
+            pk (TPrimaryKey): Primary key of row to update
+            field (str): Numeric column name
+            by (TNumber, optional): Delta, negative one decrements.
+                Defaults to 1
+            return_new (bool, optional): Fetch new column value.
+                Defaults to False
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+        """
+
+    @overload
+    def increment(
+        self,
+        pk: TPrimaryKey,
+        field: str,
+        *,
+        by: TNumber = 1,
+        return_new: Literal[True],
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> TNumber | None:
+        """Atomically add `by` to column value and fetch new value
+
+        Args:
+            pk (TPrimaryKey): Primary key of row to update
+            field (str): Numeric column name
+            by (TNumber, optional): Delta, negative one decrements.
+                Defaults to 1
+            return_new (bool): Fetch new column value
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            TNumber | None: New column value, None if row is not found
+        """
+
+    @overload
+    def multi_increment(
+        self,
+        pks: Sequence[TPrimaryKey],
+        deltas: Mapping[str, TNumber],
+        *,
+        return_new: Literal[False] = False,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> None:
+        """Atomically add deltas to column values of rows with one UPDATE
+
+        Args:
+            pks (Sequence[TPrimaryKey]): Primary keys of rows to update
+            deltas (Mapping[str, TNumber]): Mapping with
+                format {field_name:delta}
+            return_new (bool, optional): Fetch new column values.
+                Defaults to False
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+        """
+
+    @overload
+    def multi_increment(
+        self,
+        pks: Sequence[TPrimaryKey],
+        deltas: Mapping[str, TNumber],
+        *,
+        return_new: Literal[True],
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Dict[Any, Dict[str, TNumber]]:
+        """Atomically add deltas to column values of rows and fetch new values
+
+        Args:
+            pks (Sequence[TPrimaryKey]): Primary keys of rows to update
+            deltas (Mapping[str, TNumber]): Mapping with
+                format {field_name:delta}
+            return_new (bool): Fetch new column values
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Dict[Any, Dict[str, TNumber]]: Mapping with
+                format {pk:{field_name:new_value}} of updated rows
+        """
+
+    def increment_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        deltas: Mapping[str, TNumber],
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        """Atomically add deltas to column values of rows matching filters
+
+        Args:
+            filters (IFilterSeq): Filters of rows to update
+            deltas (Mapping[str, TNumber]): Mapping with
+                format {field_name:delta}
+            batch_size (int | None, optional): Update matching rows
+                in pk-ordered chunks of this size, one statement per chunk.
+                Without passed session every chunk is committed separately.
+                Defaults to None (meaning all rows at once)
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            int: Number of updated rows
+        """
+
+    @overload
+    def claim_batch(
+        self,
+        *,
+        filters: IFilterSeq,
+        limit: int,
+        values: Mapping[str, TFieldValue],
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Sequence[TResultORM]:
+        """Claim rows of a work queue
+
+        In one transaction up to `limit` matching rows are selected
+        in order with FOR UPDATE SKIP LOCKED (NOWAIT, if `extra.nowait`),
+        updated with `values` and returned, so concurrent workers
+        claim disjoint rows without waiting for each other.
+
+        Args:
+            filters (IFilterSeq): Filters of claimable rows
+            limit (int): Maximum number of rows to claim
+            values (Mapping[str, TFieldValue]): Mapping with
+                format {field_name:new_value}, e.g. {"status": "running"}
+            extra (Extra | None, optional): Extra params.
+                Lock options are overridden. Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Sequence[TResultORM]: Claimed rows after update
+        """
+
+    @overload
+    def claim_batch(
+        self,
+        *,
+        filters: IFilterSeq,
+        limit: int,
+        values: Mapping[str, TFieldValue],
+        convert_to: Type[TResultDataclass],
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Sequence[TResultDataclass]:
+        """Claim rows of a work queue
+
+        In one transaction up to `limit` matching rows are selected
+        in order with FOR UPDATE SKIP LOCKED (NOWAIT, if `extra.nowait`),
+        updated with `values` and returned, so concurrent workers
+        claim disjoint rows without waiting for each other.
+
+        Args:
+            filters (IFilterSeq): Filters of claimable rows
+            limit (int): Maximum number of rows to claim
+            values (Mapping[str, TFieldValue]): Mapping with
+                format {field_name:new_value}, e.g. {"status": "running"}
+            convert_to (Type[TResultDataclass]): Convert result to
+            extra (Extra | None, optional): Extra params.
+                Lock options are overridden. Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Sequence[TResultDataclass]: Claimed rows after update
+        """
+
+    def delete(
+        self,
+        pk: TPrimaryKey,
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> None:
+        """Delete row by pk
+
+        Args:
+            pk (TPrimaryKey): Primary key of row to delete
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+        """
+
+    def multi_delete(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        batch_size: int = 1000,
+        soft: bool = False,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        """Delete rows by pks with chunked DELETE ... WHERE pk IN (...)
+
+        Args:
+            pks (Sequence[TPrimaryKey]): Primary keys of rows to delete
+            batch_size (int, optional): Maximum number of pks in one statement.
+                Defaults to 1000
+            soft (bool, optional): Mark rows as soft deleted instead of deleting.
+                Defaults to False
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Raises:
+            BaseRepoException: If soft and table is not soft deletable
+
+        Returns:
+            int: Number of deleted rows
+        """
+
+    def soft_delete(
+        self,
+        pk: TPrimaryKey,
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> None:
+        """Mark row as soft deleted by pk
+
+        Args:
+            pk (TPrimaryKey): Primary key of row to soft delete
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Raises:
+            BaseRepoException: If table is not soft deletable
+        """
+
+    def bulk_soft_delete(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        """Mark rows as soft deleted by pks in one UPDATE
+
+        Args:
+            pks (Sequence[TPrimaryKey]): Primary keys of rows to soft delete
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            int: Number of soft deleted rows
+
+        Raises:
+            BaseRepoException: If table is not soft deletable
+        """
+
+    def delete_by_field(
+        self,
+        *,
+        name: str,
+        value: TFieldValue,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> None:
+        """Delete row by field:value
+
+        Args:
+            name (str): Name of the field
+            value (TFieldValue): Value of the field
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+        """
+
+    def delete_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        """Delete rows by filters with a single DELETE ... WHERE
+
+        Args:
+            filters (IFilterSeq): Filters of rows to delete
+            batch_size (int | None, optional): Delete matching rows
+                in pk-ordered chunks of this size, one statement per chunk.
+                Without passed session every chunk is committed separately.
+                Defaults to None (meaning all rows at once)
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            int: Number of deleted rows
+        """
+
+    def exists_by_field(
+        self,
+        *,
+        name: str,
+        value: TFieldValue,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> bool:
+        """Check if row exists by field:value
+
+        Args:
+            name (str): Name of the field
+            value (TFieldValue): Value of the field
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            bool: Row existence
+        """
+
+    def exists_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> bool:
+        """Check if row exists by filters
 
         Args:
             filters (IFilterSeq): Filter sequence
@@ -769,6 +1661,27 @@ class IRepo(Protocol[TTable, TResultORM]):
             bool: Row existence
         """
 
+    def exists_by_pks(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Set[TPrimaryKey]:
+        """Check which of the primary keys exist in one query
+
+        Args:
+            pks (Sequence[TPrimaryKey]): Primary key values
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            session (TSession | None): Session to use for DB queries.
+                Defaults to None.
+                Currently supported for SQLAlchemy
+
+        Returns:
+            Set[TPrimaryKey]: Existing primary keys
+        """
+
     def count_by_field(
         self,
         *,
@@ -813,6 +1726,115 @@ class IRepo(Protocol[TTable, TResultORM]):
             int: Number of found rows
         """
 
+    @overload
+    def scan_partitions(
+        self,
+        n: int,
+        *,
+        by: str | None = None,
+        filters: IFilterSeq | None = None,
+        extra: Extra | None = None,
+        max_workers: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        processes: int | None = None,
+    ) -> Iterator[TResultORM]:
+        """Scan rows in parallel, splitting `by` column range into partitions
+
+        Each partition is read on its own session/connection in a thread pool.
+        Rows are streamed back in partitions order.
+
+        Args:
+            n (int): Number of partitions
+            by (str | None, optional): Name of the integer column to split.
+                Defaults to None (meaning primary key)
+            filters (IFilterSeq | None, optional): Filter sequence.
+                Defaults to None
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            max_workers (int | None, optional): Size of the thread pool.
+                Defaults to None (meaning one thread per partition)
+            transform (Callable[[Any], Any] | None, optional): Function applied
+                to every row. Defaults to None
+            processes (int | None, optional): Apply `transform` in a process pool
+                of this size. Defaults to None
+
+        Returns:
+            Iterator[TResultORM]: Found rows
+        """
+
+    @overload
+    def scan_partitions(
+        self,
+        n: int,
+        *,
+        by: str | None = None,
+        filters: IFilterSeq | None = None,
+        convert_to: Type[TResultDataclass],
+        extra: Extra | None = None,
+        max_workers: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        processes: int | None = None,
+    ) -> Iterator[TResultDataclass]:
+        """Scan rows in parallel, splitting `by` column range into partitions
+
+        Each partition is read on its own session/connection in a thread pool.
+        Rows are streamed back in partitions order.
+
+        Args:
+            n (int): Number of partitions
+            by (str | None, optional): Name of the integer column to split.
+                Defaults to None (meaning primary key)
+            filters (IFilterSeq | None, optional): Filter sequence.
+                Defaults to None
+            convert_to (Type[TResultDataclass]): Convert result to
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+            max_workers (int | None, optional): Size of the thread pool.
+                Defaults to None (meaning one thread per partition)
+            transform (Callable[[Any], Any] | None, optional): Function applied
+                to every converted row. Defaults to None
+            processes (int | None, optional): Apply `transform` in a process pool
+                of this size. Defaults to None
+
+        Returns:
+            Iterator[TResultDataclass]: Found rows
+        """
+
+    def subquery(
+        self,
+        field: str,
+        *,
+        filters: IFilterSeq | None = None,
+        extra: Extra | None = None,
+    ) -> Any:
+        """Build lazy sub-select of `field` for filtering another repository
+
+        Nothing is executed. Result is meant to be used as a value of
+        `operator.in_subquery` or `operator.exists_subquery` filter,
+        so database does a semi-join in a single statement.
+
+        Args:
+            field (str): Name of the selected column
+            filters (IFilterSeq | None, optional): Filter sequence.
+                Defaults to None
+            extra (Extra | None, optional): Extra params.
+                Defaults to None
+
+        Returns:
+            Any: ORM-specific sub-select
+
+        Examples:
+            ```
+            active_users = users_repo.subquery("id", filters=active)
+            orders_repo.all_by_filters(
+                filters=FilterSeq(
+                    mode.and_,
+                    Filter(Order, "user_id", active_users, operator.in_subquery),
+                )
+            )
+            ```
+        """
+
 
 @runtime_checkable
 class IFilter(
@@ -843,7 +1865,10 @@ class IFilter(
             value (TFieldValue | None, optional): Value to filter against.
                 Defaults to None. Can be set later via __call__
             operator_ (operator | None, optional): Operator for filtering.
-                Defaults to operator.eq. Can be set later via __call__
+                Defaults to operator.eq. Can be set later via __call__.
+                `operator.between` expects (low, high) pair as value,
+                `operator.in_subquery` and `operator.exists_subquery`
+                expect result of `IRepo.subquery`
         """
 
     def __call__(
@@ -913,3 +1938,18 @@ class IFilterSeq(Protocol[TCompiledFilter]):
         Returns:
             TCompiledFilter: Compiled filter for usage in orm
         """
+
+
+@runtime_checkable
+class IShardRouter(Protocol):
+    shards: int
+
+    def shard_for(self, value: Any) -> int:
+        """Get shard of the shard key value
+
+        Args:
+            value (Any): Shard key value
+
+        Returns:
+            int: Shard index in [0, shards)
+        """
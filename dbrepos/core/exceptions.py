@@ -1,2 +1,10 @@
 class BaseRepoException(Exception):
     pass
+
+
+class VersionConflictError(BaseRepoException):
+    pass
+
+
+class NotFoundError(BaseRepoException):
+    pass
@@ -0,0 +1,80 @@
+import functools
+from dataclasses import fields, is_dataclass
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Tuple
+
+TExtractor = Callable[[Any], Dict[str, Any]]
+
+
+@functools.lru_cache(maxsize=None)
+def field_extractor(
+    entity_class: type,
+    columns: FrozenSet[str] | None = None,
+) -> TExtractor:
+    """Build cached extractor of entity fields for writes
+
+    Unlike `dataclasses.asdict`, values are read shallowly with precomputed
+    `attrgetter`: nested dataclasses, lists and dicts are passed as is.
+    Extractor is built once per entity class and columns.
+
+    Args:
+        entity_class (type): Dataclass or class with `__slots__`
+        columns (FrozenSet[str] | None, optional): Table columns.
+            Fields that are not columns are dropped.
+            Defaults to None (meaning all fields are kept)
+
+    Returns:
+        TExtractor: Function returning {field_name: value} of an entity
+    """
+    names = tuple(
+        name
+        for name in _field_names(entity_class)
+        if columns is None or name in columns
+    )
+    if not names:
+        return lambda entity: {}
+    if len(names) == 1:
+        name, getter = names[0], attrgetter(names[0])
+        return lambda entity: {name: getter(entity)}
+
+    getter = attrgetter(*names)
+    return lambda entity: dict(zip(names, getter(entity)))
+
+
+@functools.lru_cache(maxsize=None)
+def field_reader(
+    entity_class: type,
+) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+    """Build cached reader of entity field values as a compact tuple
+
+    Args:
+        entity_class (type): Dataclass or class with `__slots__`
+
+    Returns:
+        Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]: Field names
+            and function returning field values of an entity in the same order
+    """
+    names = _field_names(entity_class)
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return names, lambda entity: (getter(entity),)
+    return names, attrgetter(*names)
+
+
+def _field_names(entity_class: type) -> Tuple[str, ...]:
+    if is_dataclass(entity_class):
+        return tuple(field.name for field in fields(entity_class))
+    names = tuple(_slots(entity_class))
+    if not names:
+        raise TypeError(f"{entity_class.__name__} is neither dataclass nor slotted.")
+    return names
+
+
+def _slots(entity_class: type) -> Iterator[str]:
+    seen = set()
+    for klass in reversed(entity_class.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in seen and name not in ("__dict__", "__weakref__"):
+                seen.add(name)
+                yield name
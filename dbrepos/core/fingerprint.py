@@ -0,0 +1,46 @@
+from dataclasses import fields, is_dataclass
+from typing import Any, Hashable
+
+
+def fingerprint(value: Any) -> Hashable:
+    """Build stable hashable fingerprint of the repository call argument
+
+    Filters and filter sequences are fingerprinted by their structure
+    (column names, operators, values and modes), not by identity,
+    so equal filters built independently share the fingerprint.
+
+    Args:
+        value (Any): Value to fingerprint, e.g. IFilterSeq, Extra or kwargs
+
+    Returns:
+        Hashable: Fingerprint
+    """
+    if hasattr(value, "mode_") and hasattr(value, "filters"):
+        return (
+            "seq",
+            value.mode_,
+            tuple(fingerprint(filter) for filter in value.filters),
+        )
+    if hasattr(value, "operator_") and hasattr(value, "column_name"):
+        return (
+            "filter",
+            value.column_name,
+            value.operator_,
+            fingerprint(value.value),
+        )
+    if isinstance(value, dict):
+        return tuple(sorted((key, fingerprint(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(fingerprint(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(fingerprint(item) for item in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value),
+            tuple(fingerprint(getattr(value, field.name)) for field in fields(value)),
+        )
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+    return value
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Literal, Tuple
+from typing import Any, Literal, Tuple
 
 ORM = Literal["django", "alchemy"]
 
@@ -18,12 +18,94 @@ class Extra:
             Defaults to empty tuple (meaning default ordering is applied)
         select_related (Tuple[str]): Columns to join from related tables.
             Defaults to empty tuple (meaning columns are joined)
+        skip_locked (bool): Skip rows locked by other transactions
+            instead of waiting for them. Works only with `for_update`.
+            Defaults to False
+        nowait (bool): Fail instead of waiting for rows locked
+            by other transactions. Works only with `for_update`.
+            Defaults to False
     """
 
     for_update: bool = False
     include_soft_deleted: bool = False
     ordering: Tuple[str, ...] = field(default_factory=tuple)
     select_related: Tuple[str, ...] = field(default_factory=tuple)
+    skip_locked: bool = False
+    nowait: bool = False
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Args:
+        hits (int): Number of lookups served from cache
+        misses (int): Number of lookups that had to build/load the value
+        size (int): Number of currently cached entries
+    """
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """
+    Args:
+        executions (int): Number of calls that actually ran the query
+        coalesced (int): Number of calls that waited for an in-flight one
+            and shared its result
+        in_flight (int): Number of currently running calls
+    """
+
+    executions: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+@dataclass(frozen=True)
+class StreamStats:
+    """
+    Args:
+        rows (int): Number of inserted rows
+        batches (int): Number of flushed batches
+        commits (int): Number of committed transactions
+        elapsed (float): Seconds since the stream start
+    """
+
+    rows: int = 0
+    batches: int = 0
+    commits: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Insert throughput"""
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass(frozen=True)
+class WriteBehindStats:
+    """
+    Args:
+        depth (int): Number of rows with pending changes
+        writes (int): Number of buffered update/increment calls
+        coalesced (int): Number of calls merged into already pending row
+        flushes (int): Number of successful flushes
+        failed_flushes (int): Number of failed flushes
+        flushed_rows (int): Number of rows written by successful flushes
+        last_flush_latency (float): Seconds the last successful flush took
+        max_flush_latency (float): Seconds the slowest successful flush took
+    """
+
+    depth: int = 0
+    writes: int = 0
+    coalesced: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0
+    flushed_rows: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
 
 
 class operator(IntEnum):
@@ -34,8 +116,57 @@ class operator(IntEnum):
     ge = 4
     in_ = 5
     is_ = 6
+    ne = 7
+    not_in = 8
+    between = 9  # value is a (low, high) pair, both inclusive
+    is_not = 10
+    startswith = 11
+    contains = 12
+    icontains = 13
+    in_subquery = 14  # value is a lazy sub-select from IRepo.subquery
+    exists_subquery = 15  # value is a lazy sub-select from IRepo.subquery
 
 
 class mode(IntEnum):
     and_ = 0
     or_ = 1
+
+
+class returning(IntEnum):
+    row = 0
+    pk = 1
+    none = 2
+
+
+@dataclass(frozen=True)
+class SoftDeleteMarker:
+    """
+    Args:
+        column (str): Column that marks row as soft deleted.
+            Defaults to "is_deleted"
+        alive (Any): Value `column` is compared with to select not deleted rows.
+            Defaults to False
+        operator_ (operator): Operator for `column` and `alive` comparison.
+            Defaults to operator.eq
+        deleted (Any): Value written to `column` on soft delete.
+            Callables are called on every write, e.g. `datetime.now`.
+            Defaults to True
+
+    Examples:
+        ```
+        SoftDeleteMarker("deleted_at", None, operator.is_, datetime.now)
+        ```
+    """
+
+    column: str = "is_deleted"
+    alive: Any = False
+    operator_: operator = operator.eq
+    deleted: Any = True
+
+    def deleted_value(self) -> Any:
+        """Value to write to `column` on soft delete
+
+        Returns:
+            Any: Marker value
+        """
+        return self.deleted() if callable(self.deleted) else self.deleted
@@ -1,3 +1,4 @@
+import copy
 import functools
 import logging
 from dataclasses import fields
@@ -5,6 +6,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
     Iterable,
     Sequence,
     Tuple,
@@ -12,15 +14,22 @@ from typing import (
     TypeVar,
 )
 
+from django.db import connection, transaction  # type:ignore[import-untyped]
 from django.db.models import Model  # type:ignore[import-untyped]
-from sqlalchemy import Row
+from sqlalchemy import Row, event
+from sqlalchemy.orm import Session
 
-from dbrepos.core.exceptions import BaseRepoException
+from dbrepos.core.exceptions import BaseRepoException, NotFoundError
+from dbrepos.core.fingerprint import fingerprint
 from dbrepos.core.types import ORM
+from dbrepos.throttle import LogThrottle
 
 if TYPE_CHECKING:
     from _typeshed import DataclassInstance
 
+    from dbrepos.cache import ResultCache
+    from dbrepos.singleflight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,14 +69,51 @@ def strict(func: Callable | None = None) -> Callable:
     return decorator(func)
 
 
+def _error_logger(
+    *,
+    logger: logging.Logger,
+    exceptions: Tuple[Type[Exception], ...],
+    expected: Tuple[Type[Exception], ...],
+    throttle: LogThrottle | None,
+) -> Callable[..., None]:
+    def log(e: Exception, fallback: LogThrottle | None = None) -> None:
+        if isinstance(e, expected):
+            logger.debug("Expected error - %s", e)
+            return
+
+        method, prefix = (
+            (logger.error, "Expected error")
+            if isinstance(e, exceptions)
+            else (logger.critical, "Unexpected error")
+        )
+        suffix = ""
+        throttle_ = throttle or fallback
+        if throttle_ is not None:
+            # NOTE: errors of one type do not suppress errors of the others
+            suppressed = throttle_.acquire(type(e))  # type:ignore[arg-type]
+            if suppressed is None:
+                return
+            if suppressed:
+                suffix = f" ({suppressed} similar suppressed)"
+        logger.debug(str(e))
+        method(f"{prefix} - {str(e)}{suffix}", exc_info=e)
+
+    return log
+
+
 def handle_error(
     func: Callable | None = None,
     *,
     logger: logging.Logger = logger,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    expected: Tuple[Type[Exception], ...] = (NotFoundError,),
+    throttle: LogThrottle | None = None,
 ) -> Callable:
     """Decorator that handles any error and logs this error to specified logger
 
+    Expected errors (e.g. row is not found) are part of normal flow,
+    so they are logged with a single DEBUG record without traceback.
+
     Args:
         func (Callable | None, optional): Function to decorate.
             Defaults to None
@@ -75,29 +121,27 @@ def handle_error(
             Defaults to common_logger
         exceptions (Tuple[Type[Exception], ...], optional): Exceptions to catch.
             Defaults to (Exception,)
+        expected (Tuple[Type[Exception], ...], optional): Exceptions
+            to log without traceback.
+            Defaults to (NotFoundError,)
+        throttle (LogThrottle | None, optional): Sampling and rate limiting
+            of records of not expected errors.
+            Defaults to None
 
     Returns:
         Callable: Decorated function
     """
+    log = _error_logger(
+        logger=logger, exceptions=exceptions, expected=expected, throttle=throttle
+    )
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
-            except exceptions as e:
-                logger.debug(str(e))
-                logger.error(
-                    f"Expected error - {str(e)}",
-                    exc_info=e,
-                )
-                raise
             except Exception as e:
-                logger.debug(str(e))
-                logger.critical(
-                    f"Unexpected error - {str(e)}",
-                    exc_info=e,
-                )
+                log(e)
                 raise
 
         return wrapper
@@ -142,6 +186,62 @@ def session(func: Callable | None = None) -> Callable:
     return decorator(func)
 
 
+def _convert_result(
+    owner: Any,
+    result: Any,
+    convert_to: Type | None,
+    *,
+    many: bool,
+    orm: ORM | None,
+) -> Any:
+    if convert_to is None:
+        if (
+            not many
+            and orm is not None
+            and orm == "alchemy"
+            and isinstance(result, Sequence)
+            and result
+            and isinstance(result[0], Iterable)
+        ):
+            # unpack (imho, weird) alchemy single-row
+            # [(value, value, value)] to (value, value, value)
+            return result[0]
+        return result
+
+    def as_one(instance):
+        if isinstance(instance, Sequence):
+            if instance and isinstance(instance[0], Iterable):
+                return convert_to(*instance[0])
+            return convert_to(*instance)
+        if isinstance(instance, Row):
+            return convert_to(*instance[0])
+        if isinstance(instance, Model):
+            return convert_to(
+                **{
+                    field.name: getattr(instance, field.name)
+                    for field in fields(convert_to)
+                }
+            )
+        return instance
+
+    # NOTE: converted entities are snapshotted for dirty checking on save
+    tracker = getattr(owner, "change_tracker", None)
+    if not many:
+        converted = as_one(result)
+        if tracker is not None and converted is not None:
+            tracker.track(converted)
+        return converted
+
+    if not isinstance(result, Iterable):
+        return result
+
+    converted = [as_one(instance) for instance in result]
+    if tracker is not None:
+        for instance in converted:
+            tracker.track(instance)
+    return converted
+
+
 def convert(
     func: Callable | None = None,
     *,
@@ -151,6 +251,8 @@ def convert(
     """Decorator that converts function result
         item(s) to passed in `convert_to` dataclass
 
+    Converted items are tracked by repo `change_tracker`, if any.
+
     Args:
         func (Callable | None, optional): Function to decorate.
             Defaults to None
@@ -166,45 +268,215 @@ def convert(
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            result = func(*args, **kwargs)
-            convert_to: Type | None = kwargs.get("convert_to", None)
-            if convert_to is None:
-                if (
-                    not many
-                    and orm is not None
-                    and orm == "alchemy"
-                    and isinstance(result, Sequence)
-                    and result
-                    and isinstance(result[0], Iterable)
-                ):
-                    # unpack (imho, weird) alchemy single-row
-                    # [(value, value, value)] to (value, value, value)
-                    return result[0]
-                return result
+            return _convert_result(
+                args[0] if args else None,
+                func(*args, **kwargs),
+                kwargs.get("convert_to", None),
+                many=many,
+                orm=orm,
+            )
 
-            def as_one(instance):
-                if isinstance(instance, Sequence):
-                    if instance and isinstance(instance[0], Iterable):
-                        return convert_to(*instance[0])
-                    return convert_to(*instance)
-                if isinstance(instance, Row):
-                    return convert_to(*instance[0])
-                if isinstance(instance, Model):
-                    return convert_to(
-                        **{
-                            field.name: getattr(instance, field.name)
-                            for field in fields(convert_to)
-                        }
-                    )
-                return instance
+        return wrapper
+
+    if func is None:
+        return decorator
+
+    return decorator(func)
+
+
+def _in_django_atomic(table: Any) -> bool:
+    return (
+        isinstance(table, type)
+        and issubclass(table, Model)
+        and connection.in_atomic_block
+    )
+
+
+def _bypassed(self: Any, kwargs: Dict[str, Any]) -> bool:
+    # NOTE: caller-managed transactions and locked rows must see fresh rows
+    extra = kwargs.get("extra", None)
+    return (
+        kwargs.get("session", None) is not None
+        or (extra is not None and extra.for_update)
+        or _in_django_atomic(self.table_class)
+    )
+
+
+def _copy(value: Any) -> Any:
+    # NOTE: rows are immutable, copying them is a waste
+    return value if isinstance(value, Row) else copy.copy(value)
+
+
+def _copied(owner: Any, result: Any, *, many: bool, track: bool) -> Any:
+    # NOTE: cached results outlive the call, so every caller gets own copies
+    # and cannot change results served to the others
+    copies = [_copy(item) for item in result] if many else _copy(result)
+    tracker = getattr(owner, "change_tracker", None) if track else None
+    if tracker is not None:
+        # NOTE: copies are snapshotted for dirty checking on save,
+        # as freshly converted entities are
+        for copy_ in copies if many else (copies,):
+            if copy_ is not None:
+                tracker.track(copy_)
+    return copies
+
+
+def _invalidate(self: Any, session: Any) -> None:
+    cache = getattr(self, "result_cache", None)
+    if cache is None:
+        return
+
+    table = self.table_class
+    cache.invalidate(table)
+    # NOTE: caller-managed transaction is committed later, rows of the old
+    # snapshot could be cached by concurrent reads until then
+    if isinstance(session, Session):
+        event.listen(
+            session, "after_commit", lambda _: cache.invalidate(table), once=True
+        )
+    elif _in_django_atomic(table):
+        transaction.on_commit(lambda: cache.invalidate(table))
+
+
+def repo_method(
+    func: Callable | None = None,
+    *,
+    strict: bool = False,
+    invalidates: bool = False,
+    cached: bool = False,
+    singleflight: bool = False,
+    session: bool = False,
+    convert: bool = False,
+    many: bool = False,
+    orm: ORM | None = None,
+    logger: logging.Logger = logger,
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    expected: Tuple[Type[Exception], ...] = (NotFoundError,),
+    throttle: LogThrottle | None = None,
+) -> Callable:
+    """Decorator that builds repository method as a single fused wrapper
+
+    Behaves as the stack of `handle_error`, `strict`, `session`
+    and `convert` decorators (in this order) with only flagged steps enabled,
+    plus result caching, coalescing of concurrent calls and cache invalidation,
+    but every call passes one wrapper instead of one per decorator.
+
+    Args:
+        func (Callable | None, optional): Function to decorate.
+            Defaults to None
+        strict (bool, optional): Handle `strict` parameter.
+            Defaults to False
+        invalidates (bool, optional): Invalidate repo `result_cache` after call
+            (and after commit of caller-managed transaction).
+            Defaults to False
+        cached (bool, optional): Serve copies of results from repo `result_cache`.
+            Defaults to False
+        singleflight (bool, optional): Coalesce identical concurrent calls
+            with repo `single_flight`, every call gets copies of results.
+            Defaults to False
+        session (bool, optional): Inject session as `session` kwarg.
+            Defaults to False
+        convert (bool, optional): Convert result item(s)
+            to passed in `convert_to` dataclass.
+            Defaults to False
+        many (bool, optional): Flag that marks function return type as a collection.
+            Defaults to False
+        orm (ORM | None, optional): Used ORM inside a function.
+            Defaults to None
+        logger (logging.Logger, optional): Logger for errors.
+            Defaults to common_logger
+        exceptions (Tuple[Type[Exception], ...], optional): Exceptions to catch.
+            Defaults to (Exception,)
+        expected (Tuple[Type[Exception], ...], optional): Exceptions
+            to log without traceback.
+            Defaults to (NotFoundError,)
+        throttle (LogThrottle | None, optional): Sampling and rate limiting
+            of records of not expected errors. Repo `log_throttle` is used
+            if not passed.
+            Defaults to None
+
+    Returns:
+        Callable: Decorated function
+    """
+    log = _error_logger(
+        logger=logger, exceptions=exceptions, expected=expected, throttle=throttle
+    )
 
-            if not many:
-                return as_one(result)
+    def decorator(func: Callable) -> Callable:
+        name = func.__name__
 
-            if not isinstance(result, Iterable):
+        def run(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+            result = func(self, *args, **kwargs)
+            if not convert:
                 return result
+            return _convert_result(
+                self, result, kwargs.get("convert_to", None), many=many, orm=orm
+            )
+
+        def call(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+            if not session or kwargs.get("session", None) is not None:
+                return run(self, args, kwargs)
+            # NOTE: result is converted before session is closed
+            with self.session_factory() as session_:
+                kwargs["session"] = session_
+                return run(self, args, kwargs)
+
+        def coalesce(
+            self,
+            args: Tuple[Any, ...],
+            kwargs: Dict[str, Any],
+            cache: "ResultCache | None",
+            group: "SingleFlight | None",
+        ) -> Any:
+            def load() -> Any:
+                result = call(self, args, kwargs)
+                return list(result) if many else result
+
+            key = (name, fingerprint(args), fingerprint(kwargs))
+            fetch = load
+            if group is not None:
+                fetch = functools.partial(group.do, (self.table_class, *key), load)
+            result = (
+                fetch()
+                if cache is None
+                else cache.get_or_load(self.table_class, key, fetch)
+            )
+            return _copied(
+                self,
+                result,
+                many=many,
+                track=convert and kwargs.get("convert_to", None) is not None,
+            )
+
+        @functools.wraps(func)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            external = kwargs.get("session", None) if invalidates else None
+            try:
+                if session and getattr(self, "session_factory", None) is None:
+                    raise BaseRepoException("Cannot locate session_factory attribute.")
 
-            return [as_one(instance) for instance in result]
+                if cached or singleflight:
+                    cache = getattr(self, "result_cache", None) if cached else None
+                    group = (
+                        getattr(self, "single_flight", None) if singleflight else None
+                    )
+                    if (cache is not None or group is not None) and not _bypassed(
+                        self, kwargs
+                    ):
+                        return coalesce(self, args, kwargs, cache, group)
+                return call(self, args, kwargs)
+            except Exception as e:
+                if (
+                    strict
+                    and isinstance(e, BaseRepoException)
+                    and not kwargs.get("strict", True)
+                ):
+                    return None
+                log(e, getattr(self, "log_throttle", None))
+                raise
+            finally:
+                if invalidates:
+                    _invalidate(self, external)
 
         return wrapper
 
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Self, Type, TypeVar
-
-from django.db.models import Field, Model, Q  # type:ignore[import-untyped]
+from typing import Callable, Dict, Self, Type, TypeVar, cast
+
+from django.core.exceptions import FieldDoesNotExist  # type:ignore[import-untyped]
+from django.db.models import (  # type:ignore[import-untyped]
+    Exists,
+    Field,
+    Model,
+    OuterRef,
+    Q,
+    QuerySet,
+)
 
 from dbrepos.core.abstract import IFilter, IFilterSeq, mode, operator
 
@@ -18,15 +26,40 @@ _OPERATOR_TO_LOOKUP: Dict[operator, str] = {
     operator.ge: "__gte",
     operator.in_: "__in",
     operator.is_: "",
+    operator.ne: "",
+    operator.not_in: "__in",
+    operator.between: "__range",
+    operator.is_not: "",
+    operator.startswith: "__startswith",
+    operator.contains: "__contains",
+    operator.icontains: "__icontains",
+    operator.in_subquery: "__in",
 }
 
 
+# NOTE: django has no lookups for these, so they are compiled to negated Q
+_NEGATED_OPERATORS = frozenset((operator.ne, operator.not_in, operator.is_not))
+
+# NOTE: django expands negated Q to `NOT (col = x AND col IS NOT NULL)`,
+# so NULL rows match. SQL `!=` and `NOT IN` never match NULL,
+# so NULL rows are excluded explicitly (`IS NOT` is NULL-safe and stays as is)
+_NULL_EXCLUDING_OPERATORS = frozenset((operator.ne, operator.not_in))
+
+
 _MODE_TO_ORM: Dict[mode, Callable[[Q], Q]] = {
     mode.and_: Q.__and__,
     mode.or_: Q.__or__,
 }
 
 
+def _related_model(model: Type[Model], name: str) -> Type[Model] | None:
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    return field.related_model
+
+
 class DjangoFilter(IFilter[TModel, Field, TFieldValue, Q]):
     def __init__(
         self,
@@ -35,10 +68,20 @@ class DjangoFilter(IFilter[TModel, Field, TFieldValue, Q]):
         value: TFieldValue | None = None,
         operator_: operator = operator.eq,
     ) -> None:
-        self.column: Field = getattr(table_class, column_name, None)
+        *relations, name = column_name.split(".")
+        model: Type[Model] = table_class
+        for relation in relations:
+            related = _related_model(model, relation)
+            assert (
+                related is not None
+            ), f"Model {model.__name__} has no relation named {relation}."
+            model = related
+        self.column: Field = getattr(model, name, None)
         self.column_name = column_name
         self.value = value
         self.operator_ = operator_
+        # NOTE: django joins (and de-duplicates joins) by itself
+        self._lookup = column_name.replace(".", "__")
 
         assert (
             self.column is not None
@@ -54,9 +97,21 @@ class DjangoFilter(IFilter[TModel, Field, TFieldValue, Q]):
         return self
 
     def compile(self) -> Q:
-        return Q(
-            **{f"{self.column_name}{_OPERATOR_TO_LOOKUP[self.operator_]}": self.value}
+        if self.operator_ == operator.exists_subquery:
+            return self._compile_exists()
+        compiled = Q(
+            **{f"{self._lookup}{_OPERATOR_TO_LOOKUP[self.operator_]}": self.value}
         )
+        if self.operator_ in _NULL_EXCLUDING_OPERATORS:
+            return ~compiled & Q(**{f"{self._lookup}__isnull": False})
+        if self.operator_ in _NEGATED_OPERATORS:
+            return ~compiled
+        return compiled
+
+    def _compile_exists(self) -> Q:
+        qs = cast(QuerySet, self.value)
+        (field,) = qs.query.values_select
+        return Q(Exists(qs.filter(**{field: OuterRef(self._lookup)})))
 
 
 class DjangoFilterSeq(IFilterSeq[Q]):
@@ -1,18 +1,59 @@
-from dataclasses import asdict
-from typing import TYPE_CHECKING, Iterable, Mapping, Sequence, Tuple, Type, TypeVar
+import functools
+from dataclasses import replace
+from itertools import chain, islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
+)
 
 if TYPE_CHECKING:
     from _typeshed import DataclassInstance
 
-from django.db.models import Model, Q, QuerySet  # type:ignore[import-untyped]
+from django.db import connection, transaction  # type:ignore[import-untyped]
+from django.db.models import (  # type:ignore[import-untyped]
+    Case,
+    F,
+    Max,
+    Min,
+    Model,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
 
-from dbrepos.core.abstract import IFilterSeq, IRepo, mode, operator
-from dbrepos.core.types import Extra
+from dbrepos.cache import ResultCache
+from dbrepos.core.abstract import IFilterSeq, IRepo, TNumber, mode, operator
+from dbrepos.core.exceptions import (
+    BaseRepoException,
+    NotFoundError,
+    VersionConflictError,
+)
+from dbrepos.core.extractors import field_extractor
+from dbrepos.core.types import Extra, SoftDeleteMarker, StreamStats, returning
 from dbrepos.decorators import convert as _convert
 from dbrepos.decorators import handle_error as _handle_error
+from dbrepos.decorators import repo_method as _repo_method
 from dbrepos.decorators import strict as _strict
 from dbrepos.django.filters import DjangoFilter, DjangoFilterSeq
+from dbrepos.parallel import fan_out, split_range
 from dbrepos.shortcuts import get_object_or_404 as _get_object_or_404
+from dbrepos.singleflight import SingleFlight
+from dbrepos.streaming import StreamProgress, batched
+from dbrepos.throttle import LogThrottle
+from dbrepos.tracking import ChangeTracker
 
 TTable = TypeVar("TTable", bound=Model)
 if TYPE_CHECKING:
@@ -28,6 +69,7 @@ TSession = TypeVar("TSession", covariant=True)
 
 strict = _strict
 handle_error = _handle_error
+repo_method = _repo_method
 convert = _convert
 get_object_or_404 = _get_object_or_404
 
@@ -40,28 +82,106 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
         pk_field_name: str = "id",
         is_soft_deletable: bool = False,
         default_ordering: Tuple[str] = ("id",),
+        result_cache: ResultCache | None = None,
+        single_flight: SingleFlight | None = None,
+        change_tracker: ChangeTracker | None = None,
+        version_column: str | None = None,
+        soft_delete_marker: SoftDeleteMarker | None = None,
+        log_throttle: LogThrottle | None = None,
     ):
         self.table_class = table_class
         self.pk_field_name = pk_field_name
         self.is_soft_deletable = is_soft_deletable
         self.default_ordering = default_ordering
+        self.result_cache = result_cache
+        self.single_flight = single_flight
+        self.change_tracker = change_tracker
+        self.version_column = version_column
+        self.soft_delete_marker = soft_delete_marker or SoftDeleteMarker()
+        self.log_throttle = log_throttle
+        self._columns = frozenset(
+            chain.from_iterable(
+                (field.name, field.attname)
+                for field in self.table_class._meta.concrete_fields
+            )
+        )
 
         assert hasattr(self.table_class, self.pk_field_name), "Wrong pk_field_name"
+        assert not is_soft_deletable or hasattr(
+            self.table_class, self.soft_delete_marker.column
+        ), "Wrong soft_delete_marker column"
+        assert version_column is None or hasattr(
+            self.table_class, version_column
+        ), "Wrong version_column"
 
-    @handle_error
-    @convert(orm="django")
+    @repo_method(invalidates=True)
     def create(
         self,
         entity: TEntity,
         *,
         convert_to: Type[TResultDataclass] | None = None,
+        returning_: returning = returning.row,
         session: TSession | None = None,
-    ) -> TResultDataclass | TResultORM:
-        return self.table_class.objects.create(**asdict(entity))
+    ) -> TResultDataclass | TResultORM | TPrimaryKey | None:
+        # NOTE: Django fetches only the primary key of inserted row,
+        # the rest of the instance is built from the entity
+        instance = self.table_class.objects.create(**self._extract(entity))
+        if returning_ == returning.row:
+            return self._convert_one(instance, convert_to=convert_to)
+        if returning_ == returning.pk:
+            return instance.pk
+        return None
 
-    @handle_error
-    @strict
-    @convert(orm="django")
+    @repo_method(invalidates=True, convert=True, many=True, orm="django")
+    def bulk_create(
+        self,
+        entities: Sequence[TEntity],
+        *,
+        convert_to: Type[TResultDataclass] | None = None,
+        batch_size: int = 1000,
+        returning_: returning = returning.none,
+        session: TSession | None = None,
+    ) -> int | List[TResultDataclass | TResultORM | TPrimaryKey]:
+        inserted: List[TTable] = []
+        # NOTE: all batches are inserted in one transaction, as on SQLAlchemy
+        with transaction.atomic():
+            self._insert_batches(
+                batched(entities, batch_size=batch_size),
+                progress=StreamProgress(),
+                inserted=None if returning_ == returning.none else inserted,
+            )
+        if returning_ == returning.none:
+            return len(entities)
+        if returning_ == returning.pk:
+            return [instance.pk for instance in inserted]
+        return inserted  # type:ignore[return-value]
+
+    @repo_method(invalidates=True)
+    def create_stream(
+        self,
+        entities: Iterable[TEntity],
+        *,
+        batch_size: int = 1000,
+        commit_every: int = 1,
+        flush_interval: float | None = None,
+        on_progress: Callable[[StreamStats], None] | None = None,
+        session: TSession | None = None,
+    ) -> StreamStats:
+        assert commit_every > 0, "Number of batches per commit must be positive."
+        progress = StreamProgress(on_progress)
+        batches = batched(
+            entities, batch_size=batch_size, flush_interval=flush_interval
+        )
+        for first in batches:
+            with transaction.atomic():
+                self._insert_batches(
+                    chain((first,), islice(batches, commit_every - 1)),
+                    progress=progress,
+                )
+            progress.committed()
+        return progress.stats()
+
+    @repo_method(strict=True, singleflight=True, convert=True, orm="django")
     def get_by_field(
         self,
         *,
@@ -72,18 +192,13 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> TResultDataclass | TResultORM | None:
-        return get_object_or_404(
-            self._make_convertable(
-                qs=self._resolve_extra(qs=self.table_class.objects, extra=extra).filter(
-                    **{name: value}
-                ),
-                convert_to=convert_to,
-            ).first(),
+        return self._get_by_field(
+            name, value, convert_to=convert_to, strict=strict, extra=extra
         )
 
-    @handle_error
-    @strict
-    @convert(orm="django")
+    @repo_method(
+        strict=True, cached=True, singleflight=True, convert=True, orm="django"
+    )
     def get_by_filters(
         self,
         *,
@@ -93,16 +208,18 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> TResultDataclass | TResultORM | None:
-        return get_object_or_404(
-            self._make_convertable(
-                qs=self._resolve_extra(qs=self.table_class.objects, extra=extra).filter(
-                    filters.compile()
-                ),
-                convert_to=convert_to,
-            ).first()
-        )
+        first = self._make_convertable(
+            qs=self._resolve_extra(qs=self.table_class.objects, extra=extra).filter(
+                filters.compile()
+            ),
+            convert_to=convert_to,
+        ).first()
+        if not strict:
+            # NOTE: expected miss is returned as is, without raising
+            return first
+        return get_object_or_404(first)
 
-    @handle_error
+    @repo_method(strict=True, singleflight=True, convert=True, orm="django")
     def get_by_pk(
         self,
         pk: TPrimaryKey,
@@ -112,17 +229,48 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> TResultDataclass | TResultORM | None:
-        return self.get_by_field(
-            name=self.pk_field_name,
-            value=pk,
+        return self._get_by_field(
+            self.pk_field_name,
+            pk,
+            convert_to=convert_to,
             strict=strict,
             extra=extra,
-            session=session,
+        )
+
+    @repo_method
+    def get_many_by_field(
+        self,
+        name: str,
+        values: Iterable[TFieldValue],
+        *,
+        convert_to: Type[TResultDataclass] | None = None,
+        extra: Extra | None = None,
+        batch_size: int = 1000,
+        session: TSession | None = None,
+    ) -> Dict[Any, TResultDataclass | TResultORM]:
+        return self._get_many_by_field(
+            name, values, convert_to=convert_to, extra=extra, batch_size=batch_size
+        )
+
+    @repo_method
+    def get_many_by_pks(
+        self,
+        pks: Iterable[TPrimaryKey],
+        *,
+        convert_to: Type[TResultDataclass] | None = None,
+        extra: Extra | None = None,
+        batch_size: int = 1000,
+        session: TSession | None = None,
+    ) -> Dict[Any, TResultDataclass | TResultORM]:
+        return self._get_many_by_field(
+            self.pk_field_name,
+            pks,
             convert_to=convert_to,
+            extra=extra,
+            batch_size=batch_size,
         )
 
-    @handle_error
-    @convert(many=True, orm="django")
+    @repo_method(singleflight=True, convert=True, many=True, orm="django")
     def all(
         self,
         *,
@@ -135,8 +283,7 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
             convert_to=convert_to,
         )
 
-    @handle_error
-    @convert(many=True, orm="django")
+    @repo_method(singleflight=True, convert=True, many=True, orm="django")
     def all_by_field(
         self,
         *,
@@ -151,8 +298,7 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
             convert_to=convert_to,
         )
 
-    @handle_error
-    @convert(many=True, orm="django")
+    @repo_method(cached=True, singleflight=True, convert=True, many=True, orm="django")
     def all_by_filters(
         self,
         *,
@@ -166,8 +312,7 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
             convert_to=convert_to,
         )
 
-    @handle_error
-    @convert(many=True, orm="django")
+    @repo_method(singleflight=True, convert=True, many=True, orm="django")
     def all_by_pks(
         self,
         pks: Sequence[TPrimaryKey],
@@ -183,33 +328,255 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
             convert_to=convert_to,
         )
 
-    @handle_error
+    @repo_method
+    def pluck(
+        self,
+        field: str,
+        *,
+        filters: IFilterSeq[Q] | None = None,
+        extra: Extra | None = None,
+        distinct: bool = False,
+        flat: bool = True,
+        chunk_size: int | None = None,
+        session: TSession | None = None,
+    ) -> Sequence[Any] | Iterator[Any]:
+        return self._values(
+            (field,),
+            filters=filters,
+            extra=extra,
+            distinct=distinct,
+            flat=flat,
+            chunk_size=chunk_size,
+        )
+
+    @repo_method
+    def values(
+        self,
+        fields: Sequence[str],
+        *,
+        filters: IFilterSeq[Q] | None = None,
+        extra: Extra | None = None,
+        distinct: bool = False,
+        chunk_size: int | None = None,
+        session: TSession | None = None,
+    ) -> Sequence[Tuple[Any, ...]] | Iterator[Tuple[Any, ...]]:
+        return self._values(
+            fields,
+            filters=filters,
+            extra=extra,
+            distinct=distinct,
+            flat=False,
+            chunk_size=chunk_size,
+        )
+
+    @repo_method(invalidates=True, expected=(NotFoundError, VersionConflictError))
     def update(
         self,
         pk: TPrimaryKey,
         *,
         values: Mapping[str, TFieldValue],
+        expected_version: int | None = None,
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> None:
+        self._update_by_pk(
+            pk, values=values, expected_version=expected_version, extra=extra
+        )
+
+    @repo_method(invalidates=True, expected=(NotFoundError, VersionConflictError))
+    def save(
+        self,
+        entity: TEntity,
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> bool:
+        values = self._changed_values(entity)
+        version = self.version_column
+        expected_version: Any = None
+        if version is not None:
+            # NOTE: version is managed by the repo, it is not user-updatable
+            values.pop(version, None)
+            expected_version = getattr(entity, version)
         if not values:
-            return
-        self._all_by_pks(pks=[pk], extra=extra).update(**values)
+            return False
+        self._update_by_pk(
+            getattr(entity, self.pk_field_name),
+            values=values,
+            expected_version=expected_version,
+            extra=extra,
+        )
+        if version is not None:
+            setattr(entity, version, expected_version + 1)
+        if self.change_tracker is not None:
+            self.change_tracker.track(entity)
+        return True
 
-    @handle_error
+    @repo_method(invalidates=True, expected=(NotFoundError, VersionConflictError))
     def multi_update(
         self,
         pks: Sequence[TPrimaryKey],
         *,
         values: Mapping[str, TFieldValue],
+        expected_versions: Mapping[Any, int] | None = None,
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> None:
         if not pks or not values:
             return
-        self._all_by_pks(pks=pks, extra=extra).update(**values)
+        qs = self._all_by_pks(pks=pks, extra=extra)
+        if expected_versions is None:
+            self._versioned_update(qs, values=values)
+            return
+        self._update_versions(
+            qs, pks=pks, expected_versions=expected_versions, values=values
+        )
+
+    @repo_method(invalidates=True)
+    def update_by_filters(
+        self,
+        *,
+        filters: IFilterSeq[Q],
+        values: Mapping[str, TFieldValue],
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        if not values:
+            return 0
+        return self._update_by_filters(
+            filters=filters, values=values, batch_size=batch_size, extra=extra
+        )
+
+    @repo_method(invalidates=True, expected=(NotFoundError, VersionConflictError))
+    def bulk_update(
+        self,
+        values: Mapping[Any, Mapping[str, TFieldValue]],
+        *,
+        deltas: Mapping[Any, Mapping[str, TNumber]] | None = None,
+        expected_versions: Mapping[Any, int] | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        whens: Dict[str, Dict[Any, Any]] = {}
+        for pk, row in values.items():
+            for name, value in row.items():
+                whens.setdefault(name, {})[pk] = Value(
+                    value, output_field=self.table_class._meta.get_field(name)
+                )
+        for pk, delta_row in (deltas or {}).items():
+            for name, delta in delta_row.items():
+                column = whens.setdefault(name, {})
+                column[pk] = column.get(pk, F(name)) + delta
+        if not whens:
+            return 0
+        pks = list({pk for column in whens.values() for pk in column})
+        qs = self._all_by_pks(pks=pks, extra=extra)
+        cases = {
+            name: Case(
+                *(
+                    When(**{self.pk_field_name: pk}, then=then)
+                    for pk, then in column.items()
+                ),
+                default=F(name),
+                output_field=self.table_class._meta.get_field(name),
+            )
+            for name, column in whens.items()
+        }
+        if expected_versions is not None:
+            return self._update_versions(
+                qs, pks=pks, expected_versions=expected_versions, values=cases
+            )
+        return self._versioned_update(qs, values=cases)
+
+    @repo_method(invalidates=True)
+    def increment(
+        self,
+        pk: TPrimaryKey,
+        field: str,
+        *,
+        by: TNumber = 1,
+        return_new: bool = False,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> TNumber | None:
+        new = self._increment(
+            self._all_by_pks(pks=[pk], extra=extra),
+            deltas={field: by},
+            return_new=return_new,
+        )
+        return next(iter(new.values()), {}).get(field, None)
+
+    @repo_method(invalidates=True)
+    def multi_increment(
+        self,
+        pks: Sequence[TPrimaryKey],
+        deltas: Mapping[str, TNumber],
+        *,
+        return_new: bool = False,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Dict[Any, Dict[str, TNumber]] | None:
+        if not pks or not deltas:
+            return {} if return_new else None
+        new = self._increment(
+            self._all_by_pks(pks=pks, extra=extra),
+            deltas=deltas,
+            return_new=return_new,
+        )
+        return new if return_new else None
+
+    @repo_method(invalidates=True)
+    def increment_by_filters(
+        self,
+        *,
+        filters: IFilterSeq[Q],
+        deltas: Mapping[str, TNumber],
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        if not deltas:
+            return 0
+        return self._update_by_filters(
+            filters=filters,
+            values=self._increments(deltas),
+            batch_size=batch_size,
+            extra=extra,
+        )
+
+    @repo_method(invalidates=True, convert=True, many=True, orm="django")
+    def claim_batch(
+        self,
+        *,
+        filters: IFilterSeq[Q],
+        limit: int,
+        values: Mapping[str, TFieldValue],
+        convert_to: Type[TResultDataclass] | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Sequence[TResultDataclass] | Sequence[TResultORM]:
+        assert limit > 0, "Claim limit must be positive."
+        assert values, "No values to set on claimed rows."
+        extra = replace(
+            extra or Extra(),
+            for_update=True,
+            skip_locked=not (extra and extra.nowait),
+        )
+        with transaction.atomic():
+            pks = list(
+                self._all_by_filters(filters=filters, extra=extra).values_list(
+                    self.pk_field_name, flat=True
+                )[:limit]
+            )
+            if not pks:
+                return []
+            qs = self.table_class.objects.filter(**{f"{self.pk_field_name}__in": pks})
+            self._versioned_update(qs, values=values)
+            rows = {getattr(row, self.pk_field_name): row for row in qs}
+        return [rows[pk] for pk in pks]
 
-    @handle_error
+    @repo_method(invalidates=True)
     def delete(
         self,
         pk: TPrimaryKey,
@@ -219,7 +586,52 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
     ) -> None:
         self._all_by_pks(pks=[pk], extra=extra).delete()
 
-    @handle_error
+    @repo_method(invalidates=True)
+    def multi_delete(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        batch_size: int = 1000,
+        soft: bool = False,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        assert batch_size > 0, "Batch size must be positive."
+        deleted = 0
+        # NOTE: chunks are deleted in one transaction, as on SQLAlchemy
+        with transaction.atomic():
+            for start in range(0, len(pks), batch_size):
+                end = start + batch_size
+                chunk = pks[start:end]
+                if soft:
+                    deleted += self._soft_delete(pks=chunk, extra=extra)
+                else:
+                    deleted += self._delete(self._all_by_pks(pks=chunk, extra=extra))
+        return deleted
+
+    @repo_method(invalidates=True)
+    def soft_delete(
+        self,
+        pk: TPrimaryKey,
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> None:
+        self._soft_delete(pks=[pk], extra=extra)
+
+    @repo_method(invalidates=True)
+    def bulk_soft_delete(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        if not pks:
+            return 0
+        return self._soft_delete(pks=pks, extra=extra)
+
+    @repo_method(invalidates=True)
     def delete_by_field(
         self,
         *,
@@ -230,7 +642,29 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
     ) -> None:
         self._all_by_field(name=name, value=value, extra=extra).delete()
 
-    @handle_error
+    @repo_method(invalidates=True)
+    def delete_by_filters(
+        self,
+        *,
+        filters: IFilterSeq[Q],
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        if batch_size is None:
+            return self._delete(self._all_by_filters(filters=filters, extra=extra))
+        return sum(
+            self._delete(
+                self._all_by_filters(filters=filters, extra=extra).filter(
+                    **{f"{self.pk_field_name}__in": pks}
+                )
+            )
+            for pks in self._pk_batches(
+                filters=filters, batch_size=batch_size, extra=extra
+            )
+        )
+
+    @repo_method(singleflight=True)
     def exists_by_field(
         self,
         *,
@@ -241,7 +675,7 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
     ) -> bool:
         return self._all_by_field(name=name, value=value, extra=extra).exists()
 
-    @handle_error
+    @repo_method(cached=True, singleflight=True)
     def exists_by_filters(
         self,
         *,
@@ -251,7 +685,23 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
     ) -> bool:
         return self._all_by_filters(filters=filters, extra=extra).exists()
 
-    @handle_error
+    @repo_method(singleflight=True)
+    def exists_by_pks(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Set[TPrimaryKey]:
+        if not pks:
+            return set()
+        return set(
+            self._all_by_pks(pks=pks, extra=extra)
+            .order_by()
+            .values_list(self.pk_field_name, flat=True)
+        )
+
+    @repo_method(singleflight=True)
     def count_by_field(
         self,
         *,
@@ -262,7 +712,7 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
     ) -> int:
         return self._all_by_field(name=name, value=value, extra=extra).count()
 
-    @handle_error
+    @repo_method(cached=True, singleflight=True)
     def count_by_filters(
         self,
         *,
@@ -272,8 +722,155 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
     ) -> int:
         return self._all_by_filters(filters=filters, extra=extra).count()
 
+    @overload
+    def scan_partitions(
+        self,
+        n: int,
+        *,
+        by: str | None = None,
+        filters: IFilterSeq[Q] | None = None,
+        convert_to: None = None,
+        extra: Extra | None = None,
+        max_workers: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        processes: int | None = None,
+    ) -> Iterator[TResultORM]: ...
+
+    @overload
+    def scan_partitions(
+        self,
+        n: int,
+        *,
+        by: str | None = None,
+        filters: IFilterSeq[Q] | None = None,
+        convert_to: Type[TResultDataclass],
+        extra: Extra | None = None,
+        max_workers: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        processes: int | None = None,
+    ) -> Iterator[TResultDataclass]: ...
+
+    def scan_partitions(
+        self,
+        n: int,
+        *,
+        by: str | None = None,
+        filters: IFilterSeq[Q] | None = None,
+        convert_to: Type[TResultDataclass] | None = None,
+        extra: Extra | None = None,
+        max_workers: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        processes: int | None = None,
+    ) -> Iterator[TResultDataclass | TResultORM]:
+        by = by or self.pk_field_name
+        low, high = self._bounds(by=by, filters=filters, extra=extra)
+        if low is None or high is None:
+            return iter(())
+
+        loaders: List[Callable[[], Iterable[Any]]] = []
+        for start, end in split_range(low, high, n):
+            partition: List = [
+                DjangoFilter(self.table_class, by, start, operator.ge),
+                DjangoFilter(self.table_class, by, end, operator.le),
+            ]
+            if filters is not None:
+                partition.append(filters)
+            loaders.append(
+                functools.partial(
+                    self._load_partition,
+                    filters=DjangoFilterSeq(mode.and_, *partition),
+                    convert_to=convert_to,
+                    extra=extra,
+                )
+            )
+        return fan_out(
+            loaders,
+            max_workers=max_workers,
+            transform=transform,
+            processes=processes,
+        )
+
+    def subquery(
+        self,
+        field: str,
+        *,
+        filters: IFilterSeq[Q] | None = None,
+        extra: Extra | None = None,
+    ) -> QuerySet[TTable]:
+        qs = self._resolve_extra(qs=self.table_class.objects.all(), extra=extra)
+        if filters is not None:
+            qs = qs.filter(filters.compile())
+        return qs.order_by().values(field)
+
     """ Low-level API """
 
+    # NOTE: fast paths below are not decorated, so public methods
+    # share them without re-entering decorators of each other
+
+    def _get_by_field(
+        self,
+        name: str,
+        value: TFieldValue,
+        *,
+        convert_to: Type[TResultDataclass] | None,
+        strict: bool,
+        extra: Extra | None,
+    ) -> TTable | None:
+        first = self._make_convertable(
+            qs=self._resolve_extra(qs=self.table_class.objects, extra=extra).filter(
+                **{name: value}
+            ),
+            convert_to=convert_to,
+        ).first()
+        if not strict:
+            # NOTE: expected miss is returned as is, without raising
+            return first
+        return get_object_or_404(first)
+
+    def _get_many_by_field(
+        self,
+        name: str,
+        values: Iterable[TFieldValue],
+        *,
+        convert_to: Type[TResultDataclass] | None,
+        extra: Extra | None,
+        batch_size: int,
+    ) -> Dict[Any, TResultDataclass | TResultORM]:
+        # NOTE: foreign key attribute holds related instance, column is keyed
+        attname = self.table_class._meta.get_field(name).attname
+        unique = list(dict.fromkeys(values))
+        found: Dict[Any, TTable] = {}
+        for batch in batched(unique, batch_size=batch_size):
+            for instance in self._all_by_field(
+                name=f"{name}__in", value=batch, extra=extra
+            ):
+                found.setdefault(getattr(instance, attname), instance)
+        return {
+            value: self._convert_one(found[value], convert_to=convert_to)
+            for value in unique
+            if value in found
+        }
+
+    def _update_by_pk(
+        self,
+        pk: TPrimaryKey,
+        *,
+        values: Mapping[str, TFieldValue],
+        expected_version: int | None,
+        extra: Extra | None,
+    ) -> None:
+        if not values:
+            return
+        updated = self._versioned_update(
+            self._all_by_pks(pks=[pk], extra=extra),
+            values=values,
+            expected_version=expected_version,
+        )
+        if expected_version is not None and not updated:
+            raise VersionConflictError(
+                f"Row {pk} is not found with version {expected_version}."
+            )
+
     def _all(
         self,
         *,
@@ -307,6 +904,33 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
             extra=extra,
         )
 
+    def _values(
+        self,
+        fields: Sequence[str],
+        *,
+        filters: IFilterSeq[Q] | None,
+        extra: Extra | None,
+        distinct: bool,
+        flat: bool,
+        chunk_size: int | None,
+    ) -> List[Any] | Iterator[Any]:
+        if distinct:
+            # NOTE: distinct rows can be ordered by selected columns only
+            extra = replace(
+                extra or Extra(), ordering=(extra and extra.ordering) or tuple(fields)
+            )
+        qs = (
+            self._all(extra=extra)
+            if filters is None
+            else self._all_by_filters(filters=filters, extra=extra)
+        ).values_list(*fields, flat=flat)
+        if distinct:
+            qs = qs.distinct()
+        if chunk_size is None:
+            return list(qs)
+        assert chunk_size > 0, "Chunk size must be positive."
+        return qs.iterator(chunk_size=chunk_size)
+
     def _all_by_pks(
         self,
         pks: Sequence[TPrimaryKey],
@@ -314,7 +938,7 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> QuerySet[TTable]:
-        return self.all_by_filters(
+        return self._all_by_filters(
             filters=DjangoFilterSeq(
                 mode.and_,
                 DjangoFilter(
@@ -327,6 +951,128 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
             extra=extra,
         )
 
+    def _bounds(
+        self,
+        *,
+        by: str,
+        filters: IFilterSeq[Q] | None = None,
+        extra: Extra | None = None,
+    ) -> Tuple[Any, Any]:
+        qs = self._resolve_extra(
+            qs=self.table_class.objects.all(),
+            # NOTE: aggregates can not be locked
+            extra=Extra(
+                include_soft_deleted=bool(extra and extra.include_soft_deleted)
+            ),
+        )
+        if filters is not None:
+            qs = qs.filter(filters.compile())
+        bounds = qs.aggregate(low=Min(by), high=Max(by))
+        return bounds["low"], bounds["high"]
+
+    def _load_partition(
+        self,
+        *,
+        filters: IFilterSeq[Q],
+        convert_to: Type[TResultDataclass] | None = None,
+        extra: Extra | None = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Any]:
+        qs = self._make_convertable(
+            qs=self._all_by_filters(filters=filters, extra=extra),
+            convert_to=convert_to,
+        )
+        try:
+            # NOTE: partition is streamed by chunks instead of being materialized
+            for chunk in batched(
+                qs.iterator(chunk_size=chunk_size), batch_size=chunk_size
+            ):
+                yield from self._convert_many(chunk, convert_to=convert_to)
+        finally:
+            # NOTE: partitions are loaded in worker threads,
+            # each of them has its own connection to release
+            connection.close()
+
+    @convert(many=True, orm="django")
+    def _convert_many(
+        self,
+        instances: Sequence[TTable],
+        *,
+        convert_to: Type[TResultDataclass] | None = None,
+    ) -> Iterable[TResultDataclass | TResultORM]:
+        return instances  # type:ignore[return-value]
+
+    def _insert_batches(
+        self,
+        batches: Iterable[List[TEntity]],
+        *,
+        progress: StreamProgress,
+        inserted: List[TTable] | None = None,
+    ) -> None:
+        for batch in batches:
+            instances = self.table_class.objects.bulk_create(
+                [self.table_class(**self._extract(entity)) for entity in batch]
+            )
+            if inserted is not None:
+                inserted.extend(instances)
+            progress.flushed(len(batch))
+
+    @convert(orm="django")
+    def _convert_one(
+        self,
+        instance: TTable,
+        *,
+        convert_to: Type[TResultDataclass] | None = None,
+    ) -> TResultDataclass | TResultORM:
+        return instance  # type:ignore[return-value]
+
+    def _pk_batches(
+        self,
+        *,
+        filters: IFilterSeq[Q],
+        batch_size: int,
+        extra: Extra | None,
+    ) -> Iterator[List[TPrimaryKey]]:
+        assert batch_size > 0, "Batch size must be positive."
+        qs = self._resolve_extra(
+            qs=self.table_class.objects.filter(filters.compile()),
+            # NOTE: batch rows are locked by the write itself
+            extra=Extra(
+                include_soft_deleted=bool(extra and extra.include_soft_deleted)
+            ),
+        ).order_by(self.pk_field_name)
+        last = None
+        while True:
+            if last is not None:
+                batch = qs.filter(**{f"{self.pk_field_name}__gt": last})
+            else:
+                batch = qs
+            pks = list(batch.values_list(self.pk_field_name, flat=True)[:batch_size])
+            if pks:
+                # NOTE: generator is resumed after the batch is written,
+                # so keyset pagination is not affected by the write
+                yield pks
+            if len(pks) < batch_size:
+                return
+            last = pks[-1]
+
+    def _delete(self, qs: QuerySet[TTable]) -> int:
+        # NOTE: rows deleted by cascade are not counted
+        _, deleted = qs.delete()
+        return deleted.get(self.table_class._meta.label, 0)
+
+    def _soft_delete(
+        self,
+        *,
+        pks: Sequence[TPrimaryKey],
+        extra: Extra | None,
+    ) -> int:
+        if not self.is_soft_deletable:
+            raise BaseRepoException("Table is not soft deletable.")
+        return self._all_by_pks(pks=pks, extra=extra).update(
+            **{self.soft_delete_marker.column: self.soft_delete_marker.deleted_value()}
+        )
+
     """ Utils """
 
     def _resolve_extra(
@@ -339,13 +1085,140 @@ class DjangoRepo(IRepo[TTable, TResultORM]):
             extra = Extra()
         qs = qs.order_by(*(extra.ordering or self.default_ordering))
         if extra.for_update:
-            qs = qs.select_for_update()
+            qs = qs.select_for_update(
+                nowait=extra.nowait, skip_locked=extra.skip_locked
+            )
         if self.is_soft_deletable and not extra.include_soft_deleted:
-            qs = qs.filter(is_deleted=False)
+            qs = qs.filter(
+                DjangoFilter(
+                    self.table_class,
+                    self.soft_delete_marker.column,
+                    self.soft_delete_marker.alive,
+                    self.soft_delete_marker.operator_,
+                ).compile()
+            )
         if extra.select_related:
             qs = qs.select_related(*extra.select_related)
         return qs
 
+    def _update_by_filters(
+        self,
+        *,
+        filters: IFilterSeq[Q],
+        values: Mapping[str, Any],
+        batch_size: int | None,
+        extra: Extra | None,
+    ) -> int:
+        if batch_size is None:
+            return self._versioned_update(
+                self._all_by_filters(filters=filters, extra=extra), values=values
+            )
+        return sum(
+            self._versioned_update(
+                self._all_by_filters(filters=filters, extra=extra).filter(
+                    **{f"{self.pk_field_name}__in": pks}
+                ),
+                values=values,
+            )
+            for pks in self._pk_batches(
+                filters=filters, batch_size=batch_size, extra=extra
+            )
+        )
+
+    def _increment(
+        self,
+        qs: QuerySet[TTable],
+        *,
+        deltas: Mapping[str, TNumber],
+        return_new: bool,
+    ) -> Dict[Any, Dict[str, TNumber]]:
+        if not return_new:
+            self._versioned_update(qs, values=self._increments(deltas))
+            return {}
+        with transaction.atomic():
+            self._versioned_update(qs, values=self._increments(deltas))
+            # NOTE: QuerySet.update has no RETURNING, so new values are read
+            # in the same transaction, while rows are still locked by UPDATE
+            return {
+                row[0]: dict(zip(deltas, row[1:]))
+                for row in qs.values_list(self.pk_field_name, *deltas)
+            }
+
+    def _increments(self, deltas: Mapping[str, TNumber]) -> Dict[str, Any]:
+        return {name: F(name) + delta for name, delta in deltas.items()}
+
+    def _versioned_update(
+        self,
+        qs: QuerySet[TTable],
+        *,
+        values: Mapping[str, TFieldValue],
+        expected_version: int | None = None,
+    ) -> int:
+        if self.version_column is None:
+            if expected_version is not None:
+                raise BaseRepoException("Table is not versioned.")
+            return qs.update(**values)
+        if expected_version is not None:
+            qs = qs.filter(**{self.version_column: expected_version})
+        return qs.update(**values, **{self.version_column: F(self.version_column) + 1})
+
+    def _update_versions(
+        self,
+        qs: QuerySet[TTable],
+        *,
+        pks: Iterable[Any],
+        expected_versions: Mapping[Any, int],
+        values: Mapping[str, Any],
+    ) -> int:
+        if self.version_column is None:
+            raise BaseRepoException("Table is not versioned.")
+        unique_pks = set(pks)
+        missing = unique_pks.difference(expected_versions)
+        if missing:
+            raise BaseRepoException(
+                f"Expected versions are missing for rows {list(missing)}."
+            )
+        # NOTE: conflict rolls back the savepoint only, so no row is updated
+        # and the rest of the outer atomic block is kept
+        with transaction.atomic():
+            updated = self._versioned_update(
+                qs.filter(
+                    functools.reduce(
+                        Q.__or__,
+                        (
+                            Q(
+                                **{
+                                    self.pk_field_name: pk,
+                                    self.version_column: expected_versions[pk],
+                                }
+                            )
+                            for pk in unique_pks
+                        ),
+                    )
+                ),
+                values=values,
+            )
+            if updated != len(unique_pks):
+                raise VersionConflictError(
+                    f"{len(unique_pks) - updated} of {len(unique_pks)} rows "
+                    "are not found with expected versions."
+                )
+        return updated
+
+    def _extract(self, entity: TEntity) -> Dict[str, Any]:
+        return field_extractor(type(entity), self._columns)(entity)
+
+    def _changed_values(self, entity: TEntity) -> Dict[str, Any]:
+        values = self._extract(entity)
+        changes = (
+            None if self.change_tracker is None else self.change_tracker.changes(entity)
+        )
+        if changes is not None:
+            # NOTE: untracked entities are saved with all fields
+            values = {name: value for name, value in values.items() if name in changes}
+        values.pop(self.pk_field_name, None)
+        return values
+
     def _make_convertable(
         self,
         *,
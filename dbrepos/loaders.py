@@ -0,0 +1,185 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Dict, Hashable, List, Sequence, Set, Tuple, Type
+
+from dbrepos.core.abstract import IRepo
+from dbrepos.core.fingerprint import fingerprint
+from dbrepos.core.types import Extra
+from dbrepos.shortcuts import get_object_or_404
+
+TPrimaryKey = int | str
+TBatchKey = Tuple[Type | None, Hashable]
+
+
+class PkLoader:
+    """Coalescing get_by_pk loader for async code
+
+    Primary keys requested by coroutines within one event loop tick
+    (or within `window` seconds) are collected, deduplicated and loaded
+    with a single `all_by_pks` call, which runs in the executor since
+    repositories are synchronous. Calls with different `convert_to` or `extra`
+    are batched separately.
+
+    Loader does not memoize results between batches,
+    so it is safe to share it across requests.
+    """
+
+    def __init__(
+        self,
+        repo: IRepo,
+        *,
+        window: float = 0.0,
+        max_batch_size: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Args:
+            repo (IRepo): Repository to load rows from
+            window (float, optional): Time in seconds to collect primary keys for.
+                Defaults to 0.0 (meaning current event loop tick)
+            max_batch_size (int | None, optional): Maximum number of primary keys
+                loaded with one query. Defaults to None (meaning no limit)
+            executor (Executor | None, optional): Executor to run queries in.
+                Defaults to None (meaning event loop default executor)
+        """
+        assert window >= 0, "Batch window must not be negative."
+        assert (
+            max_batch_size is None or max_batch_size > 0
+        ), "Batch size must be positive."
+        self.repo = repo
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        self._batches: Dict[TBatchKey, Dict[TPrimaryKey, asyncio.Future]] = {}
+        self._extras: Dict[TBatchKey, Extra | None] = {}
+        # NOTE: event loop keeps weak references to tasks only
+        self._tasks: Set[asyncio.Future] = set()
+
+    async def load(
+        self,
+        pk: TPrimaryKey,
+        *,
+        convert_to: Type | None = None,
+        strict: bool = True,
+        extra: Extra | None = None,
+    ) -> Any:
+        """Get row by pk, batched with concurrent loads
+
+        Args:
+            pk (TPrimaryKey): Primary key value
+            convert_to (Type | None, optional): Dataclass to convert row to.
+                Defaults to None
+            strict (bool, optional): Raise exception if row is not found.
+                Defaults to True
+            extra (Extra | None, optional): Extra parameters. Defaults to None
+
+        Raises:
+            NotFoundError: If strict and row is not found
+
+        Returns:
+            Any: Found row or None
+        """
+        key = (convert_to, fingerprint(extra))
+        batch = self._batches.get(key, None)
+        if batch is None:
+            batch = self._batches[key] = {}
+            self._extras[key] = extra
+            loop = asyncio.get_running_loop()
+            if self.window:
+                loop.call_later(self.window, self._dispatch, key)
+            else:
+                loop.call_soon(self._dispatch, key)
+
+        future = batch.get(pk, None)
+        if future is None:
+            future = batch[pk] = asyncio.get_running_loop().create_future()
+            if self.max_batch_size and len(batch) >= self.max_batch_size:
+                self._dispatch(key)
+
+        row = await asyncio.shield(future)
+        if strict:
+            return get_object_or_404(row)
+        return row
+
+    async def load_many(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        convert_to: Type | None = None,
+        strict: bool = True,
+        extra: Extra | None = None,
+    ) -> List[Any]:
+        """Get rows by pks in pks order, batched with concurrent loads
+
+        Args:
+            pks (Sequence[TPrimaryKey]): Primary key values
+            convert_to (Type | None, optional): Dataclass to convert rows to.
+                Defaults to None
+            strict (bool, optional): Raise exception if any row is not found.
+                Defaults to True
+            extra (Extra | None, optional): Extra parameters. Defaults to None
+
+        Raises:
+            NotFoundError: If strict and any row is not found
+
+        Returns:
+            List[Any]: Found rows, None for not found ones
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.load(pk, convert_to=convert_to, strict=strict, extra=extra)
+                    for pk in pks
+                )
+            )
+        )
+
+    def _dispatch(self, key: TBatchKey) -> None:
+        batch = self._batches.pop(key, None)
+        extra = self._extras.pop(key, None)
+        if batch:
+            task = asyncio.ensure_future(self._load_batch(batch, key[0], extra))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(
+        self,
+        batch: Dict[TPrimaryKey, asyncio.Future],
+        convert_to: Type | None,
+        extra: Extra | None,
+    ) -> None:
+        rows: Dict[TPrimaryKey, Any] | None = None
+        error: Exception | None = None
+        try:
+            rows = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                partial(self._all_by_pks, list(batch), convert_to, extra),
+            )
+        except Exception as e:
+            error = e
+        finally:
+            # NOTE: futures are resolved even if loading is cancelled,
+            # so concurrent loads never hang
+            for pk, future in batch.items():
+                if future.done():
+                    continue
+                if rows is not None:
+                    future.set_result(rows.get(pk, None))
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.cancel()
+
+    def _all_by_pks(
+        self,
+        pks: List[TPrimaryKey],
+        convert_to: Type | None,
+        extra: Extra | None,
+    ) -> Dict[TPrimaryKey, Any]:
+        return {
+            getattr(row, self.repo.pk_field_name): row
+            for row in self.repo.all_by_pks(  # type:ignore[type-var]
+                pks, convert_to=convert_to, extra=extra  # type:ignore[arg-type]
+            )
+        }
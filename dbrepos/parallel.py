@@ -0,0 +1,159 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Sequence, Tuple
+
+from dbrepos.streaming import batched
+
+_POLL_INTERVAL = 0.1
+
+
+def split_range(low: int, high: int, n: int) -> List[Tuple[int, int]]:
+    """Split inclusive [low, high] range into at most `n` inclusive ranges
+
+    Args:
+        low (int): Lower bound of the range
+        high (int): Upper bound of the range
+        n (int): Maximum number of ranges
+
+    Returns:
+        List[Tuple[int, int]]: Adjacent non-overlapping ranges covering [low, high]
+    """
+    assert n > 0, "Number of partitions must be positive."
+    if high < low:
+        return []
+
+    size = -(-(high - low + 1) // n)  # ceil division
+    return [
+        (start, min(start + size - 1, high)) for start in range(low, high + 1, size)
+    ]
+
+
+class _Done:
+    """End of loader items, with loader error if any"""
+
+    def __init__(self, error: BaseException | None = None) -> None:
+        self.error = error
+
+
+def _produce(
+    loader: Callable[[], Iterable[Any]],
+    buffer: "queue.Queue[Any]",
+    stop: threading.Event,
+) -> None:
+    def put(item: Any) -> bool:
+        # NOTE: put is retried, so producer notices abandoned consumer
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    items: Iterable[Any] = ()
+    try:
+        items = loader()
+        for item in items:
+            if not put(item):
+                return
+    except BaseException as e:
+        put(_Done(e))
+        return
+    finally:
+        # NOTE: lazy loaders are closed in their own thread,
+        # so their sessions/connections are released there
+        close = getattr(items, "close", None)
+        if close is not None:
+            close()
+    put(_Done())
+
+
+def _consume(buffer: "queue.Queue[Any]") -> Iterator[Any]:
+    while True:
+        item = buffer.get()
+        if isinstance(item, _Done):
+            if item.error is not None:
+                raise item.error
+            return
+        yield item
+
+
+def fan_out(
+    loaders: Sequence[Callable[[], Iterable[Any]]],
+    *,
+    max_workers: int | None = None,
+    transform: Callable[[Any], Any] | None = None,
+    processes: int | None = None,
+    buffer_size: int = 1000,
+) -> Iterator[Any]:
+    """Run loaders in a thread pool and stream their items in loaders order
+
+    Items of the first loader are yielded as soon as they are loaded,
+    while the next loaders are already running.
+    At most `max_workers` loaders run ahead of the consumer and each of them
+    buffers at most `buffer_size` items, so memory usage is bounded
+    by `max_workers * buffer_size` items, not by the size of the result.
+
+    Args:
+        loaders (Sequence[Callable[[], Iterable[Any]]]): Partition loaders.
+            Each one is called and iterated in its own thread
+        max_workers (int | None, optional): Size of the thread pool.
+            Defaults to None (meaning one thread per loader)
+        transform (Callable[[Any], Any] | None, optional): Function applied
+            to every loaded item. Defaults to None
+        processes (int | None, optional): Apply `transform` in a process pool
+            of this size instead of the current process. `transform` and items
+            must be picklable. Defaults to None
+        buffer_size (int, optional): Maximum number of items buffered
+            per running loader. Defaults to 1000
+
+    Yields:
+        Any: Loaded (and transformed) items
+    """
+    assert buffer_size > 0, "Buffer size must be positive."
+    if not loaders:
+        return
+
+    workers = max_workers or len(loaders)
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=workers) as threads:
+        pending = iter(loaders)
+        running: Deque[Tuple["queue.Queue[Any]", Future]] = deque()
+
+        def submit() -> None:
+            loader = next(pending, None)
+            if loader is not None:
+                buffer: "queue.Queue[Any]" = queue.Queue(maxsize=buffer_size)
+                running.append((buffer, threads.submit(_produce, loader, buffer, stop)))
+
+        def items() -> Iterator[Any]:
+            for _ in range(workers):
+                submit()
+            while running:
+                buffer, _ = running.popleft()
+                # NOTE: next loader starts only when the previous one is consumed
+                yield from _consume(buffer)
+                submit()
+
+        try:
+            if transform is not None and processes:
+                with ProcessPoolExecutor(max_workers=processes) as pool:
+                    for batch in batched(items(), batch_size=buffer_size):
+                        yield from pool.map(
+                            transform,
+                            batch,
+                            # NOTE: ship items in big chunks to reduce IPC overhead
+                            chunksize=max(1, len(batch) // (processes * 4)),
+                        )
+                return
+
+            if transform is None:
+                yield from items()
+            else:
+                yield from map(transform, items())
+        finally:
+            stop.set()
+            for _, future in running:
+                future.cancel()
@@ -0,0 +1,1013 @@
+# mypy: disable-error-code="empty-body"
+# NOTE: bodies of `_routed` method stubs are never run
+
+import functools
+import heapq
+import inspect
+import itertools
+import zlib
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from dbrepos.core.abstract import IFilterSeq, IRepo, IShardRouter, TNumber
+from dbrepos.core.exceptions import BaseRepoException
+from dbrepos.core.types import Extra, StreamStats, mode, operator, returning
+from dbrepos.shortcuts import get_object_or_404
+from dbrepos.streaming import StreamProgress, batched
+
+TResult = TypeVar("TResult")
+TItem = TypeVar("TItem")
+
+
+class HashRouter:
+    """Router that spreads shard key values evenly over shards
+
+    Values are hashed with CRC32 of their string representation,
+    which is stable across processes (unlike builtin `hash`).
+    """
+
+    def __init__(self, shards: int) -> None:
+        """
+        Args:
+            shards (int): Number of shards
+        """
+        assert shards > 0, "Number of shards must be positive."
+        self.shards = shards
+
+    def shard_for(self, value: Any) -> int:
+        return zlib.crc32(str(value).encode()) % self.shards
+
+
+class RangeRouter:
+    """Router that maps contiguous shard key ranges to shards
+
+    Examples:
+        ```
+        # shard 0: < 1000, shard 1: [1000, 5000), shard 2: >= 5000
+        RangeRouter((1000, 5000))
+        ```
+    """
+
+    def __init__(self, bounds: Sequence[Any]) -> None:
+        """
+        Args:
+            bounds (Sequence[Any]): Sorted exclusive upper bounds of all
+                shards but the last one
+        """
+        assert list(bounds) == sorted(bounds), "Bounds must be sorted."
+        self.bounds = list(bounds)
+        self.shards = len(self.bounds) + 1
+
+    def shard_for(self, value: Any) -> int:
+        return bisect_right(self.bounds, value)
+
+
+class _Descending:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+def sort_key(
+    ordering: Tuple[str, ...],
+    *,
+    fields: Sequence[str] | None = None,
+    nulls_largest: bool = False,
+) -> Callable[[Any], Tuple[Any, ...]]:
+    """Build merge key of rows ordered by repo `ordering`
+
+    NULLs are compared as the smallest values (as SQLite and MySQL do:
+    first in ascending order, last in descending one) or as the largest ones.
+
+    Args:
+        ordering (Tuple[str, ...]): Column names, "-" prefixed for descending
+        fields (Sequence[str] | None, optional): Column names of tuple rows,
+            as returned by `values`. Defaults to None
+        nulls_largest (bool, optional): Compare NULLs as the largest values,
+            as PostgreSQL and Oracle do. Defaults to False
+
+    Returns:
+        Callable[[Any], Tuple[Any, ...]]: Key of row, dataclass or model instance
+            (or tuple, if `fields` passed)
+    """
+    names = [(name.lstrip("-"), name.startswith("-")) for name in ordering]
+    get: Callable[[Any, str], Any] = getattr
+    if fields is not None:
+        positions = {name: position for position, name in enumerate(fields)}
+        get = lambda row, name: row[positions[name]]  # noqa:E731
+
+    def nullable(value: Any) -> Tuple[bool, Any]:
+        # NOTE: NULL flag goes first, so None is never compared to a value
+        return (value is None, value) if nulls_largest else (value is not None, value)
+
+    def key(row: Any) -> Tuple[Any, ...]:
+        return tuple(
+            (
+                _Descending(nullable(get(row, name)))
+                if descending
+                else nullable(get(row, name))
+            )
+            for name, descending in names
+        )
+
+    return key
+
+
+def _unique(rows: Iterable[TItem]) -> Iterator[TItem]:
+    seen = set()
+    for row in rows:
+        if row not in seen:
+            seen.add(row)
+            yield row
+
+
+def _routed(
+    route: Callable[["ShardedRepo", Dict[str, Any]], Mapping[int, Dict[str, Any]]],
+    gather: Callable[["ShardedRepo", List[Any], Dict[str, Any]], Any],
+    *,
+    overrides: Mapping[str, Any] | None = None,
+    versioned: str | None = None,
+) -> Callable[[Callable[..., TResult]], Callable[..., TResult]]:
+    """Turn method stub into call of the same method of shard repos
+
+    Stub signature is used to bind call arguments, which are passed
+    to shards (all but `session`) in the same positional/keyword way.
+
+    Args:
+        route (Callable[[ShardedRepo, Dict[str, Any]], Mapping[int, Dict[str, Any]]]):
+            Maps call arguments to shards to call and their arguments
+        gather (Callable[[ShardedRepo, List[Any], Dict[str, Any]], Any]):
+            Combines shard results (in shards order) into the method result
+        overrides (Mapping[str, Any] | None, optional): Arguments passed
+            to shards instead of the caller ones. Defaults to None
+        versioned (str | None, optional): Name of expected version argument,
+            which requires pk routing when passed. Defaults to None
+
+    Returns:
+        Callable[[Callable[..., TResult]], Callable[..., TResult]]: Decorator
+    """
+
+    def decorator(stub: Callable[..., TResult]) -> Callable[..., TResult]:
+        name = stub.__name__
+        signature = inspect.signature(stub)
+        # NOTE: every shard runs in its own transaction, so session is not passed
+        params = [
+            param
+            for param in signature.parameters.values()
+            if param.name not in ("self", "session")
+        ]
+
+        def call(repo: Any, arguments: Dict[str, Any]) -> Any:
+            arguments = {**arguments, **(overrides or {})}
+            return getattr(repo, name)(
+                *(
+                    arguments[param.name]
+                    for param in params
+                    if param.kind == param.POSITIONAL_OR_KEYWORD
+                ),
+                **{
+                    param.name: arguments[param.name]
+                    for param in params
+                    if param.kind == param.KEYWORD_ONLY
+                },
+            )
+
+        @functools.wraps(stub)
+        def method(self: "ShardedRepo", *args: Any, **kwargs: Any) -> TResult:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            if versioned is not None and arguments[versioned] is not None:
+                self._check_versioned_routing()
+            return gather(
+                self, self._scatter_groups(route(self, arguments), call), arguments
+            )
+
+        return method
+
+    return decorator
+
+
+def _on(
+    repo: "ShardedRepo", shards: Iterable[int] | None, arguments: Dict[str, Any]
+) -> Dict[int, Any]:
+    return dict.fromkeys(
+        range(len(repo.repos)) if shards is None else shards, arguments
+    )
+
+
+def _to_all(repo: "ShardedRepo", arguments: Dict[str, Any]) -> Dict[int, Any]:
+    return _on(repo, None, arguments)
+
+
+def _by_pk(repo: "ShardedRepo", arguments: Dict[str, Any]) -> Dict[int, Any]:
+    return _on(repo, repo._shards_for(repo.pk_field_name, [arguments["pk"]]), arguments)
+
+
+def _by_field(repo: "ShardedRepo", arguments: Dict[str, Any]) -> Dict[int, Any]:
+    return _on(
+        repo, repo._shards_for(arguments["name"], [arguments["value"]]), arguments
+    )
+
+
+def _by_filters(repo: "ShardedRepo", arguments: Dict[str, Any]) -> Dict[int, Any]:
+    return _on(repo, repo._pinned_shards(arguments["filters"]), arguments)
+
+
+def _by_pks(repo: "ShardedRepo", arguments: Dict[str, Any]) -> Dict[int, Any]:
+    return {
+        shard: {**arguments, "pks": pks}
+        for shard, pks in repo._pk_groups(arguments["pks"]).items()
+    }
+
+
+def _total(repo: "ShardedRepo", results: List[Any], arguments: Dict[str, Any]) -> Any:
+    return sum(results)
+
+
+def _any(repo: "ShardedRepo", results: List[Any], arguments: Dict[str, Any]) -> bool:
+    return any(results)
+
+
+def _union(repo: "ShardedRepo", results: List[Any], arguments: Dict[str, Any]) -> Any:
+    return set().union(*results)
+
+
+def _nothing(
+    repo: "ShardedRepo", results: List[Any], arguments: Dict[str, Any]
+) -> None:
+    return None
+
+
+def _found(repo: "ShardedRepo", results: List[Any], arguments: Dict[str, Any]) -> Any:
+    return next((result for result in results if result is not None), None)
+
+
+def _merged(repo: "ShardedRepo", results: List[Any], arguments: Dict[str, Any]) -> Any:
+    return repo._merge(results, extra=arguments["extra"])
+
+
+def _first(repo: "ShardedRepo", results: List[Any], arguments: Dict[str, Any]) -> Any:
+    row = next(
+        repo._merge(
+            [[row] for row in results if row is not None], extra=arguments["extra"]
+        ),
+        None,
+    )
+    return get_object_or_404(row) if arguments["strict"] else row
+
+
+def _merged_news(
+    repo: "ShardedRepo", results: List[Any], arguments: Dict[str, Any]
+) -> Any:
+    if not arguments["return_new"]:
+        return None
+    return {pk: new for result in results for pk, new in result.items()}
+
+
+class ShardedRepo:
+    """Repository over rows split across several backing repositories
+
+    Every row lives on the shard chosen by `router` from its `shard_key`
+    value. Lookups by the shard key (pk or field methods, entity writes
+    and filters pinning it with eq/in_ under and_) go to the owning shards
+    only. Other reads are scattered to all shards in parallel
+    and gathered: counts are summed, existence is OR-ed and rows are
+    k-way merged by `extra.ordering` (or `default_ordering`),
+    so every shard must apply the same ordering (`nulls_largest` must match
+    NULLs ordering of the shard databases). Shard results are merged
+    as returned by shard repos, so rows are not buffered beyond what
+    shard repos buffer themselves. Other writes are broadcast to all shards.
+
+    Every shard runs in its own transaction, so multi-shard writes
+    are not atomic and `session` is not supported.
+    Version checks require the primary key to be the shard key.
+
+    Scatter thread pool is shut down by `close` or on exit of the repo
+    used as a context manager.
+    """
+
+    def __init__(
+        self,
+        repos: Sequence[IRepo],
+        *,
+        router: IShardRouter,
+        shard_key: str | None = None,
+        max_workers: int | None = None,
+        nulls_largest: bool = False,
+    ) -> None:
+        """
+        Args:
+            repos (Sequence[IRepo]): Shard repositories over the same table
+            router (IShardRouter): Shard key router
+            shard_key (str | None, optional): Name of the column rows are
+                routed by. Defaults to None (meaning primary key)
+            max_workers (int | None, optional): Size of the scatter thread pool.
+                Defaults to None (meaning one thread per shard)
+            nulls_largest (bool, optional): Merge NULLs as the largest values,
+                as PostgreSQL and Oracle order them. Defaults to False
+                (meaning the smallest ones, as SQLite and MySQL order them)
+        """
+        assert repos, "No shards provided."
+        assert router.shards == len(repos), "Router must cover every shard."
+        first = repos[0]
+        self.repos = list(repos)
+        self.router = router
+        self.table_class = first.table_class
+        self.pk_field_name = first.pk_field_name
+        self.is_soft_deletable = first.is_soft_deletable
+        self.default_ordering = first.default_ordering
+        self.soft_delete_marker = first.soft_delete_marker
+        self.version_column = first.version_column
+        self.session_factory = None
+        self.shard_key = shard_key or first.pk_field_name
+        self.nulls_largest = nulls_largest
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or len(repos), thread_name_prefix="dbrepos-shard"
+        )
+
+    def create(
+        self,
+        entity: Any,
+        *,
+        convert_to: Type | None = None,
+        returning_: returning = returning.row,
+        session: None = None,
+    ) -> Any:
+        return self._repo_for(entity).create(
+            entity, convert_to=convert_to, returning_=returning_
+        )
+
+    def bulk_create(
+        self,
+        entities: Sequence[Any],
+        *,
+        batch_size: int = 1000,
+        convert_to: Type | None = None,
+        returning_: returning = returning.none,
+        session: None = None,
+    ) -> Any:
+        groups = self._group(
+            range(len(entities)), key=lambda index: self._key_of(entities[index])
+        )
+        results = self._scatter_groups(
+            groups,
+            lambda repo, indexes: repo.bulk_create(
+                [entities[index] for index in indexes],
+                batch_size=batch_size,
+                convert_to=convert_to,
+                returning_=returning_,
+            ),
+        )
+        if returning_ == returning.none:
+            return sum(results)
+        # NOTE: results are restored to entities order
+        ordered: List[Any] = [None] * len(entities)
+        for indexes, result in zip(groups.values(), results):
+            for index, row in zip(indexes, result):
+                ordered[index] = row
+        return ordered
+
+    def create_stream(
+        self,
+        entities: Iterable[Any],
+        *,
+        batch_size: int = 1000,
+        commit_every: int = 1,
+        flush_interval: float | None = None,
+        on_progress: Callable[[StreamStats], None] | None = None,
+        session: None = None,
+    ) -> StreamStats:
+        assert commit_every > 0, "Number of batches per commit must be positive."
+        progress = StreamProgress(on_progress)
+        batches = batched(
+            entities, batch_size=batch_size, flush_interval=flush_interval
+        )
+        for first in batches:
+            # NOTE: shard part of `commit_every` batches never takes more
+            # than `commit_every` batches, so it is inserted in one transaction
+            window = [first, *itertools.islice(batches, commit_every - 1)]
+            self._scatter_groups(
+                self._group(itertools.chain.from_iterable(window), key=self._key_of),
+                lambda repo, items: repo.create_stream(
+                    items, batch_size=batch_size, commit_every=len(window)
+                ),
+            )
+            for batch in window:
+                progress.flushed(len(batch))
+            progress.committed()
+        return progress.stats()
+
+    @_routed(_by_field, _first, overrides={"strict": False})
+    def get_by_field(
+        self,
+        *,
+        name: str,
+        value: Any,
+        convert_to: Type | None = None,
+        strict: bool = True,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> Any: ...
+
+    @_routed(_by_filters, _first, overrides={"strict": False})
+    def get_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        convert_to: Type | None = None,
+        strict: bool = True,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> Any: ...
+
+    @_routed(_by_pk, _first, overrides={"strict": False})
+    def get_by_pk(
+        self,
+        pk: Any,
+        *,
+        convert_to: Type | None = None,
+        strict: bool = True,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> Any: ...
+
+    def get_many_by_field(
+        self,
+        name: str,
+        values: Iterable[Any],
+        *,
+        convert_to: Type | None = None,
+        extra: Extra | None = None,
+        batch_size: int = 1000,
+        session: None = None,
+    ) -> Dict[Any, Any]:
+        unique = list(dict.fromkeys(values))
+        found: Dict[Any, Any] = {}
+        for shard_found in self._scatter_groups(
+            self._value_groups(name, unique),
+            lambda repo, values_: repo.get_many_by_field(
+                name,
+                values_,
+                convert_to=convert_to,
+                extra=extra,
+                batch_size=batch_size,
+            ),
+        ):
+            for value, row in shard_found.items():
+                found.setdefault(value, row)
+        return {value: found[value] for value in unique if value in found}
+
+    def get_many_by_pks(
+        self,
+        pks: Iterable[Any],
+        *,
+        convert_to: Type | None = None,
+        extra: Extra | None = None,
+        batch_size: int = 1000,
+        session: None = None,
+    ) -> Dict[Any, Any]:
+        return self.get_many_by_field(
+            self.pk_field_name,
+            pks,
+            convert_to=convert_to,
+            extra=extra,
+            batch_size=batch_size,
+        )
+
+    @_routed(_to_all, _merged)
+    def all(
+        self,
+        *,
+        convert_to: Type | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> Iterator[Any]: ...
+
+    @_routed(_by_field, _merged)
+    def all_by_field(
+        self,
+        *,
+        name: str,
+        value: Any,
+        convert_to: Type | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> Iterator[Any]: ...
+
+    @_routed(_by_filters, _merged)
+    def all_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        convert_to: Type | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> Iterator[Any]: ...
+
+    @_routed(_by_pks, _merged)
+    def all_by_pks(
+        self,
+        pks: Sequence[Any],
+        *,
+        convert_to: Type | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> Iterator[Any]: ...
+
+    def pluck(
+        self,
+        field: str,
+        *,
+        filters: IFilterSeq | None = None,
+        extra: Extra | None = None,
+        distinct: bool = False,
+        flat: bool = True,
+        chunk_size: int | None = None,
+        session: None = None,
+    ) -> Sequence[Any] | Iterator[Any]:
+        rows: Iterator[Any] = self._values(
+            (field,),
+            filters=filters,
+            extra=extra,
+            distinct=distinct,
+            chunk_size=chunk_size,
+        )
+        if flat:
+            rows = (row[0] for row in rows)
+        return rows if chunk_size is not None else list(rows)
+
+    def values(
+        self,
+        fields: Sequence[str],
+        *,
+        filters: IFilterSeq | None = None,
+        extra: Extra | None = None,
+        distinct: bool = False,
+        chunk_size: int | None = None,
+        session: None = None,
+    ) -> Sequence[Tuple[Any, ...]] | Iterator[Tuple[Any, ...]]:
+        rows = self._values(
+            fields,
+            filters=filters,
+            extra=extra,
+            distinct=distinct,
+            chunk_size=chunk_size,
+        )
+        return rows if chunk_size is not None else list(rows)
+
+    @_routed(_by_pk, _nothing, versioned="expected_version")
+    def update(
+        self,
+        pk: Any,
+        *,
+        values: Mapping[str, Any],
+        expected_version: int | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> None: ...
+
+    def save(
+        self,
+        entity: Any,
+        *,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> bool:
+        return self._repo_for(entity).save(entity, extra=extra)
+
+    def multi_update(
+        self,
+        pks: Sequence[Any],
+        *,
+        values: Mapping[str, Any],
+        expected_versions: Mapping[Any, int] | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> None:
+        if expected_versions is not None:
+            self._check_versioned_routing()
+        self._scatter_groups(
+            self._pk_groups(pks),
+            lambda repo, pks_: repo.multi_update(
+                pks_,
+                values=values,
+                expected_versions=(
+                    None
+                    if expected_versions is None
+                    else {pk: expected_versions[pk] for pk in pks_}
+                ),
+                extra=extra,
+            ),
+        )
+
+    @_routed(_by_filters, _total)
+    def update_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        values: Mapping[str, Any],
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> int: ...
+
+    def bulk_update(
+        self,
+        values: Mapping[Any, Mapping[str, Any]],
+        *,
+        deltas: Mapping[Any, Mapping[str, TNumber]] | None = None,
+        expected_versions: Mapping[Any, int] | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> int:
+        deltas = deltas or {}
+        if expected_versions is not None:
+            self._check_versioned_routing()
+        return sum(
+            self._scatter_groups(
+                self._pk_groups([*values, *deltas]),
+                lambda repo, pks: repo.bulk_update(
+                    {pk: values[pk] for pk in pks if pk in values},
+                    deltas={pk: deltas[pk] for pk in pks if pk in deltas},
+                    expected_versions=(
+                        None
+                        if expected_versions is None
+                        else {
+                            pk: expected_versions[pk]
+                            for pk in pks
+                            if pk in expected_versions
+                        }
+                    ),
+                    extra=extra,
+                ),
+            )
+        )
+
+    @_routed(_by_pk, _found)
+    def increment(
+        self,
+        pk: Any,
+        field: str,
+        *,
+        by: TNumber = 1,
+        return_new: bool = False,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> TNumber | None: ...
+
+    @_routed(_by_pks, _merged_news)
+    def multi_increment(
+        self,
+        pks: Sequence[Any],
+        deltas: Mapping[str, TNumber],
+        *,
+        return_new: bool = False,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> Dict[Any, Dict[str, TNumber]] | None: ...
+
+    @_routed(_by_filters, _total)
+    def increment_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        deltas: Mapping[str, TNumber],
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> int: ...
+
+    def claim_batch(
+        self,
+        *,
+        filters: IFilterSeq,
+        limit: int,
+        values: Mapping[str, Any],
+        convert_to: Type | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> List[Any]:
+        # NOTE: shards are claimed one by one, so no more than `limit` rows
+        # are claimed in total
+        shards = self._pinned_shards(filters)
+        claimed: List[Any] = []
+        for shard in range(len(self.repos)) if shards is None else sorted(shards):
+            repo: Any = self.repos[shard]
+            claimed.extend(
+                repo.claim_batch(
+                    filters=filters,
+                    limit=limit - len(claimed),
+                    values=values,
+                    convert_to=convert_to,
+                    extra=extra,
+                )
+            )
+            if len(claimed) >= limit:
+                break
+        return claimed
+
+    @_routed(_by_pk, _nothing)
+    def delete(
+        self,
+        pk: Any,
+        *,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> None: ...
+
+    @_routed(_by_pks, _total)
+    def multi_delete(
+        self,
+        pks: Sequence[Any],
+        *,
+        batch_size: int = 1000,
+        soft: bool = False,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> int: ...
+
+    @_routed(_by_pk, _nothing)
+    def soft_delete(
+        self,
+        pk: Any,
+        *,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> None: ...
+
+    @_routed(_by_pks, _total)
+    def bulk_soft_delete(
+        self,
+        pks: Sequence[Any],
+        *,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> int: ...
+
+    @_routed(_by_field, _nothing)
+    def delete_by_field(
+        self,
+        *,
+        name: str,
+        value: Any,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> None: ...
+
+    @_routed(_by_filters, _total)
+    def delete_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> int: ...
+
+    @_routed(_by_field, _any)
+    def exists_by_field(
+        self,
+        *,
+        name: str,
+        value: Any,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> bool: ...
+
+    @_routed(_by_filters, _any)
+    def exists_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> bool: ...
+
+    @_routed(_by_pks, _union)
+    def exists_by_pks(
+        self,
+        pks: Sequence[Any],
+        *,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> Set[Any]: ...
+
+    @_routed(_by_field, _total)
+    def count_by_field(
+        self,
+        *,
+        name: str,
+        value: Any,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> int: ...
+
+    @_routed(_by_filters, _total)
+    def count_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        extra: Extra | None = None,
+        session: None = None,
+    ) -> int: ...
+
+    def scan_partitions(
+        self,
+        n: int,
+        *,
+        by: str | None = None,
+        filters: IFilterSeq | None = None,
+        convert_to: Type | None = None,
+        extra: Extra | None = None,
+        max_workers: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        processes: int | None = None,
+    ) -> Iterator[Any]:
+        repos: List[Any] = self.repos
+        # NOTE: shards are scanned one by one, each one in `n` parallel partitions
+        return itertools.chain.from_iterable(
+            repo.scan_partitions(
+                n,
+                by=by,
+                filters=filters,
+                convert_to=convert_to,
+                extra=extra,
+                max_workers=max_workers,
+                transform=transform,
+                processes=processes,
+            )
+            for repo in repos
+        )
+
+    def subquery(
+        self,
+        field: str,
+        *,
+        filters: IFilterSeq | None = None,
+        extra: Extra | None = None,
+    ) -> Any:
+        raise BaseRepoException("Subqueries cannot span shards.")
+
+    def close(self) -> None:
+        """Shut scatter thread pool down"""
+        self._executor.shutdown()
+
+    def __enter__(self) -> "ShardedRepo":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    """ Utils """
+
+    def _key_of(self, entity: Any) -> Any:
+        value = getattr(entity, self.shard_key, None)
+        if value is None:
+            raise BaseRepoException(
+                f"Cannot route entity without {self.shard_key} value."
+            )
+        return value
+
+    def _repo_for(self, entity: Any) -> Any:
+        return self.repos[self.router.shard_for(self._key_of(entity))]
+
+    def _group(
+        self, items: Iterable[TItem], *, key: Callable[[TItem], Any]
+    ) -> Dict[int, List[TItem]]:
+        groups: Dict[int, List[TItem]] = {}
+        for item in items:
+            groups.setdefault(self.router.shard_for(key(item)), []).append(item)
+        return groups
+
+    def _pk_groups(self, pks: Iterable[Any]) -> Dict[int, List[Any]]:
+        return self._value_groups(self.pk_field_name, pks)
+
+    def _value_groups(self, name: str, values: Iterable[Any]) -> Dict[int, List[Any]]:
+        values = list(dict.fromkeys(values))
+        if not values:
+            return {}
+        if self.shard_key == name:
+            return self._group(values, key=lambda value: value)
+        # NOTE: value owners are unknown, so all values are sent to every shard
+        return {shard: values for shard in range(len(self.repos))}
+
+    def _shards_for(self, name: str, values: Iterable[Any]) -> Set[int] | None:
+        if name != self.shard_key:
+            return None
+        return {self.router.shard_for(value) for value in values}
+
+    def _pinned_shards(self, filters: Any) -> Set[int] | None:
+        mode_ = getattr(filters, "mode_", None)
+        if mode_ is None:
+            if getattr(filters, "column_name", None) != self.shard_key:
+                return None
+            if filters.operator_ == operator.eq:
+                return self._shards_for(self.shard_key, [filters.value])
+            if filters.operator_ == operator.in_:
+                return self._shards_for(self.shard_key, filters.value)
+            return None
+
+        shards = [self._pinned_shards(filter) for filter in filters.filters]
+        if mode_ == mode.and_:
+            pinned = [shard for shard in shards if shard is not None]
+            return set.intersection(*pinned) if pinned else None
+        if any(shard is None for shard in shards):
+            return None
+        return set().union(*shards)  # type:ignore[arg-type]
+
+    def _check_versioned_routing(self) -> None:
+        if self.shard_key != self.pk_field_name:
+            raise BaseRepoException("Version checks require pk shard key.")
+
+    def _scatter(
+        self,
+        call: Callable[[Any], TResult],
+        *,
+        shards: Iterable[int] | None = None,
+    ) -> List[TResult]:
+        return self._scatter_groups(
+            dict.fromkeys(range(len(self.repos)) if shards is None else shards),
+            lambda repo, _: call(repo),
+        )
+
+    def _scatter_groups(
+        self,
+        groups: Mapping[int, TItem],
+        call: Callable[[Any, TItem], TResult],
+    ) -> List[TResult]:
+        def run(shard: int) -> TResult:
+            return call(self.repos[shard], groups[shard])
+
+        if len(groups) == 1:
+            return [run(next(iter(groups)))]
+        return list(self._executor.map(run, groups))
+
+    def _values(
+        self,
+        fields: Sequence[str],
+        *,
+        filters: IFilterSeq | None,
+        extra: Extra | None,
+        distinct: bool,
+        chunk_size: int | None,
+    ) -> Iterator[Tuple[Any, ...]]:
+        results = self._scatter(
+            lambda repo: repo.values(
+                fields,
+                filters=filters,
+                extra=extra,
+                distinct=distinct,
+                chunk_size=chunk_size,
+            ),
+            shards=None if filters is None else self._pinned_shards(filters),
+        )
+        ordering = (extra.ordering if extra else ()) or (
+            tuple(fields) if distinct else self.default_ordering
+        )
+        rows: Iterable[Tuple[Any, ...]]
+        if ordering and all(name.lstrip("-") in fields for name in ordering):
+            rows = heapq.merge(
+                *results,
+                key=sort_key(ordering, fields=fields, nulls_largest=self.nulls_largest),
+            )
+        else:
+            # NOTE: rows cannot be merged by columns that are not selected,
+            # so shards are concatenated
+            rows = itertools.chain.from_iterable(results)
+        if distinct:
+            rows = _unique(rows)
+        return iter(rows)
+
+    def _merge(
+        self, results: Sequence[Iterable[Any]], *, extra: Extra | None
+    ) -> Iterator[Any]:
+        ordering = (extra.ordering if extra else ()) or self.default_ordering
+        if not ordering:
+            return itertools.chain.from_iterable(results)
+        return iter(
+            heapq.merge(
+                *results, key=sort_key(ordering, nulls_largest=self.nulls_largest)
+            )
+        )
@@ -1,6 +1,10 @@
-from typing import Type, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar
 
-from dbrepos.core.exceptions import BaseRepoException
+from dbrepos.core.exceptions import NotFoundError, VersionConflictError
+from dbrepos.core.types import Extra
+
+if TYPE_CHECKING:
+    from dbrepos.core.abstract import IRepo
 
 TObject = TypeVar("TObject")
 
@@ -11,7 +15,7 @@ def get_object_or_404(
     obj: TObject | None,
     *,
     msg: str | None = None,
-    exc: Type[Exception] = BaseRepoException,
+    exc: Type[Exception] = NotFoundError,
 ) -> TObject:
     """Strict object retrieval
 
@@ -24,10 +28,10 @@ def get_object_or_404(
         msg (str | None, optional): Message for exception.
             Defaults to None
         exc (Type[Exception]): Exception to raise.
-            Defaults to BASE_EXCEPTION
+            Defaults to NotFoundError
 
     Raises:
-        BaseRepoException: If object is None
+        NotFoundError: If object is None
 
     Returns:
         TObject: Final object
@@ -37,3 +41,52 @@ def get_object_or_404(
     if obj is None:
         raise exc(msg)
     return obj
+
+
+def retry_on_conflict(
+    repo: "IRepo",
+    pk: Any,
+    apply: Callable[[TObject], Any],
+    *,
+    convert_to: Type[TObject],
+    attempts: int = 3,
+    extra: Extra | None = None,
+) -> TObject:
+    """Read-modify-write with optimistic locking
+
+    Row is loaded, changed in-place with `apply` and saved.
+    If row version is changed concurrently, row is reloaded
+    and `apply` is called again.
+    Repo must be configured with `version_column` and `change_tracker`.
+
+    Args:
+        repo (IRepo): Repository with versioned table
+        pk (Any): Primary key value
+        apply (Callable[[TObject], Any]): Function that changes loaded entity
+        convert_to (Type[TObject]): Dataclass to convert row to
+        attempts (int, optional): Maximum number of attempts.
+            Defaults to 3
+        extra (Extra | None, optional): Extra parameters.
+            Defaults to None
+
+    Raises:
+        NotFoundError: If row is not found
+        VersionConflictError: If all attempts failed with version conflict
+
+    Returns:
+        TObject: Saved entity
+    """
+    assert attempts > 0, "Number of attempts must be positive."
+    for attempt in range(1, attempts + 1):
+        entity: TObject = repo.get_by_pk(  # type:ignore[type-var]
+            pk, convert_to=convert_to, extra=extra
+        )
+        apply(entity)
+        try:
+            repo.save(entity, extra=extra)  # type:ignore[type-var]
+        except VersionConflictError:
+            if attempt == attempts:
+                raise
+            continue
+        return entity
+    raise AssertionError("unreachable")  # pragma: no cover
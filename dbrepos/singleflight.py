@@ -0,0 +1,78 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from dbrepos.core.types import SingleFlightStats
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Deduplicator of identical concurrent calls across threads
+
+    The first caller of a key runs the loader, while concurrent callers
+    of the same key wait for it and share its result (or exception).
+    Nothing is kept after the call is done, so unlike ResultCache
+    it never serves stale results.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Run loader or wait for in-flight call of the same key
+
+        Args:
+            key (Hashable): Call fingerprint
+            load (Callable[[], Any]): Result loader
+
+        Returns:
+            Any: Loaded or shared result
+        """
+        with self._lock:
+            call = self._calls.get(key, None)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = load()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> SingleFlightStats:
+        """Coalescing statistics
+
+        Returns:
+            SingleFlightStats: Current statistics
+        """
+        with self._lock:
+            return SingleFlightStats(
+                executions=self._executions,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls),
+            )
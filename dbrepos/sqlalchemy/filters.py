@@ -1,16 +1,36 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Iterable, Literal, Self, Type, TypeVar
+import functools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Literal,
+    NamedTuple,
+    Self,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from sqlalchemy import (
     BinaryExpression,
+    Boolean,
     Column,
     ColumnElement,
     ColumnExpressionArgument,
+    ForeignKeyConstraint,
+    FromClause,
+    Select,
     Table,
     and_,
     or_,
 )
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import Grouping, UnaryExpression
+from sqlalchemy.sql.visitors import InternalTraversal
 
 from dbrepos.core.abstract import IFilter, IFilterSeq, mode, operator
 
@@ -18,6 +38,85 @@ TTable = TypeVar("TTable", bound=Table)
 TFieldValue = TypeVar("TFieldValue")
 
 
+_MAX_CHAR = 0x10FFFF
+_SURROGATES = range(0xD800, 0xE000)
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string greater than every string starting with `prefix`
+
+    Returns None when there is no such string (empty prefix or prefix
+    consisting of the last unicode characters only).
+    """
+    prefix = prefix.rstrip(chr(_MAX_CHAR))
+    if not prefix:
+        return None
+    code = ord(prefix[-1]) + 1
+    if code in _SURROGATES:
+        code = _SURROGATES.stop
+    return prefix[:-1] + chr(code)
+
+
+class _PrefixRange(ColumnElement[bool]):
+    """`LIKE 'prefix%'` condition narrowed by `col >= 'prefix' AND col < upper`"""
+
+    inherit_cache = True
+    type = Boolean()
+    _traverse_internals = [
+        ("bounds", InternalTraversal.dp_clauseelement),
+        ("condition", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(
+        self, bounds: ColumnElement[bool], condition: ColumnElement[bool]
+    ) -> None:
+        self.bounds = bounds
+        self.condition = condition
+
+    def self_group(self, against: Any = None) -> ColumnElement[Any]:
+        if operators.is_precedent(operators.and_, against):
+            return Grouping(self)
+        return self
+
+    def _negate(self) -> ColumnElement[Any]:
+        return UnaryExpression(
+            self.self_group(against=operators.inv), operator=operators.inv
+        )
+
+
+@compiles(_PrefixRange)
+def _compile_prefix_range(element: _PrefixRange, compiler: Any, **kw: Any) -> str:
+    return compiler.process(and_(element.bounds, element.condition), **kw)
+
+
+@compiles(_PrefixRange, "sqlite")
+def _compile_prefix_range_sqlite(
+    element: _PrefixRange, compiler: Any, **kw: Any
+) -> str:
+    # NOTE: SQLite LIKE is case-insensitive, while range is compared
+    # with BINARY collation, so range would drop matching rows
+    return compiler.process(element.condition, **kw)
+
+
+def _startswith(column: Column, value: Any) -> ColumnElement[bool]:
+    # NOTE: LIKE can use btree index only with C collation or special
+    # operator classes, so prefix is also compiled to a range
+    # (`col >= 'abc' AND col < 'abd'`), which any btree index can serve.
+    # LIKE is kept as a recheck for collations where range is wider.
+    if not isinstance(value, str):
+        return column.startswith(value)
+    condition = column.startswith(value, autoescape=True)
+    upper = _prefix_upper_bound(value)
+    if upper is None:
+        return condition
+    return _PrefixRange(and_(column >= value, column < upper), condition)
+
+
+def _exists_subquery(column: Column, value: Select) -> ColumnElement[bool]:
+    (inner,) = value.selected_columns
+    return value.where(inner == column).exists()
+
+
 _OPERATOR_TO_ORM: Dict[
     operator,
     Callable[[Column, TFieldValue], BinaryExpression | ColumnElement],
@@ -29,6 +128,17 @@ _OPERATOR_TO_ORM: Dict[
     operator.ge: Column.__ge__,
     operator.in_: Column.in_,  # type:ignore[dict-item] # this is weird as hell...
     operator.is_: Column.is_,
+    operator.ne: Column.__ne__,
+    operator.not_in: Column.not_in,  # type:ignore[dict-item]
+    operator.between: lambda column, value: column.between(
+        *value  # type:ignore[misc]
+    ),
+    operator.is_not: Column.is_not,
+    operator.startswith: _startswith,
+    operator.contains: lambda column, value: column.contains(value, autoescape=True),
+    operator.icontains: lambda column, value: column.icontains(value, autoescape=True),
+    operator.in_subquery: Column.in_,  # type:ignore[dict-item]
+    operator.exists_subquery: _exists_subquery,  # type:ignore[dict-item]
 }
 
 
@@ -47,6 +157,84 @@ _MODE_TO_ORM: Dict[
 }
 
 
+_NEGATED_OPERATORS = frozenset((operator.ne, operator.not_in, operator.is_not))
+
+
+class Join(NamedTuple):
+    """Join required by a filter on related table column
+
+    Args:
+        path (str): Dotted path of the relation, e.g. "customer.country"
+        target (FromClause): Aliased related table
+        onclause (ColumnElement[bool]): Join condition
+        isouter (bool): Whether LEFT OUTER JOIN is required
+    """
+
+    path: str
+    target: FromClause
+    onclause: ColumnElement[bool]
+    isouter: bool = False
+
+
+def _foreign_key(table: Table, name: str) -> ForeignKeyConstraint | None:
+    for constraint in table.foreign_key_constraints:
+        if constraint.column_keys in ([name], [f"{name}_id"]):
+            return constraint
+    for constraint in table.foreign_key_constraints:
+        if constraint.referred_table.name == name:
+            return constraint
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _join(table_class: Table, path: str) -> Tuple[Table, Join]:
+    # NOTE: joins are cached per root table and relation path,
+    # so filters sharing a path reference the very same alias
+    # and their joins are de-duplicated
+    parent, _, relation = path.rpartition(".")
+    table: Table = table_class
+    left: FromClause = table_class
+    if parent:
+        table, parent_join = _join(table_class, parent)
+        left = parent_join.target
+    constraint = _foreign_key(table, relation)
+    assert (
+        constraint is not None
+    ), f"Model {table.name} has no foreign key named {relation}."
+    right = constraint.referred_table.alias(
+        f"{table_class.name}__{path.replace('.', '__')}"
+    )
+    onclause = and_(
+        *(
+            left.c[element.parent.name] == right.c[element.column.name]
+            for element in constraint.elements
+        )
+    )
+    return constraint.referred_table, Join(path, right, onclause)
+
+
+def _resolve_path(
+    table_class: Table, column_name: str
+) -> Tuple[Tuple[Join, ...], ColumnElement[Any] | None]:
+    """Resolve dotted column path via table foreign keys"""
+    *relations, name = column_name.split(".")
+    joins = [
+        _join(table_class, ".".join(relations[: index + 1]))[1]
+        for index in range(len(relations))
+    ]
+    return tuple(joins), joins[-1].target.c.get(name, None)
+
+
+def _merge_joins(joins: Iterable[Join], *, isouter: bool) -> Tuple[Join, ...]:
+    merged: Dict[str, Join] = {}
+    for join in joins:
+        known = merged.get(join.path)
+        merged[join.path] = join._replace(
+            isouter=isouter or join.isouter or bool(known and known.isouter)
+        )
+    return tuple(merged.values())
+
+
 class AlchemyFilter(
     IFilter[
         TTable,
@@ -62,7 +250,14 @@ class AlchemyFilter(
         value: TFieldValue | None = None,
         operator_: operator = operator.eq,
     ) -> None:
-        self.column = table_class.c.get(column_name, None)  # type:ignore[attr-defined]
+        self._joins: Tuple[Join, ...] = ()
+        if "." in column_name:
+            self._joins, column = _resolve_path(
+                table_class, column_name  # type:ignore[arg-type]
+            )
+        else:
+            column = table_class.c.get(column_name, None)  # type:ignore[attr-defined]
+        self.column: Column = column  # type:ignore[assignment]
         self.column_name = column_name
         self.value = value
         self.operator_ = operator_
@@ -76,6 +271,20 @@ class AlchemyFilter(
         self.operator_ = operator_
         return self
 
+    @property
+    def joins(self) -> Tuple[Join, ...]:
+        """Joins required by dotted `column_name`
+
+        NULL checks and negated operators are outer joined,
+        so rows without related row are matched with NULL semantics
+        of the operator (as django does).
+        """
+        return _merge_joins(
+            self._joins,
+            isouter=(self.operator_ == operator.is_ and self.value is None)
+            or self.operator_ in _NEGATED_OPERATORS,
+        )
+
     def compile(self) -> BinaryExpression[bool] | ColumnElement[bool]:
         return _OPERATOR_TO_ORM[self.operator_](self.column, self.value)
 
@@ -100,6 +309,18 @@ class AlchemyFilterSeq(IFilterSeq[BinaryExpression[bool] | ColumnElement[bool]])
 
         assert len(filters) > 0, "No filters provided."
 
+    @property
+    def joins(self) -> Tuple[Join, ...]:
+        """Joins required by filters, de-duplicated by relation path
+
+        Joins under `mode.or_` are outer, so rows without related row
+        still match other branches.
+        """
+        return _merge_joins(
+            (join for filter in self.filters for join in getattr(filter, "joins", ())),
+            isouter=self.mode_ == mode.or_ and len(self.filters) > 1,
+        )
+
     def compile(self) -> BinaryExpression[bool] | ColumnElement[bool]:
         result = []
         for filter in self.filters:
@@ -0,0 +1,84 @@
+from typing import Any, Optional, Type, TypeVar
+
+from sqlalchemy import ClauseElement, Index, Table
+
+from dbrepos.core.types import SoftDeleteMarker
+from dbrepos.sqlalchemy.filters import AlchemyFilter
+
+TTable = TypeVar("TTable", bound=Table)
+
+
+def soft_delete_index(
+    name: str,
+    table_class: Type[TTable],
+    *columns: str,
+    marker: SoftDeleteMarker = SoftDeleteMarker(),
+    **kwargs: Any,
+) -> Index:
+    """Build partial index that covers only not soft deleted rows
+
+    Index predicate is compiled from the same marker repositories
+    use for reads, so queries with soft delete filter can use this index.
+    Index is attached to the table, so the existing index of the same name
+    is returned instead of building a duplicate, as long as it has
+    the same columns, predicate and params.
+
+    Args:
+        name (str): Name of the index
+        table_class (Type[TTable]): Table to build index for
+        *columns (str): Names of the indexed columns
+        marker (SoftDeleteMarker, optional): Soft delete marker.
+            Defaults to SoftDeleteMarker()
+        **kwargs (Any): Extra Index params, e.g. `unique=True`
+
+    Returns:
+        Index: Partial index for PostgreSQL and SQLite
+    """
+    assert columns, "No columns provided."
+    predicate = AlchemyFilter(
+        table_class,
+        marker.column,
+        marker.alive,
+        marker.operator_,
+    ).compile()
+    for index in table_class.indexes:  # type:ignore[attr-defined]
+        if index.name == name:
+            assert [column.name for column in index.columns] == list(
+                columns
+            ), f"Index {name} of other columns already exists."
+            assert all(
+                _same_clause(index.dialect_options[dialect]["where"], predicate)
+                for dialect in ("postgresql", "sqlite")
+            ), f"Index {name} of other predicate already exists."
+            assert index.unique == kwargs.get(
+                "unique", False
+            ), f"Index {name} of other uniqueness already exists."
+            options = {
+                key: value
+                for key, value in index.dialect_kwargs.items()
+                if key not in ("postgresql_where", "sqlite_where")
+            }
+            requested = {key: value for key, value in kwargs.items() if key != "unique"}
+            assert options == requested, f"Index {name} of other params already exists."
+            return index
+
+    return Index(
+        name,
+        *(table_class.c[column] for column in columns),  # type:ignore[index]
+        postgresql_where=predicate,
+        sqlite_where=predicate,
+        **kwargs,
+    )
+
+
+def _same_clause(
+    clause: Optional[ClauseElement], other: Optional[ClauseElement]
+) -> bool:
+    if clause is None or other is None:
+        return clause is other
+    # NOTE: bound values are not part of the statement string, compare both
+    compiled, other_compiled = clause.compile(), other.compile()
+    return (compiled.string, compiled.params) == (
+        other_compiled.string,
+        other_compiled.params,
+    )
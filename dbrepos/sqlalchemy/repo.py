@@ -1,15 +1,24 @@
+import functools
 from contextlib import AbstractContextManager
-from dataclasses import asdict
+from dataclasses import replace
+from itertools import chain, islice
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
     cast,
+    overload,
 )
 
 if TYPE_CHECKING:
@@ -18,26 +27,49 @@ if TYPE_CHECKING:
 from sqlalchemy import (
     ColumnElement,
     Delete,
+    Index,
+    Insert,
     Row,
     Select,
     Table,
     Update,
+    bindparam,
+    case,
     delete,
+    func,
     insert,
+    literal,
     select,
+    tuple_,
     update,
 )
 from sqlalchemy.orm import Query, Session
 
-from dbrepos.core.abstract import IFilterSeq, IRepo, mode, operator
-from dbrepos.core.types import Extra
+from dbrepos.cache import ResultCache
+from dbrepos.core.abstract import IFilterSeq, IRepo, TNumber, mode, operator
+from dbrepos.core.exceptions import (
+    BaseRepoException,
+    NotFoundError,
+    VersionConflictError,
+)
+from dbrepos.core.extractors import field_extractor
+from dbrepos.core.fingerprint import fingerprint
+from dbrepos.core.types import Extra, SoftDeleteMarker, StreamStats, returning
 from dbrepos.decorators import TDataclass
 from dbrepos.decorators import convert as _convert
 from dbrepos.decorators import handle_error as _handle_error
+from dbrepos.decorators import repo_method as _repo_method
 from dbrepos.decorators import session as _session
 from dbrepos.decorators import strict as _strict
+from dbrepos.parallel import fan_out, split_range
 from dbrepos.shortcuts import get_object_or_404 as _get_object_or_404
-from dbrepos.sqlalchemy.filters import AlchemyFilter, AlchemyFilterSeq
+from dbrepos.singleflight import SingleFlight
+from dbrepos.sqlalchemy.filters import AlchemyFilter, AlchemyFilterSeq, Join
+from dbrepos.sqlalchemy.indexes import soft_delete_index as _soft_delete_index
+from dbrepos.sqlalchemy.statements import StatementCache
+from dbrepos.streaming import StreamProgress, batched
+from dbrepos.throttle import LogThrottle
+from dbrepos.tracking import ChangeTracker
 
 TTable = TypeVar("TTable", bound=Table)
 if TYPE_CHECKING:
@@ -51,11 +83,13 @@ TPrimaryKey = TypeVar("TPrimaryKey", int, str, covariant=True)
 TFieldValue = TypeVar("TFieldValue")
 TSession = TypeVar("TSession", bound=Session, covariant=True)
 TQuery = TypeVar("TQuery", Select, Query, Update, Delete)
+TStatement = TypeVar("TStatement", Select, Update, Delete)
 
 
 strict = _strict
 handle_error = _handle_error
 session = _session
+repo_method = _repo_method
 convert = _convert
 get_object_or_404 = _get_object_or_404
 
@@ -69,41 +103,139 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         is_soft_deletable: bool = False,
         default_ordering: Tuple[str, ...] = ("id",),
         session_factory: AbstractContextManager | None = None,
+        statement_cache_size: int = 128,
+        prepare_threshold: int | None = None,
+        result_cache: ResultCache | None = None,
+        single_flight: SingleFlight | None = None,
+        change_tracker: ChangeTracker | None = None,
+        version_column: str | None = None,
+        soft_delete_marker: SoftDeleteMarker | None = None,
+        log_throttle: LogThrottle | None = None,
     ) -> None:
         self.table_class = table_class
         self.pk_field_name = pk_field_name
         self.is_soft_deletable = is_soft_deletable
         self.default_ordering = default_ordering
         self.session_factory = session_factory
+        self.statement_cache: StatementCache | None = (
+            StatementCache(statement_cache_size) if statement_cache_size else None
+        )
+        self.prepare_threshold = prepare_threshold
+        self.result_cache = result_cache
+        self.single_flight = single_flight
+        self.change_tracker = change_tracker
+        self.version_column = version_column
+        self.soft_delete_marker = soft_delete_marker or SoftDeleteMarker()
+        self.log_throttle = log_throttle
+        self._columns = frozenset(
+            self.table_class.c.keys()  # type:ignore[attr-defined]
+        )
 
         assert (
             session_factory is not None
         ), "Session factory is required for AlchemyRepo"
+        assert (
+            prepare_threshold is None or prepare_threshold >= 0
+        ), "Prepare threshold must not be negative."
         assert hasattr(self.table_class, self.pk_field_name) or hasattr(
             self.table_class.c, self.pk_field_name
         ), "Wrong pk_field_name"
+        assert not is_soft_deletable or hasattr(
+            self.table_class.c, self.soft_delete_marker.column
+        ), "Wrong soft_delete_marker column"
+        assert version_column is None or hasattr(
+            self.table_class.c, version_column
+        ), "Wrong version_column"
 
-    @handle_error
-    @session
-    @convert(orm="alchemy")
+    @repo_method(invalidates=True, session=True)
     def create(
         self,
         entity: TEntity,
         *,
         convert_to: Type[TDataclass] | None = None,
+        returning_: returning = returning.row,
         session: TSession | None = None,
-    ) -> TResultDataclass | TResultORM:
+    ) -> TResultDataclass | TResultORM | TPrimaryKey | None:
         session = cast(TSession, session)
-        return session.execute(  # type:ignore[return-value]
-            insert(self.table_class)
-            .values(**asdict(entity))
-            .returning(self.table_class)
-        ).one()
+        qs = insert(self.table_class).values(**self._extract(entity))
+        if returning_ == returning.row:
+            return self._insert_returning_row(
+                qs=qs, convert_to=convert_to, session=session
+            )
+        result = session.execute(qs)
+        if returning_ == returning.pk:
+            # NOTE: fetched with RETURNING or cursor.lastrowid,
+            # depending on dialect
+            return result.inserted_primary_key[0]
+        return None
 
-    @handle_error
-    @strict
-    @session
-    @convert(orm="alchemy")
+    @repo_method(invalidates=True, session=True, convert=True, many=True, orm="alchemy")
+    def bulk_create(
+        self,
+        entities: Sequence[TEntity],
+        *,
+        convert_to: Type[TDataclass] | None = None,
+        batch_size: int = 1000,
+        returning_: returning = returning.none,
+        session: TSession | None = None,
+    ) -> int | List[TResultDataclass | TResultORM | TPrimaryKey]:
+        session = cast(TSession, session)
+        if returning_ == returning.none:
+            self._insert_batches(
+                batched(entities, batch_size=batch_size),
+                progress=StreamProgress(),
+                session=session,
+            )
+            return len(entities)
+
+        qs = insert(self.table_class).returning(
+            *(
+                (self.table_class,)
+                if returning_ == returning.row
+                else (self.table_class.c[self.pk_field_name],)  # type:ignore[index]
+            ),
+            sort_by_parameter_order=True,
+        )
+        inserted: List = []
+        for batch in batched(entities, batch_size=batch_size):
+            result = session.execute(qs, [self._extract(entity) for entity in batch])
+            inserted.extend(
+                result.all() if returning_ == returning.row else result.scalars()
+            )
+        return inserted
+
+    @repo_method(invalidates=True)
+    def create_stream(
+        self,
+        entities: Iterable[TEntity],
+        *,
+        batch_size: int = 1000,
+        commit_every: int = 1,
+        flush_interval: float | None = None,
+        on_progress: Callable[[StreamStats], None] | None = None,
+        session: TSession | None = None,
+    ) -> StreamStats:
+        assert commit_every > 0, "Number of batches per commit must be positive."
+        progress = StreamProgress(on_progress)
+        batches = batched(
+            entities, batch_size=batch_size, flush_interval=flush_interval
+        )
+        if session is not None:
+            # NOTE: caller-managed transaction is committed by the caller
+            self._insert_batches(batches, progress=progress, session=session)
+            return progress.stats()
+
+        for first in batches:
+            self._insert_batches(
+                chain((first,), islice(batches, commit_every - 1)),
+                progress=progress,
+            )
+            progress.committed()
+        return progress.stats()
+
+    @repo_method(
+        strict=True, singleflight=True, session=True, convert=True, orm="alchemy"
+    )
     def get_by_field(
         self,
         *,
@@ -114,21 +246,18 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> TResultDataclass | TResultORM | None:
-        session = cast(TSession, session)
-        qs = self._resolve_extra(
-            qs=self._select(),
-            extra=extra,
-        ).filter(
-            self.table_class.c[name]  # type:ignore[index]
-            == value
+        return self._get_by_field(  # type:ignore[return-value]
+            name, value, strict=strict, extra=extra, session=cast(TSession, session)
         )
-        first = session.execute(qs).first()
-        return get_object_or_404(first)  # type:ignore[return-value]
 
-    @handle_error
-    @strict
-    @session
-    @convert(orm="alchemy")
+    @repo_method(
+        strict=True,
+        cached=True,
+        singleflight=True,
+        session=True,
+        convert=True,
+        orm="alchemy",
+    )
     def get_by_filters(
         self,
         *,
@@ -139,15 +268,16 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         session: TSession | None = None,
     ) -> TResultDataclass | TResultORM | None:
         session = cast(TSession, session)
-        qs = self._resolve_extra(
-            qs=self._select(),
-            extra=extra,
-        ).filter(filters.compile())
+        qs = self._filter(self._resolve_extra(qs=self._select(), extra=extra), filters)
         first = session.execute(qs).first()
+        if not strict:
+            # NOTE: expected miss is returned as is, without raising
+            return first  # type:ignore[return-value]
         return get_object_or_404(first)  # type:ignore[return-value]
 
-    @handle_error
-    @session
+    @repo_method(
+        strict=True, singleflight=True, session=True, convert=True, orm="alchemy"
+    )
     def get_by_pk(
         self,
         pk: TPrimaryKey,
@@ -157,19 +287,56 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> TResultDataclass | TResultORM | None:
-        session = cast(TSession, session)
-        return self.get_by_field(
-            name=self.pk_field_name,
-            value=pk,
+        return self._get_by_field(  # type:ignore[return-value]
+            self.pk_field_name,
+            pk,
             strict=strict,
             extra=extra,
-            session=session,
+            session=cast(TSession, session),
+        )
+
+    @repo_method(session=True)
+    def get_many_by_field(
+        self,
+        name: str,
+        values: Iterable[TFieldValue],
+        *,
+        convert_to: Type[TDataclass] | None = None,
+        extra: Extra | None = None,
+        batch_size: int = 1000,
+        session: TSession | None = None,
+    ) -> Dict[Any, TResultDataclass | TResultORM]:
+        return self._get_many_by_field(
+            name,
+            values,
             convert_to=convert_to,
+            extra=extra,
+            batch_size=batch_size,
+            session=cast(TSession, session),
         )
 
-    @handle_error
-    @session
-    @convert(orm="alchemy", many=True)
+    @repo_method(session=True)
+    def get_many_by_pks(
+        self,
+        pks: Iterable[TPrimaryKey],
+        *,
+        convert_to: Type[TDataclass] | None = None,
+        extra: Extra | None = None,
+        batch_size: int = 1000,
+        session: TSession | None = None,
+    ) -> Dict[Any, TResultDataclass | TResultORM]:
+        return self._get_many_by_field(
+            self.pk_field_name,
+            pks,
+            convert_to=convert_to,
+            extra=extra,
+            batch_size=batch_size,
+            session=cast(TSession, session),
+        )
+
+    @repo_method(
+        singleflight=True, session=True, convert=True, many=True, orm="alchemy"
+    )
     def all(
         self,
         *,
@@ -178,13 +345,17 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         session: TSession | None = None,
     ) -> Iterable[TResultDataclass | TResultORM]:
         session = cast(TSession, session)
-        return session.execute(  # type:ignore[return-value] # Though Result is iterable
-            self._resolve_extra(qs=self._select(), extra=extra)
-        ).all()
+        qs = self._statement(
+            "all",
+            session=session,
+            extra=extra,
+            build=lambda: self._resolve_extra(qs=self._select(), extra=extra),
+        )
+        return session.execute(qs).all()  # type:ignore[return-value]
 
-    @handle_error
-    @session
-    @convert(orm="alchemy", many=True)
+    @repo_method(
+        singleflight=True, session=True, convert=True, many=True, orm="alchemy"
+    )
     def all_by_field(
         self,
         *,
@@ -195,17 +366,27 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         session: TSession | None = None,
     ) -> Iterable[TResultDataclass | TResultORM]:
         session = cast(TSession, session)
-        qs = self._resolve_extra(
-            qs=self._select(),
+        qs = self._statement(
+            "all_by_field",
+            name,
+            value is None,
+            session=session,
             extra=extra,
-        ).filter(
-            self.table_class.c[name] == value  # type:ignore[index]
+            build=lambda: self._resolve_extra(
+                qs=self._select(),
+                extra=extra,
+            ).filter(self._equals(name, value)),
         )
-        return cast(Iterable, session.execute(qs).all())
+        return cast(Iterable, session.execute(qs, {"value": value}).all())
 
-    @handle_error
-    @session
-    @convert(orm="alchemy", many=True)
+    @repo_method(
+        cached=True,
+        singleflight=True,
+        session=True,
+        convert=True,
+        many=True,
+        orm="alchemy",
+    )
     def all_by_filters(
         self,
         *,
@@ -214,15 +395,13 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> Iterable[TResultDataclass | TResultORM]:
-        session = cast(TSession, session)
-        qs = self._resolve_extra(
-            qs=self._select(),
-            extra=extra,
-        ).filter(filters.compile())
-        return cast(Iterable, session.execute(qs).all())
+        return self._all_by_filters(
+            filters=filters, extra=extra, session=cast(TSession, session)
+        )
 
-    @handle_error
-    @session
+    @repo_method(
+        singleflight=True, session=True, convert=True, many=True, orm="alchemy"
+    )
     def all_by_pks(
         self,
         pks: Sequence[TPrimaryKey],
@@ -233,8 +412,7 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
     ) -> Iterable[TResultDataclass | TResultORM]:
         if not pks:
             return []
-        session = cast(TSession, session)
-        return self.all_by_filters(
+        return self._all_by_filters(
             filters=AlchemyFilterSeq(
                 mode.and_,
                 AlchemyFilter(
@@ -245,52 +423,309 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
                 ),
             ),
             extra=extra,
+            session=cast(TSession, session),
+        )
+
+    @repo_method
+    def pluck(
+        self,
+        field: str,
+        *,
+        filters: IFilterSeq | None = None,
+        extra: Extra | None = None,
+        distinct: bool = False,
+        flat: bool = True,
+        chunk_size: int | None = None,
+        session: TSession | None = None,
+    ) -> Sequence[Any] | Iterator[Any]:
+        return self._values(
+            (field,),
+            filters=filters,
+            extra=extra,
+            distinct=distinct,
+            flat=flat,
+            chunk_size=chunk_size,
             session=session,
-            convert_to=convert_to,
         )
 
-    @handle_error
-    @session
+    @repo_method
+    def values(
+        self,
+        fields: Sequence[str],
+        *,
+        filters: IFilterSeq | None = None,
+        extra: Extra | None = None,
+        distinct: bool = False,
+        chunk_size: int | None = None,
+        session: TSession | None = None,
+    ) -> Sequence[Tuple[Any, ...]] | Iterator[Tuple[Any, ...]]:
+        return self._values(
+            fields,
+            filters=filters,
+            extra=extra,
+            distinct=distinct,
+            flat=False,
+            chunk_size=chunk_size,
+            session=session,
+        )
+
+    @repo_method(
+        invalidates=True, session=True, expected=(NotFoundError, VersionConflictError)
+    )
     def update(
         self,
         pk: TPrimaryKey,
         *,
         values: Mapping[str, TFieldValue],
+        expected_version: int | None = None,
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> None:
-        if not values:
-            return
+        self._update_by_pk(
+            pk,
+            values=values,
+            expected_version=expected_version,
+            extra=extra,
+            session=cast(TSession, session),
+        )
+
+    @repo_method(
+        invalidates=True, session=True, expected=(NotFoundError, VersionConflictError)
+    )
+    def save(
+        self,
+        entity: TEntity,
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> bool:
         session = cast(TSession, session)
-        session.execute(
-            self._resolve_extra(qs=self._update(), extra=extra)
-            .filter(self.table_class.c[self.pk_field_name] == pk)  # type:ignore[index]
-            .values(**values)
+        values = self._changed_values(entity)
+        version = self.version_column
+        expected_version: Any = None
+        if version is not None:
+            # NOTE: version is managed by the repo, it is not user-updatable
+            values.pop(version, None)
+            expected_version = getattr(entity, version)
+        if not values:
+            return False
+        self._update_by_pk(
+            getattr(entity, self.pk_field_name),
+            values=values,
+            expected_version=expected_version,
+            extra=extra,
+            session=session,
         )
+        if version is not None:
+            setattr(entity, version, expected_version + 1)
+        if self.change_tracker is not None:
+            self.change_tracker.track(entity)
+        return True
 
-    @handle_error
-    @session
+    @repo_method(
+        invalidates=True, session=True, expected=(NotFoundError, VersionConflictError)
+    )
     def multi_update(
         self,
         pks: Sequence[TPrimaryKey],
         *,
         values: Mapping[str, TFieldValue],
+        expected_versions: Mapping[Any, int] | None = None,
         extra: Extra | None = None,
         session: TSession | None = None,
     ) -> None:
         if not pks or not values:
             return
         session = cast(TSession, session)
-        session.execute(
+        pk = self.table_class.c[self.pk_field_name]  # type:ignore[index]
+        qs = (
             self._resolve_extra(qs=self._update(), extra=extra)
-            .filter(
-                self.table_class.c[self.pk_field_name].in_(pks)  # type:ignore[index]
-            )
+            .filter(pk.in_(pks))
             .values(**values)
         )
+        if expected_versions is None:
+            session.execute(self._versioned(qs))
+            return
+        self._update_versions(
+            qs, pks=pks, expected_versions=expected_versions, session=session
+        )
 
-    @handle_error
-    @session
+    @repo_method(invalidates=True)
+    def update_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        values: Mapping[str, TFieldValue],
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        if not values:
+            return 0
+        return self._write_by_filters(
+            qs=self._versioned(self._update().values(**values)),
+            filters=filters,
+            batch_size=batch_size,
+            extra=extra,
+            session=session,
+        )
+
+    @repo_method(
+        invalidates=True, session=True, expected=(NotFoundError, VersionConflictError)
+    )
+    def bulk_update(
+        self,
+        values: Mapping[Any, Mapping[str, TFieldValue]],
+        *,
+        deltas: Mapping[Any, Mapping[str, TNumber]] | None = None,
+        expected_versions: Mapping[Any, int] | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        session = cast(TSession, session)
+        pk = self.table_class.c[self.pk_field_name]  # type:ignore[index]
+        whens: Dict[str, Dict[Any, Any]] = {}
+        for pk_, row in values.items():
+            for name, value in row.items():
+                whens.setdefault(name, {})[pk_] = literal(
+                    value, self.table_class.c[name].type  # type:ignore[index]
+                )
+        for pk_, delta_row in (deltas or {}).items():
+            for name, delta in delta_row.items():
+                column = whens.setdefault(name, {})
+                column[pk_] = (
+                    column.get(pk_, self.table_class.c[name])  # type:ignore[index]
+                    + delta
+                )
+        if not whens:
+            return 0
+        pks = {pk_ for column in whens.values() for pk_ in column}
+        qs = (
+            self._resolve_extra(qs=self._update(), extra=extra)
+            .filter(pk.in_(pks))
+            .values(
+                {
+                    name: case(
+                        column,
+                        value=pk,
+                        else_=self.table_class.c[name],  # type:ignore[index]
+                    )
+                    for name, column in whens.items()
+                }
+            )
+        )
+        if expected_versions is not None:
+            return self._update_versions(
+                qs, pks=pks, expected_versions=expected_versions, session=session
+            )
+        return session.execute(  # type:ignore[attr-defined]
+            self._versioned(qs)
+        ).rowcount
+
+    @repo_method(invalidates=True, session=True)
+    def increment(
+        self,
+        pk: TPrimaryKey,
+        field: str,
+        *,
+        by: TNumber = 1,
+        return_new: bool = False,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> TNumber | None:
+        new = self._increment(
+            qs=self._resolve_extra(qs=self._update(), extra=extra).filter(
+                self.table_class.c[self.pk_field_name] == pk  # type:ignore[index]
+            ),
+            deltas={field: by},
+            return_new=return_new,
+            session=cast(TSession, session),
+        )
+        return next(iter(new.values()), {}).get(field, None)
+
+    @repo_method(invalidates=True, session=True)
+    def multi_increment(
+        self,
+        pks: Sequence[TPrimaryKey],
+        deltas: Mapping[str, TNumber],
+        *,
+        return_new: bool = False,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Dict[Any, Dict[str, TNumber]] | None:
+        if not pks or not deltas:
+            return {} if return_new else None
+        new = self._increment(
+            qs=self._resolve_extra(qs=self._update(), extra=extra).filter(
+                self.table_class.c[self.pk_field_name].in_(pks)  # type:ignore[index]
+            ),
+            deltas=deltas,
+            return_new=return_new,
+            session=cast(TSession, session),
+        )
+        return new if return_new else None
+
+    @repo_method(invalidates=True)
+    def increment_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        deltas: Mapping[str, TNumber],
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        if not deltas:
+            return 0
+        return self._write_by_filters(
+            qs=self._versioned(self._update().values(self._increments(deltas))),
+            filters=filters,
+            batch_size=batch_size,
+            extra=extra,
+            session=session,
+        )
+
+    @repo_method(invalidates=True, session=True, convert=True, many=True, orm="alchemy")
+    def claim_batch(
+        self,
+        *,
+        filters: IFilterSeq,
+        limit: int,
+        values: Mapping[str, TFieldValue],
+        convert_to: Type[TDataclass] | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Sequence[TResultDataclass] | Sequence[TResultORM]:
+        assert limit > 0, "Claim limit must be positive."
+        assert values, "No values to set on claimed rows."
+        session = cast(TSession, session)
+        pk = self.table_class.c[self.pk_field_name]  # type:ignore[index]
+        extra = replace(
+            extra or Extra(),
+            for_update=True,
+            skip_locked=not (extra and extra.nowait),
+        )
+        pks = list(
+            session.execute(  # type:ignore[attr-defined]
+                self._filter(
+                    self._resolve_extra(qs=select(pk), extra=extra), filters
+                ).limit(limit)
+            ).scalars()
+        )
+        if not pks:
+            return []
+        rows = {
+            getattr(row, self.pk_field_name): row
+            for row in session.execute(  # type:ignore[attr-defined]
+                self._versioned(
+                    self._update().filter(pk.in_(pks)).values(**values)
+                ).returning(self.table_class)
+            )
+        }
+        # NOTE: RETURNING order is not guaranteed, claim order is restored
+        return [rows[pk_] for pk_ in pks]  # type:ignore[return-value]
+
+    @repo_method(invalidates=True, session=True)
     def delete(
         self,
         pk: TPrimaryKey,
@@ -299,14 +734,71 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         session: TSession | None = None,
     ) -> None:
         session = cast(TSession, session)
-        session.execute(
-            self._resolve_extra(qs=self._delete(), extra=extra).filter(
-                self.table_class.c[self.pk_field_name] == pk  # type:ignore[index]
-            )
+        qs = self._statement(
+            "delete",
+            session=session,
+            extra=extra,
+            build=lambda: self._resolve_extra(qs=self._delete(), extra=extra).filter(
+                self._equals(self.pk_field_name, pk)
+            ),
         )
+        session.execute(qs, {"value": pk})
 
-    @handle_error
-    @session
+    @repo_method(invalidates=True, session=True)
+    def multi_delete(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        batch_size: int = 1000,
+        soft: bool = False,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        assert batch_size > 0, "Batch size must be positive."
+        session = cast(TSession, session)
+        deleted = 0
+        for start in range(0, len(pks), batch_size):
+            end = start + batch_size
+            chunk = pks[start:end]
+            if soft:
+                deleted += self._soft_delete(pks=chunk, extra=extra, session=session)
+            else:
+                deleted += session.execute(  # type:ignore[attr-defined]
+                    self._resolve_extra(qs=self._delete(), extra=extra).filter(
+                        self.table_class.c[
+                            self.pk_field_name
+                        ].in_(  # type:ignore[index]
+                            chunk
+                        )
+                    )
+                ).rowcount
+        return deleted
+
+    @repo_method(invalidates=True, session=True)
+    def soft_delete(
+        self,
+        pk: TPrimaryKey,
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> None:
+        session = cast(TSession, session)
+        self._soft_delete(pks=[pk], extra=extra, session=session)
+
+    @repo_method(invalidates=True, session=True)
+    def bulk_soft_delete(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        if not pks:
+            return 0
+        session = cast(TSession, session)
+        return self._soft_delete(pks=pks, extra=extra, session=session)
+
+    @repo_method(invalidates=True, session=True)
     def delete_by_field(
         self,
         *,
@@ -316,14 +808,36 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         session: TSession | None = None,
     ) -> None:
         session = cast(TSession, session)
-        session.execute(
-            self._resolve_extra(qs=self._delete(), extra=extra).filter(
-                self.table_class.c[name] == value  # type:ignore[index]
-            )
+        qs = self._statement(
+            "delete_by_field",
+            name,
+            value is None,
+            session=session,
+            extra=extra,
+            build=lambda: self._resolve_extra(qs=self._delete(), extra=extra).filter(
+                self._equals(name, value)
+            ),
         )
+        session.execute(qs, {"value": value})
 
-    @handle_error
-    @session
+    @repo_method(invalidates=True)
+    def delete_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        batch_size: int | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> int:
+        return self._write_by_filters(
+            qs=self._delete(),
+            filters=filters,
+            batch_size=batch_size,
+            extra=extra,
+            session=session,
+        )
+
+    @repo_method(singleflight=True, session=True)
     def exists_by_field(
         self,
         *,
@@ -333,16 +847,25 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         session: TSession | None = None,
     ) -> bool:
         session = cast(TSession, session)
-        qs = (
-            self._resolve_extra(qs=self._select(), extra=extra)
-            .filter(self.table_class.c[name] == value)  # type:ignore[index]
-            .limit(1)
+        qs = self._statement(
+            "exists_by_field",
+            name,
+            value is None,
+            session=session,
+            extra=extra,
+            build=lambda: select(
+                self._resolve_extra(
+                    qs=self._select_one(),
+                    extra=extra,
+                    ordered=False,
+                )
+                .filter(self._equals(name, value))
+                .exists()
+            ),
         )
-        result = session.execute(qs)
-        return result.first() is not None
+        return bool(session.execute(qs, {"value": value}).scalar())
 
-    @handle_error
-    @session
+    @repo_method(cached=True, singleflight=True, session=True)
     def exists_by_filters(
         self,
         *,
@@ -351,16 +874,37 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         session: TSession | None = None,
     ) -> bool:
         session = cast(TSession, session)
-        qs = (
-            self._resolve_extra(qs=self._select(), extra=extra)
-            .filter(filters.compile())
-            .limit(1)
+        qs = self._filter(
+            self._resolve_extra(qs=self._select_one(), extra=extra, ordered=False),
+            filters,
         )
-        result = session.execute(qs)
-        return result.first() is not None
+        return bool(session.execute(select(qs.exists())).scalar())
 
-    @handle_error
-    @session
+    @repo_method(singleflight=True, session=True)
+    def exists_by_pks(
+        self,
+        pks: Sequence[TPrimaryKey],
+        *,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Set[TPrimaryKey]:
+        if not pks:
+            return set()
+        session = cast(TSession, session)
+        column = self.table_class.c[self.pk_field_name]  # type:ignore[index]
+        qs = self._statement(
+            "exists_by_pks",
+            session=session,
+            extra=extra,
+            build=lambda: self._resolve_extra(
+                qs=select(column),
+                extra=extra,
+                ordered=False,
+            ).filter(column.in_(bindparam("pks", expanding=True))),
+        )
+        return set(session.execute(qs, {"pks": list(pks)}).scalars())
+
+    @repo_method(singleflight=True, session=True)
     def count_by_field(
         self,
         *,
@@ -379,8 +923,7 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
             .count()
         )
 
-    @handle_error
-    @session
+    @repo_method(cached=True, singleflight=True, session=True)
     def count_by_filters(
         self,
         *,
@@ -389,20 +932,121 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
         session: TSession | None = None,
     ) -> int:
         session = cast(TSession, session)
-        return (
-            self._resolve_extra(
-                qs=self._query(session),
-                extra=extra,
+        return self._filter(
+            self._resolve_extra(qs=self._query(session), extra=extra), filters
+        ).count()
+
+    @overload
+    def scan_partitions(
+        self,
+        n: int,
+        *,
+        by: str | None = None,
+        filters: IFilterSeq[ColumnElement[bool]] | None = None,
+        convert_to: None = None,
+        extra: Extra | None = None,
+        max_workers: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        processes: int | None = None,
+    ) -> Iterator[TResultORM]: ...
+
+    @overload
+    def scan_partitions(
+        self,
+        n: int,
+        *,
+        by: str | None = None,
+        filters: IFilterSeq[ColumnElement[bool]] | None = None,
+        convert_to: Type[TResultDataclass],
+        extra: Extra | None = None,
+        max_workers: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        processes: int | None = None,
+    ) -> Iterator[TResultDataclass]: ...
+
+    def scan_partitions(
+        self,
+        n: int,
+        *,
+        by: str | None = None,
+        filters: IFilterSeq[ColumnElement[bool]] | None = None,
+        convert_to: Type[TResultDataclass] | None = None,
+        extra: Extra | None = None,
+        max_workers: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        processes: int | None = None,
+    ) -> Iterator[TResultDataclass | TResultORM]:
+        by = by or self.pk_field_name
+        low, high = self._bounds(by=by, filters=filters, extra=extra)
+        if low is None or high is None:
+            return iter(())
+
+        loaders: List[Callable[[], Iterable[Any]]] = []
+        for start, end in split_range(low, high, n):
+            partition: List = [
+                AlchemyFilter(self.table_class, by, start, operator.ge),
+                AlchemyFilter(self.table_class, by, end, operator.le),
+            ]
+            if filters is not None:
+                partition.append(filters)
+            loaders.append(
+                functools.partial(
+                    self._load_partition,
+                    filters=AlchemyFilterSeq(mode.and_, *partition),
+                    convert_to=convert_to,
+                    extra=extra,
+                )
             )
-            .filter(filters.compile())
-            .count()
+        return fan_out(
+            loaders,
+            max_workers=max_workers,
+            transform=transform,
+            processes=processes,
         )
 
+    def soft_delete_index(self, name: str, *columns: str, **kwargs: Any) -> Index:
+        """Build partial index matching soft delete filter of this repo
+
+        Args:
+            name (str): Name of the index
+            *columns (str): Names of the indexed columns
+            **kwargs (Any): Extra Index params, e.g. `unique=True`
+
+        Returns:
+            Index: Partial index for PostgreSQL and SQLite
+        """
+        return _soft_delete_index(
+            name,
+            self.table_class,
+            *columns,
+            marker=self.soft_delete_marker,
+            **kwargs,
+        )
+
+    def subquery(
+        self,
+        field: str,
+        *,
+        filters: IFilterSeq | None = None,
+        extra: Extra | None = None,
+    ) -> Select:
+        qs = self._resolve_extra(
+            qs=select(self.table_class.c[field]),  # type:ignore[index]
+            extra=extra,
+            ordered=False,
+        )
+        if filters is not None:
+            qs = self._filter(qs, filters)
+        return qs
+
     """ Low-level API """
 
     def _select(self) -> Select:
         return select(self.table_class)
 
+    def _select_one(self) -> Select:
+        return select(literal(1)).select_from(self.table_class)
+
     def _update(self) -> Update:
         return update(self.table_class)
 
@@ -412,29 +1056,482 @@ class AlchemyRepo(IRepo[TTable, TResultORM]):
     def _query(self, session: TSession) -> Query:  # type:ignore[misc]
         return session.query(self.table_class)
 
+    # NOTE: fast paths below are not decorated, so public methods
+    # share them without re-entering decorators of each other
+
+    def _get_by_field(
+        self,
+        name: str,
+        value: TFieldValue,
+        *,
+        strict: bool,
+        extra: Extra | None,
+        session: Session,
+    ) -> Row | None:
+        qs = self._statement(
+            "get_by_field",
+            name,
+            value is None,
+            session=session,
+            extra=extra,
+            build=lambda: self._resolve_extra(
+                qs=self._select(),
+                extra=extra,
+            ).filter(self._equals(name, value)),
+        )
+        first = session.execute(
+            qs, {"value": value}
+        ).first()  # type:ignore[attr-defined]
+        if not strict:
+            # NOTE: expected miss is returned as is, without raising
+            return first
+        return get_object_or_404(first)
+
+    def _get_many_by_field(
+        self,
+        name: str,
+        values: Iterable[TFieldValue],
+        *,
+        convert_to: Type[TDataclass] | None,
+        extra: Extra | None,
+        batch_size: int,
+        session: Session,
+    ) -> Dict[Any, TResultDataclass | TResultORM]:
+        column = self.table_class.c[name]  # type:ignore[index]
+        qs = self._statement(
+            "get_many_by_field",
+            name,
+            session=session,
+            extra=extra,
+            build=lambda: self._resolve_extra(qs=self._select(), extra=extra).filter(
+                column.in_(bindparam("values", expanding=True))
+            ),
+        )
+        unique = list(dict.fromkeys(values))
+        found: Dict[Any, Row] = {}
+        for batch in batched(unique, batch_size=batch_size):
+            for row in session.execute(qs, {"values": batch}):
+                found.setdefault(getattr(row, name), row)
+        # NOTE: only kept first rows are converted (and tracked)
+        keys = [value for value in unique if value in found]
+        return dict(
+            zip(
+                keys,
+                self._convert_many([found[key] for key in keys], convert_to=convert_to),
+            )
+        )
+
+    def _all_by_filters(
+        self,
+        *,
+        filters: IFilterSeq,
+        extra: Extra | None,
+        session: Session,
+    ) -> Iterable[TResultDataclass | TResultORM]:
+        qs = self._filter(self._resolve_extra(qs=self._select(), extra=extra), filters)
+        return cast(Iterable, session.execute(qs).all())
+
+    def _update_by_pk(
+        self,
+        pk: TPrimaryKey,
+        *,
+        values: Mapping[str, TFieldValue],
+        expected_version: int | None,
+        extra: Extra | None,
+        session: Session,
+    ) -> None:
+        if not values:
+            return
+        updated = session.execute(
+            self._versioned(
+                self._resolve_extra(qs=self._update(), extra=extra)
+                .filter(
+                    self.table_class.c[self.pk_field_name] == pk  # type:ignore[index]
+                )
+                .values(**values),
+                expected_version=expected_version,
+            )
+        ).rowcount
+        if expected_version is not None and not updated:
+            raise VersionConflictError(
+                f"Row {pk} is not found with version {expected_version}."
+            )
+
+    def _load_partition(
+        self,
+        *,
+        filters: IFilterSeq,
+        convert_to: Type[TResultDataclass] | None = None,
+        extra: Extra | None = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Any]:
+        # NOTE: partition is streamed by chunks on its own session,
+        # which is kept open until the generator is exhausted or closed
+        qs = self._filter(self._resolve_extra(qs=self._select(), extra=extra), filters)
+        with self.session_factory() as session:  # type:ignore[misc,operator]
+            result = session.execute(qs.execution_options(yield_per=chunk_size))
+            for rows in result.partitions():
+                yield from self._convert_many(rows, convert_to=convert_to)
+
+    @session
+    def _bounds(
+        self,
+        *,
+        by: str,
+        filters: IFilterSeq | None = None,
+        extra: Extra | None = None,
+        session: TSession | None = None,
+    ) -> Tuple[Any, Any]:
+        session = cast(TSession, session)
+        column = self.table_class.c[by]  # type:ignore[index]
+        qs = self._resolve_extra(
+            qs=select(func.min(column), func.max(column)),
+            # NOTE: aggregates can be neither locked nor ordered
+            extra=Extra(
+                include_soft_deleted=bool(extra and extra.include_soft_deleted)
+            ),
+            ordered=False,
+        )
+        if filters is not None:
+            qs = self._filter(qs, filters)
+        return tuple(session.execute(qs).one())  # type:ignore[return-value]
+
+    def _write_by_filters(
+        self,
+        *,
+        qs: TStatement,
+        filters: IFilterSeq,
+        batch_size: int | None,
+        extra: Extra | None,
+        session: TSession | None,
+    ) -> int:
+        qs = self._filter(self._resolve_extra(qs=qs, extra=extra), filters)
+        if batch_size is None:
+            return self._execute(qs=qs, session=session)
+
+        assert batch_size > 0, "Batch size must be positive."
+        pk = self.table_class.c[self.pk_field_name]  # type:ignore[index]
+        total, last = 0, None
+        while True:
+            # NOTE: without caller session every batch is committed separately,
+            # so locks are held for one batch only
+            pks = self._next_pks(
+                filters=filters,
+                after=last,
+                batch_size=batch_size,
+                extra=extra,
+                session=session,
+            )
+            if pks:
+                total += self._execute(qs=qs.filter(pk.in_(pks)), session=session)
+            if len(pks) < batch_size:
+                return total
+            last = pks[-1]
+
+    def _values(
+        self,
+        fields: Sequence[str],
+        *,
+        filters: IFilterSeq | None,
+        extra: Extra | None,
+        distinct: bool,
+        flat: bool,
+        chunk_size: int | None,
+        session: TSession | None,
+    ) -> List[Any] | Iterator[Any]:
+        if distinct:
+            # NOTE: distinct rows can be ordered by selected columns only
+            extra = replace(
+                extra or Extra(), ordering=(extra and extra.ordering) or tuple(fields)
+            )
+        columns = [self.table_class.c[field] for field in fields]  # type:ignore[index]
+        qs = self._resolve_extra(qs=select(*columns), extra=extra)
+        if filters is not None:
+            qs = self._filter(qs, filters)
+        if distinct:
+            qs = qs.distinct()
+        if chunk_size is None:
+            return list(self._fetch(qs, flat=flat, session=session))
+        assert chunk_size > 0, "Chunk size must be positive."
+        return self._fetch(
+            qs.execution_options(yield_per=chunk_size), flat=flat, session=session
+        )
+
+    def _fetch(
+        self, qs: Select, *, flat: bool, session: TSession | None
+    ) -> Iterator[Any]:
+        # NOTE: generator keeps its own session open until exhausted,
+        # so rows can be streamed
+        if session is None:
+            with self.session_factory() as session:  # type:ignore[misc,operator]
+                yield from self._fetch(qs, flat=flat, session=session)
+            return
+        result = session.execute(qs)  # type:ignore[attr-defined]
+        if flat:
+            yield from result.scalars()
+        else:
+            yield from result.tuples()
+
+    @convert(orm="alchemy", many=True)
+    def _convert_many(
+        self,
+        rows: Sequence[Row],
+        *,
+        convert_to: Type[TDataclass] | None = None,
+    ) -> Iterable[TResultDataclass | TResultORM]:
+        return rows  # type:ignore[return-value]
+
+    @convert(orm="alchemy")
+    def _insert_returning_row(
+        self,
+        *,
+        qs: Insert,
+        convert_to: Type[TDataclass] | None = None,
+        session: TSession,  # type:ignore[misc]
+    ) -> TResultDataclass | TResultORM:
+        return session.execute(  # type:ignore[attr-defined,return-value]
+            qs.returning(self.table_class)
+        ).one()
+
+    @session
+    def _insert_batches(
+        self,
+        batches: Iterable[List[TEntity]],
+        *,
+        progress: StreamProgress,
+        session: TSession | None = None,
+    ) -> None:
+        session = cast(TSession, session)
+        for batch in batches:
+            # NOTE: executemany is sent as multi-row inserts
+            # by dialects supporting "insertmanyvalues"
+            session.execute(
+                insert(self.table_class), [self._extract(entity) for entity in batch]
+            )
+            progress.flushed(len(batch))
+
+    @session
+    def _next_pks(
+        self,
+        *,
+        filters: IFilterSeq,
+        after: TPrimaryKey | None,
+        batch_size: int,
+        extra: Extra | None,
+        session: TSession | None = None,
+    ) -> List[TPrimaryKey]:
+        session = cast(TSession, session)
+        pk = self.table_class.c[self.pk_field_name]  # type:ignore[index]
+        qs = self._resolve_extra(
+            qs=select(pk),
+            # NOTE: batch rows are locked by the write itself
+            extra=Extra(
+                include_soft_deleted=bool(extra and extra.include_soft_deleted)
+            ),
+            ordered=False,
+        )
+        qs = self._filter(qs, filters)
+        if after is not None:
+            qs = qs.filter(pk > after)
+        return list(session.execute(qs.order_by(pk).limit(batch_size)).scalars())
+
+    @session
+    def _execute(
+        self,
+        *,
+        qs: TStatement,
+        session: TSession | None = None,
+    ) -> int:
+        session = cast(TSession, session)
+        return session.execute(qs).rowcount  # type:ignore[attr-defined]
+
+    def _increment(
+        self,
+        *,
+        qs: Update,
+        deltas: Mapping[str, TNumber],
+        return_new: bool,
+        session: TSession,  # type:ignore[misc]
+    ) -> Dict[Any, Dict[str, TNumber]]:
+        qs = self._versioned(qs.values(self._increments(deltas)))
+        if not return_new:
+            session.execute(qs)  # type:ignore[attr-defined]
+            return {}
+        rows = session.execute(  # type:ignore[attr-defined]
+            qs.returning(
+                self.table_class.c[self.pk_field_name],  # type:ignore[index]
+                *(self.table_class.c[name] for name in deltas),  # type:ignore[index]
+            )
+        )
+        return {row[0]: dict(zip(deltas, row[1:])) for row in rows}
+
+    def _soft_delete(
+        self,
+        *,
+        pks: Sequence[TPrimaryKey],
+        extra: Extra | None,
+        session: TSession,  # type:ignore[misc]
+    ) -> int:
+        if not self.is_soft_deletable:
+            raise BaseRepoException("Table is not soft deletable.")
+        return session.execute(  # type:ignore[attr-defined]
+            self._resolve_extra(qs=self._update(), extra=extra)
+            .filter(
+                self.table_class.c[self.pk_field_name].in_(pks)  # type:ignore[index]
+            )
+            .values(
+                {
+                    self.soft_delete_marker.column: (
+                        self.soft_delete_marker.deleted_value()
+                    )
+                }
+            )
+        ).rowcount
+
     """ Utils """
 
+    def _statement(
+        self,
+        method: str,
+        *key: Hashable,
+        session: Session,
+        extra: Extra | None,
+        build: Callable[[], TStatement],
+    ) -> TStatement:
+        if self.prepare_threshold is not None:
+            self._prepare(session)
+        if self.statement_cache is None:
+            return build()
+        return self.statement_cache.get_or_build(
+            (
+                method,
+                *key,
+                # NOTE: fields of user-built Extra could be unhashable lists
+                fingerprint(extra),
+                self.is_soft_deletable,
+            ),
+            build,
+        )
+
+    def _versioned(self, qs: Update, *, expected_version: int | None = None) -> Update:
+        if self.version_column is None:
+            if expected_version is not None:
+                raise BaseRepoException("Table is not versioned.")
+            return qs
+        column = self.table_class.c[self.version_column]  # type:ignore[index]
+        qs = qs.values({self.version_column: column + 1})
+        if expected_version is not None:
+            qs = qs.filter(column == expected_version)
+        return qs
+
+    def _update_versions(
+        self,
+        qs: Update,
+        *,
+        pks: Iterable[Any],
+        expected_versions: Mapping[Any, int],
+        session: Session,
+    ) -> int:
+        if self.version_column is None:
+            raise BaseRepoException("Table is not versioned.")
+        unique_pks = set(pks)
+        missing = unique_pks.difference(expected_versions)
+        if missing:
+            raise BaseRepoException(
+                f"Expected versions are missing for rows {list(missing)}."
+            )
+        # NOTE: conflict rolls back the savepoint only, so no row is updated
+        # and the rest of the caller session transaction is kept
+        with session.begin_nested():
+            updated = session.execute(  # type:ignore[attr-defined]
+                self._versioned(qs).filter(
+                    tuple_(
+                        self.table_class.c[self.pk_field_name],  # type:ignore[index]
+                        self.table_class.c[self.version_column],  # type:ignore[index]
+                    ).in_([(pk, expected_versions[pk]) for pk in unique_pks])
+                )
+            ).rowcount
+            if updated != len(unique_pks):
+                raise VersionConflictError(
+                    f"{len(unique_pks) - updated} of {len(unique_pks)} rows "
+                    "are not found with expected versions."
+                )
+        return updated
+
+    def _prepare(self, session: Session) -> None:
+        connection = session.connection().connection.dbapi_connection
+        # NOTE: only psycopg 3 connections prepare statements server-side
+        if hasattr(connection, "prepare_threshold"):
+            connection.prepare_threshold = (  # type:ignore[union-attr]
+                self.prepare_threshold
+            )
+
+    def _increments(self, deltas: Mapping[str, TNumber]) -> Dict[str, Any]:
+        return {
+            name: self.table_class.c[name] + delta  # type:ignore[index]
+            for name, delta in deltas.items()
+        }
+
+    def _extract(self, entity: TEntity) -> Dict[str, Any]:
+        return field_extractor(type(entity), self._columns)(entity)
+
+    def _changed_values(self, entity: TEntity) -> Dict[str, Any]:
+        values = self._extract(entity)
+        changes = (
+            None if self.change_tracker is None else self.change_tracker.changes(entity)
+        )
+        if changes is not None:
+            # NOTE: untracked entities are saved with all fields
+            values = {name: value for name, value in values.items() if name in changes}
+        values.pop(self.pk_field_name, None)
+        return values
+
+    def _equals(self, name: str, value: TFieldValue) -> ColumnElement[bool]:
+        # NOTE: comparison with None must stay `IS NULL`,
+        # so it can not be replaced with a bind parameter
+        return self.table_class.c[name] == (  # type:ignore[index]
+            None if value is None else bindparam("value")
+        )
+
     def _resolve_extra(
         self,
         *,
         qs: TQuery,
         extra: Extra | None,
+        ordered: bool = True,
     ) -> TQuery:
         if not extra:
             extra = Extra()
         if isinstance(qs, (Select, Query)) and extra.for_update:
-            qs = qs.with_for_update()
+            qs = qs.with_for_update(nowait=extra.nowait, skip_locked=extra.skip_locked)
         if self.is_soft_deletable and not extra.include_soft_deleted:
             qs = qs.filter(
-                self.table_class.c["is_deleted"]  # type:ignore[index]
-                == False  # noqa:E712
+                AlchemyFilter(
+                    self.table_class,
+                    self.soft_delete_marker.column,
+                    self.soft_delete_marker.alive,
+                    self.soft_delete_marker.operator_,
+                ).compile()
             )
-        if isinstance(qs, (Select, Query)):
+        if ordered and isinstance(qs, (Select, Query)):
             qs = qs.order_by(
                 *self._compile_order_by(extra.ordering or self.default_ordering)
             )
         return qs
 
+    def _filter(self, qs: TQuery, filters: IFilterSeq) -> TQuery:
+        joins: Tuple[Join, ...] = getattr(filters, "joins", ())
+        if not joins:
+            return qs.filter(filters.compile())
+        if isinstance(qs, (Select, Query)):
+            for join in joins:
+                qs = qs.join(join.target, join.onclause, isouter=join.isouter)
+            return qs.filter(filters.compile())
+        # NOTE: UPDATE/DELETE cannot be joined portably,
+        # so joined filters are applied via semi-join on pk
+        pk = self.table_class.c[self.pk_field_name]  # type:ignore[index]
+        return qs.filter(pk.in_(self._filter(select(pk), filters)))
+
     def _compile_order_by(self, ordering: Tuple[str, ...]) -> List:
         compiled = []
         for column in ordering:
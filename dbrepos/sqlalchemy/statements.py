@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+from dbrepos.core.types import CacheStats
+
+TStatement = TypeVar("TStatement")
+
+
+class StatementCache(Generic[TStatement]):
+    """LRU cache of ready-to-execute statements with bind parameters
+
+    Statements are built once per key (method, field name, extra, ...)
+    and then executed with different parameter values,
+    so `select`, `_resolve_extra` and ordering compilation
+    are not repeated on every call.
+
+    NOTE: server-side prepared statements are a driver-level setting,
+    `AlchemyRepo(prepare_threshold=...)` applies it to the connection
+    that executes cached statements (psycopg 3 only, other drivers
+    do not prepare statements server-side). Cached statements keep
+    the SQL text stable, so they are prepared once per connection.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Args:
+            maxsize (int, optional): Maximum number of cached statements.
+                Defaults to 128
+        """
+        assert maxsize > 0, "Cache size must be positive."
+        self.maxsize = maxsize
+        self._statements: OrderedDict[Hashable, TStatement] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_build(
+        self, key: Hashable, build: Callable[[], TStatement]
+    ) -> TStatement:
+        """Get statement by key or build and cache it
+
+        Args:
+            key (Hashable): Statement key
+            build (Callable[[], TStatement]): Statement builder
+
+        Returns:
+            TStatement: Cached or just built statement
+        """
+        with self._lock:
+            statement = self._statements.get(key, None)
+            if statement is not None:
+                self._statements.move_to_end(key)
+                self._hits += 1
+                return statement
+            self._misses += 1
+
+        statement = build()
+        with self._lock:
+            self._statements[key] = statement
+            if len(self._statements) > self.maxsize:
+                self._statements.popitem(last=False)
+        return statement
+
+    def stats(self) -> CacheStats:
+        """Cache hit/miss statistics
+
+        Returns:
+            CacheStats: Current statistics
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._statements),
+            )
+
+    def clear(self) -> None:
+        """Drop all cached statements and reset statistics"""
+        with self._lock:
+            self._statements.clear()
+            self._hits = 0
+            self._misses = 0
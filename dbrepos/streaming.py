@@ -0,0 +1,96 @@
+import time
+from typing import Callable, Iterable, Iterator, List, TypeVar
+
+from dbrepos.core.types import StreamStats
+
+TItem = TypeVar("TItem")
+
+
+def batched(
+    items: Iterable[TItem],
+    *,
+    batch_size: int,
+    flush_interval: float | None = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> Iterator[List[TItem]]:
+    """Lazily group items into batches
+
+    Only the current batch is kept in memory.
+
+    Args:
+        items (Iterable[TItem]): Items to group, pulled one by one
+        batch_size (int): Maximum size of the batch
+        flush_interval (float | None, optional): Yield incomplete batch
+            if this many seconds passed since the previous one.
+            Checked when the next item is pulled. Defaults to None
+        clock (Callable[[], float], optional): Time source.
+            Defaults to time.monotonic
+
+    Yields:
+        List[TItem]: Non-empty batches
+    """
+    assert batch_size > 0, "Batch size must be positive."
+    batch: List[TItem] = []
+    flushed_at = clock()
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size or (
+            flush_interval is not None and clock() - flushed_at >= flush_interval
+        ):
+            yield batch
+            batch = []
+            flushed_at = clock()
+    if batch:
+        yield batch
+
+
+class StreamProgress:
+    """Progress accumulator of streaming inserts"""
+
+    def __init__(
+        self,
+        on_progress: Callable[[StreamStats], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            on_progress (Callable[[StreamStats], None] | None, optional):
+                Called with current statistics after every flushed batch.
+                Defaults to None
+            clock (Callable[[], float], optional): Time source.
+                Defaults to time.monotonic
+        """
+        self.on_progress = on_progress
+        self._clock = clock
+        self._started_at = clock()
+        self._rows = 0
+        self._batches = 0
+        self._commits = 0
+
+    def flushed(self, rows: int) -> None:
+        """Register flushed batch
+
+        Args:
+            rows (int): Number of rows in the batch
+        """
+        self._rows += rows
+        self._batches += 1
+        if self.on_progress is not None:
+            self.on_progress(self.stats())
+
+    def committed(self) -> None:
+        """Register committed transaction"""
+        self._commits += 1
+
+    def stats(self) -> StreamStats:
+        """Current statistics
+
+        Returns:
+            StreamStats: Current statistics
+        """
+        return StreamStats(
+            rows=self._rows,
+            batches=self._batches,
+            commits=self._commits,
+            elapsed=self._clock() - self._started_at,
+        )
@@ -0,0 +1,70 @@
+import random
+import threading
+import time
+from typing import Callable, Dict, Hashable
+
+
+class LogThrottle:
+    """Sampling and rate limiting of error log records
+
+    Records are throttled separately per key (e.g. exception type).
+    Record is logged only if it is sampled (with `sample_rate` probability)
+    and at least `min_interval` seconds passed since previous logged record
+    of the same key. Number of records of the key suppressed since previous
+    logged one is reported, so it can be appended to the next logged message.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: float = 1.0,
+        min_interval: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        """
+        Args:
+            sample_rate (float, optional): Share of records to log, from 0 to 1.
+                Defaults to 1.0
+            min_interval (float | None, optional): Minimum number of seconds
+                between logged records. None disables rate limiting.
+                Defaults to None
+            clock (Callable[[], float], optional): Time source.
+                Defaults to time.monotonic
+            rand (Callable[[], float], optional): Random number source.
+                Defaults to random.random
+        """
+        assert 0 <= sample_rate <= 1, "Sample rate must be between 0 and 1."
+        assert (
+            min_interval is None or min_interval >= 0
+        ), "Minimum interval must not be negative."
+        self.sample_rate = sample_rate
+        self.min_interval = min_interval
+        self._clock = clock
+        self._rand = rand
+        self._last: Dict[Hashable, float] = {}
+        self._suppressed: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable = None) -> int | None:
+        """Decide whether record should be logged
+
+        Args:
+            key (Hashable, optional): Key of similar records. Defaults to None
+
+        Returns:
+            int | None: Number of records of the key suppressed since previous
+                logged one if record should be logged, None otherwise
+        """
+        with self._lock:
+            if self.sample_rate < 1 and self._rand() >= self.sample_rate:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return None
+            if self.min_interval is not None:
+                now = self._clock()
+                last = self._last.get(key, None)
+                if last is not None and now - last < self.min_interval:
+                    self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                    return None
+                self._last[key] = now
+            return self._suppressed.pop(key, 0)
@@ -0,0 +1,84 @@
+import weakref
+from typing import Any, Dict, Tuple
+
+from dbrepos.core.extractors import field_reader
+
+
+class ChangeTracker:
+    """Snapshots of loaded entities for dirty checking on save
+
+    Every tracked entity is stored as a tuple of its field values,
+    keyed by the entity identity. Snapshots of garbage-collected entities
+    are dropped automatically. Entities that do not support weak references
+    (e.g. slotted dataclasses without `weakref_slot`) are kept
+    until untracked.
+
+    Values are compared shallowly, so in-place mutations of mutable field
+    values (e.g. appending to a list) are not detected,
+    assign a new value instead.
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: Dict[int, Tuple[Any, Tuple[Any, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __contains__(self, entity: Any) -> bool:
+        return self._get(entity) is not None
+
+    def track(self, entity: Any) -> Any:
+        """Snapshot current field values of the entity
+
+        Args:
+            entity (Any): Dataclass or class with `__slots__` instance
+
+        Returns:
+            Any: The same entity
+        """
+        key = id(entity)
+        _, read = field_reader(entity.__class__)
+        try:
+            ref: Any = weakref.ref(entity, lambda _: self._snapshots.pop(key, None))
+        except TypeError:
+            ref = entity
+        self._snapshots[key] = (ref, read(entity))
+        return entity
+
+    def untrack(self, entity: Any) -> None:
+        """Drop snapshot of the entity
+
+        Args:
+            entity (Any): Tracked entity
+        """
+        if self._get(entity) is not None:
+            del self._snapshots[id(entity)]
+
+    def changes(self, entity: Any) -> Dict[str, Any] | None:
+        """Fields changed since the entity was tracked
+
+        Args:
+            entity (Any): Tracked entity
+
+        Returns:
+            Dict[str, Any] | None: Changed {field_name: value}
+                or None if entity is not tracked
+        """
+        snapshot = self._get(entity)
+        if snapshot is None:
+            return None
+        names, read = field_reader(entity.__class__)
+        return {
+            name: value
+            for name, old, value in zip(names, snapshot, read(entity))
+            if value is not old and value != old
+        }
+
+    def _get(self, entity: Any) -> Tuple[Any, ...] | None:
+        entry = self._snapshots.get(id(entity), None)
+        if entry is None:
+            return None
+        ref, snapshot = entry
+        if (ref() if isinstance(ref, weakref.ref) else ref) is not entity:
+            return None
+        return snapshot
@@ -0,0 +1,323 @@
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from dbrepos.core.abstract import IRepo, TNumber
+from dbrepos.core.exceptions import BaseRepoException
+from dbrepos.core.types import WriteBehindStats
+
+logger = logging.getLogger(__name__)
+
+
+class _Change:
+    __slots__ = ("values", "deltas")
+
+    def __init__(self) -> None:
+        self.values: Dict[str, Any] = {}
+        self.deltas: Dict[str, Any] = {}
+
+    def set(self, values: Mapping[str, Any]) -> None:
+        for name, value in values.items():
+            self.values[name] = value
+            self.deltas.pop(name, None)
+
+    def add(self, name: str, by: TNumber) -> None:
+        if name in self.values:
+            self.values[name] += by
+        else:
+            self.deltas[name] = self.deltas.get(name, 0) + by
+
+    def then(self, later: "_Change") -> "_Change":
+        self.set(later.values)
+        for name, by in later.deltas.items():
+            self.add(name, by)
+        return self
+
+
+def _write_batch(repo: IRepo, items: List[Tuple[Any, _Change]]) -> None:
+    repo.bulk_update(
+        {pk: change.values for pk, change in items if change.values},
+        deltas={pk: change.deltas for pk, change in items if change.deltas},
+    )
+
+
+def _flush_periodically(
+    ref: "weakref.ref[WriteBehindBuffer]",
+    *,
+    stop: threading.Event,
+    wake: threading.Event,
+    interval: float,
+) -> None:
+    # NOTE: buffer is referenced weakly between flushes,
+    # so the thread does not keep dropped buffer alive
+    while not stop.is_set():
+        wake.wait(interval)
+        wake.clear()
+        buffer = ref()
+        if buffer is None or stop.is_set():
+            return
+        try:
+            buffer.flush()
+        except Exception as e:
+            buffer.logger.error(f"Write-behind flush error - {str(e)}", exc_info=e)
+        del buffer
+
+
+def _flush_dropped(
+    repo: IRepo,
+    *,
+    pending: Dict[Any, _Change],
+    lock: threading.Lock,
+    flush_lock: threading.Lock,
+    stop: threading.Event,
+    wake: threading.Event,
+    max_size: int,
+    logger: logging.Logger,
+) -> None:
+    """Write changes of not closed buffer, which is collected or open at exit"""
+    stop.set()
+    wake.set()
+    with flush_lock:
+        with lock:
+            items = list(pending.items())
+            pending.clear()
+        try:
+            for start in range(0, len(items), max_size):
+                end = start + max_size
+                _write_batch(repo, items[start:end])
+        except Exception as e:
+            logger.error(f"Write-behind flush error - {str(e)}", exc_info=e)
+
+
+class WriteBehindBuffer:
+    """Write-behind buffer of hot-row updates
+
+    Updates and increments are merged per primary key in memory
+    (last write wins for values, deltas are summed) and written
+    with one `bulk_update` call per flush. Buffer is flushed when
+    `max_size` rows are pending, every `flush_interval` seconds,
+    on `flush()` and on `close()`. Changes of buffer that is not closed
+    are written when it is garbage collected or at interpreter exit.
+
+    Buffered writes are not visible to repo reads until flushed
+    and are lost if the process is killed, so buffer only
+    changes that tolerate `flush_interval` staleness.
+    If flush fails, its changes are merged back and retried with the next flush.
+    """
+
+    def __init__(
+        self,
+        repo: IRepo,
+        *,
+        max_size: int = 1000,
+        flush_interval: float | None = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        logger: logging.Logger = logger,
+    ) -> None:
+        """
+        Args:
+            repo (IRepo): Repository to write rows with
+            max_size (int, optional): Number of pending rows that triggers flush,
+                also maximum number of rows written with one statement.
+                Defaults to 1000
+            flush_interval (float | None, optional): Seconds between
+                background flushes. Defaults to 1.0 (None means no background
+                thread, size-triggered flushes run in the writing thread)
+            clock (Callable[[], float], optional): Time source for latencies.
+                Defaults to time.monotonic
+            logger (logging.Logger, optional): Logger for background flush errors.
+                Defaults to module logger
+        """
+        assert max_size > 0, "Buffer size must be positive."
+        assert (
+            flush_interval is None or flush_interval > 0
+        ), "Flush interval must be positive."
+        self.repo = repo
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.logger = logger
+        self._clock = clock
+        self._pending: Dict[Any, _Change] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._closed = False
+        self._writes = 0
+        self._coalesced = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._flushed_rows = 0
+        self._last_flush_latency = 0.0
+        self._max_flush_latency = 0.0
+
+        self._thread: threading.Thread | None = None
+        if flush_interval is not None:
+            self._thread = threading.Thread(
+                target=_flush_periodically,
+                args=(weakref.ref(self),),
+                kwargs={
+                    "stop": self._stop,
+                    "wake": self._wake,
+                    "interval": flush_interval,
+                },
+                name="dbrepos-write-behind",
+                daemon=True,
+            )
+            self._thread.start()
+        # NOTE: finalizer does not reference the buffer, so it neither
+        # keeps the buffer alive nor needs it to write pending changes
+        self._finalizer = weakref.finalize(
+            self,
+            _flush_dropped,
+            repo,
+            pending=self._pending,
+            lock=self._lock,
+            flush_lock=self._flush_lock,
+            stop=self._stop,
+            wake=self._wake,
+            max_size=max_size,
+            logger=logger,
+        )
+
+    def update(self, pk: Any, *, values: Mapping[str, Any]) -> None:
+        """Buffer row update
+
+        Args:
+            pk (Any): Primary key of row to update
+            values (Mapping[str, Any]): Mapping with
+                format {field_name:new_value}
+
+        Raises:
+            BaseRepoException: If buffer is closed
+        """
+        if values:
+            self._write(pk, lambda change: change.set(values))
+
+    def increment(self, pk: Any, field: str, *, by: TNumber = 1) -> None:
+        """Buffer atomic increment of column value
+
+        Args:
+            pk (Any): Primary key of row to update
+            field (str): Numeric column name
+            by (TNumber, optional): Delta, negative one decrements.
+                Defaults to 1
+
+        Raises:
+            BaseRepoException: If buffer is closed
+        """
+        self._write(pk, lambda change: change.add(field, by))
+
+    def flush(self) -> int:
+        """Write pending changes
+
+        Raises:
+            Exception: Repository error, failed changes stay pending
+
+        Returns:
+            int: Number of written rows
+        """
+        with self._flush_lock:
+            with self._lock:
+                # NOTE: pending dict is shared with the finalizer,
+                # so it is cleared in place
+                items = list(self._pending.items())
+                self._pending.clear()
+            if not items:
+                return 0
+            written = 0
+            started_at = self._clock()
+            try:
+                for start in range(0, len(items), self.max_size):
+                    end = start + self.max_size
+                    _write_batch(self.repo, items[start:end])
+                    written = end
+            except Exception:
+                self._requeue(items[written:])
+                raise
+            latency = self._clock() - started_at
+            with self._lock:
+                self._flushes += 1
+                self._flushed_rows += len(items)
+                self._last_flush_latency = latency
+                self._max_flush_latency = max(self._max_flush_latency, latency)
+            return len(items)
+
+    def close(self) -> None:
+        """Stop background flushes and flush pending changes
+
+        Buffer does not accept writes after close. If the final flush fails,
+        buffer stays open with failed changes pending, so close can be retried.
+
+        Raises:
+            Exception: Repository error of the final flush
+        """
+        if self._closed:
+            return
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            # NOTE: size-triggered flushes run in the writing thread from now on
+            self._thread = None
+        while True:
+            self.flush()
+            with self._lock:
+                # NOTE: writes that raced with the flush are flushed too
+                if not self._pending:
+                    self._closed = True
+                    break
+        self._finalizer.detach()
+
+    def stats(self) -> WriteBehindStats:
+        """Buffer depth, coalescing and flush statistics
+
+        Returns:
+            WriteBehindStats: Current statistics
+        """
+        with self._lock:
+            return WriteBehindStats(
+                depth=len(self._pending),
+                writes=self._writes,
+                coalesced=self._coalesced,
+                flushes=self._flushes,
+                failed_flushes=self._failed_flushes,
+                flushed_rows=self._flushed_rows,
+                last_flush_latency=self._last_flush_latency,
+                max_flush_latency=self._max_flush_latency,
+            )
+
+    def __enter__(self) -> "WriteBehindBuffer":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _write(self, pk: Any, apply: Callable[[_Change], None]) -> None:
+        with self._lock:
+            if self._closed:
+                raise BaseRepoException("Write-behind buffer is closed.")
+            change = self._pending.get(pk, None)
+            if change is None:
+                change = self._pending[pk] = _Change()
+            else:
+                self._coalesced += 1
+            apply(change)
+            self._writes += 1
+            full = len(self._pending) >= self.max_size
+        if not full:
+            return
+        if self._thread is None:
+            self.flush()
+        else:
+            self._wake.set()
+
+    def _requeue(self, items: List[Tuple[Any, _Change]]) -> None:
+        with self._lock:
+            self._failed_flushes += 1
+            for pk, change in items:
+                # NOTE: changes buffered during the failed flush are newer
+                later = self._pending.get(pk, None)
+                self._pending[pk] = change if later is None else change.then(later)
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tables", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DjangoVersionedTable",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=100)),
+                ("version", models.IntegerField()),
+            ],
+            options={
+                "db_table": "versioned",
+                "ordering": ("id",),
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tables", "0002_djangoversionedtable"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DjangoCounterTable",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=100)),
+                ("value", models.IntegerField()),
+            ],
+            options={
+                "db_table": "counter",
+                "ordering": ("id",),
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tables", "0003_djangocountertable"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DjangoCustomerTable",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=100)),
+                ("country", models.CharField(max_length=100)),
+                (
+                    "referrer",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="tables.djangocustomertable",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "customer",
+                "ordering": ("id",),
+            },
+        ),
+        migrations.CreateModel(
+            name="DjangoPurchaseTable",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=100)),
+                (
+                    "customer",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="tables.djangocustomertable",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "purchase",
+                "ordering": ("id",),
+            },
+        ),
+    ]
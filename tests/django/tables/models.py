@@ -9,3 +9,48 @@ class DjangoTable(models.Model):
     class Meta:
         db_table = "table"
         ordering = ("id",)
+
+
+class DjangoVersionedTable(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    name = models.CharField(max_length=100)
+    version = models.IntegerField()
+
+    class Meta:
+        db_table = "versioned"
+        ordering = ("id",)
+
+
+class DjangoCounterTable(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    name = models.CharField(max_length=100)
+    value = models.IntegerField()
+
+    class Meta:
+        db_table = "counter"
+        ordering = ("id",)
+
+
+class DjangoCustomerTable(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    name = models.CharField(max_length=100)
+    country = models.CharField(max_length=100)
+    referrer = models.ForeignKey(
+        "self", null=True, on_delete=models.SET_NULL, related_name="+"
+    )
+
+    class Meta:
+        db_table = "customer"
+        ordering = ("id",)
+
+
+class DjangoPurchaseTable(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    name = models.CharField(max_length=100)
+    customer = models.ForeignKey(
+        DjangoCustomerTable, null=True, on_delete=models.SET_NULL, related_name="+"
+    )
+
+    class Meta:
+        db_table = "purchase"
+        ordering = ("id",)
@@ -12,3 +12,17 @@ class TableEntity:
     id: int
     name: str
     is_deleted: bool
+
+
+@dataclass
+class VersionedEntity:
+    id: int
+    name: str
+    version: int
+
+
+@dataclass
+class CounterEntity:
+    id: int
+    name: str
+    value: int
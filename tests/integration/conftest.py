@@ -7,10 +7,22 @@ import sqlalchemy as sa
 from dbrepos.core.abstract import IFilter, IFilterSeq
 from dbrepos.django.filters import DjangoFilter, DjangoFilterSeq
 from dbrepos.sqlalchemy.filters import AlchemyFilter, AlchemyFilterSeq
-from tests.django.tables.models import DjangoTable
+from tests.django.tables.models import (
+    DjangoCounterTable,
+    DjangoCustomerTable,
+    DjangoPurchaseTable,
+    DjangoTable,
+    DjangoVersionedTable,
+)
 from tests.integration.fixtures.django import *  # noqa:F401,F403
 from tests.integration.fixtures.sqlalchemy import *  # noqa:F401,F403
-from tests.sqlalchemy import AlchemyTable
+from tests.sqlalchemy import (
+    AlchemyCounterTable,
+    AlchemyCustomerTable,
+    AlchemyPurchaseTable,
+    AlchemyTable,
+    AlchemyVersionedTable,
+)
 
 DB_NAME = "test.db"
 # NOTE: I love django (or pytest-django?)
@@ -40,6 +52,39 @@ def init_db():
         "is_deleted BOOLEAN NOT NULL"
         ");"
     )
+    cursor.execute("DROP TABLE IF EXISTS 'versioned';")
+    cursor.execute(
+        "CREATE TABLE 'versioned'("
+        "id INTEGER PRIMARY KEY ASC,"
+        "name TEXT NOT NULL,"
+        "version INTEGER NOT NULL"
+        ");"
+    )
+    cursor.execute("DROP TABLE IF EXISTS 'counter';")
+    cursor.execute(
+        "CREATE TABLE 'counter'("
+        "id INTEGER PRIMARY KEY ASC,"
+        "name TEXT NOT NULL,"
+        "value INTEGER NOT NULL"
+        ");"
+    )
+    cursor.execute("DROP TABLE IF EXISTS 'purchase';")
+    cursor.execute("DROP TABLE IF EXISTS 'customer';")
+    cursor.execute(
+        "CREATE TABLE 'customer'("
+        "id INTEGER PRIMARY KEY ASC,"
+        "name TEXT NOT NULL,"
+        "country TEXT NOT NULL,"
+        "referrer_id INTEGER NULL REFERENCES 'customer'(id)"
+        ");"
+    )
+    cursor.execute(
+        "CREATE TABLE 'purchase'("
+        "id INTEGER PRIMARY KEY ASC,"
+        "name TEXT NOT NULL,"
+        "customer_id INTEGER NULL REFERENCES 'customer'(id)"
+        ");"
+    )
 
     cursor.close()
     connection.close()
@@ -49,11 +94,19 @@ def init_db():
 def stateless_db():
     with cursor() as curs:
         curs.execute("DELETE FROM 'table';")
+        curs.execute("DELETE FROM 'versioned';")
+        curs.execute("DELETE FROM 'counter';")
+        curs.execute("DELETE FROM 'purchase';")
+        curs.execute("DELETE FROM 'customer';")
 
     yield
 
     with cursor() as curs:
         curs.execute("DELETE FROM 'table';")
+        curs.execute("DELETE FROM 'versioned';")
+        curs.execute("DELETE FROM 'counter';")
+        curs.execute("DELETE FROM 'purchase';")
+        curs.execute("DELETE FROM 'customer';")
 
 
 class cursor:
@@ -70,9 +123,17 @@ class cursor:
 
 TABLE_TO_DJANGO = {
     "table": DjangoTable,
+    "versioned": DjangoVersionedTable,
+    "counter": DjangoCounterTable,
+    "customer": DjangoCustomerTable,
+    "purchase": DjangoPurchaseTable,
 }
 TABLE_TO_ALCHEMY = {
     "table": AlchemyTable,
+    "versioned": AlchemyVersionedTable,
+    "counter": AlchemyCounterTable,
+    "customer": AlchemyCustomerTable,
+    "purchase": AlchemyPurchaseTable,
 }
 
 
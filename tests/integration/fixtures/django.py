@@ -1,7 +1,13 @@
 import pytest
 
 from dbrepos.django.repo import DjangoRepo
-from tests.django.tables.models import DjangoTable
+from dbrepos.tracking import ChangeTracker
+from tests.django.tables.models import (
+    DjangoCounterTable,
+    DjangoPurchaseTable,
+    DjangoTable,
+    DjangoVersionedTable,
+)
 
 
 @pytest.fixture
@@ -11,12 +17,14 @@ def django_repo_factory():
         pk_field_name="id",
         is_soft_deletable=False,
         default_ordering=("id",),
+        log_throttle=None,
     ):
         return DjangoRepo(
             table_class=table_class,
             pk_field_name=pk_field_name,
             is_soft_deletable=is_soft_deletable,
             default_ordering=default_ordering,
+            log_throttle=log_throttle,
         )
 
     return factory
@@ -30,3 +38,22 @@ def django_repo(django_repo_factory):
 @pytest.fixture
 def django_repo_soft_deletable(django_repo_factory):
     return django_repo_factory(is_soft_deletable=True)
+
+
+@pytest.fixture
+def django_versioned_repo():
+    return DjangoRepo(
+        table_class=DjangoVersionedTable,
+        change_tracker=ChangeTracker(),
+        version_column="version",
+    )
+
+
+@pytest.fixture
+def django_counter_repo():
+    return DjangoRepo(table_class=DjangoCounterTable)
+
+
+@pytest.fixture
+def django_purchase_repo():
+    return DjangoRepo(table_class=DjangoPurchaseTable)
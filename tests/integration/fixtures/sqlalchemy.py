@@ -1,7 +1,14 @@
 import pytest
 
 from dbrepos.sqlalchemy.repo import AlchemyRepo
-from tests.sqlalchemy import AlchemySyncDatabase, AlchemyTable
+from dbrepos.tracking import ChangeTracker
+from tests.sqlalchemy import (
+    AlchemyCounterTable,
+    AlchemyPurchaseTable,
+    AlchemySyncDatabase,
+    AlchemyTable,
+    AlchemyVersionedTable,
+)
 
 
 @pytest.fixture
@@ -16,12 +23,14 @@ def alchemy_repo_factory(alchemy_session_factory):
         pk_field_name="id",
         is_soft_deletable=False,
         default_ordering=("id",),
+        log_throttle=None,
     ):
         return AlchemyRepo(
             table_class=table_class,
             pk_field_name=pk_field_name,
             is_soft_deletable=is_soft_deletable,
             default_ordering=default_ordering,
+            log_throttle=log_throttle,
             session_factory=alchemy_session_factory,
         )
 
@@ -36,3 +45,27 @@ def alchemy_repo(alchemy_repo_factory):
 @pytest.fixture
 def alchemy_repo_soft_deletable(alchemy_repo_factory):
     return alchemy_repo_factory(is_soft_deletable=True)
+
+
+@pytest.fixture
+def alchemy_versioned_repo(alchemy_session_factory):
+    return AlchemyRepo(
+        table_class=AlchemyVersionedTable,
+        session_factory=alchemy_session_factory,
+        change_tracker=ChangeTracker(),
+        version_column="version",
+    )
+
+
+@pytest.fixture
+def alchemy_counter_repo(alchemy_session_factory):
+    return AlchemyRepo(
+        table_class=AlchemyCounterTable, session_factory=alchemy_session_factory
+    )
+
+
+@pytest.fixture
+def alchemy_purchase_repo(alchemy_session_factory):
+    return AlchemyRepo(
+        table_class=AlchemyPurchaseTable, session_factory=alchemy_session_factory
+    )
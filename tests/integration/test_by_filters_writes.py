@@ -0,0 +1,120 @@
+import pytest
+
+from dbrepos.core.types import Extra, mode, operator
+from tests.parametrize import multi_repo_parametrize
+
+PRELOAD = (
+    {"name": "keep", "is_deleted": False},
+    {"name": "drop", "is_deleted": False},
+    {"name": "drop", "is_deleted": True},
+    {"name": "drop", "is_deleted": False},
+    {"name": "keep", "is_deleted": True},
+    {"name": "drop", "is_deleted": False},
+)
+MATCHED_BY_REPO_SOFT_DELETABLE = {False: {1, 2, 3, 5}, True: {1, 3, 5}}
+
+batch_size_parametrize = pytest.mark.parametrize("batch_size", (None, 1, 2, 3, 10))
+
+
+def drop_filters(runner, repo, Filter, FilterSeq):
+    return FilterSeq(runner)(
+        mode.and_,
+        Filter(runner)(repo.table_class, "name", "drop", operator.eq),
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@batch_size_parametrize
+@pytest.mark.parametrize("include_soft_deleted", (False, True))
+def test_update_by_filters(
+    batch_size,
+    include_soft_deleted,
+    repo,
+    runner,
+    insert,
+    select_one,
+    Filter,
+    FilterSeq,
+    request,
+):
+    repo = request.getfixturevalue(repo)
+    pks = [insert("table", runner, row).id for row in PRELOAD]
+    matched = MATCHED_BY_REPO_SOFT_DELETABLE[
+        repo.is_soft_deletable and not include_soft_deleted
+    ]
+
+    # NOTE: updated column is the filtered one,
+    # so updated rows leave the filter between batches
+    assert repo.update_by_filters(
+        filters=drop_filters(runner, repo, Filter, FilterSeq),
+        values={"name": "archived"},
+        batch_size=batch_size,
+        extra=Extra(include_soft_deleted=include_soft_deleted),
+    ) == len(matched)
+    for index, pk in enumerate(pks):
+        expected_name = "archived" if index in matched else PRELOAD[index]["name"]
+        assert select_one("table", pk, runner)[1] == expected_name
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_update_by_filters_without_values(
+    repo, runner, insert, select_one, Filter, FilterSeq, request
+):
+    repo = request.getfixturevalue(repo)
+    pk = insert("table", runner, PRELOAD[1]).id
+
+    assert (
+        repo.update_by_filters(
+            filters=drop_filters(runner, repo, Filter, FilterSeq), values={}
+        )
+        == 0
+    )
+    assert select_one("table", pk, runner)[1] == "drop"
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@batch_size_parametrize
+def test_delete_by_filters(
+    batch_size, repo, runner, insert, select_one, Filter, FilterSeq, request
+):
+    repo = request.getfixturevalue(repo)
+    pks = [insert("table", runner, row).id for row in PRELOAD]
+    matched = MATCHED_BY_REPO_SOFT_DELETABLE[repo.is_soft_deletable]
+
+    assert repo.delete_by_filters(
+        filters=drop_filters(runner, repo, Filter, FilterSeq),
+        batch_size=batch_size,
+    ) == len(matched)
+    for index, pk in enumerate(pks):
+        assert (select_one("table", pk, runner) is None) == (index in matched)
+
+
+@pytest.mark.integration
+def test_delete_by_filters_batches_in_own_transactions(
+    alchemy_repo_factory, insert, Filter, FilterSeq
+):
+    repo = alchemy_repo_factory()
+    for row in PRELOAD:
+        insert("table", "alchemy", row)
+    sessions = []
+    factory = repo.session_factory
+
+    def session_factory():
+        sessions.append(None)
+        return factory()
+
+    repo.session_factory = session_factory
+    assert (
+        repo.delete_by_filters(
+            filters=drop_filters("alchemy", repo, Filter, FilterSeq), batch_size=2
+        )
+        == 4
+    )
+    # NOTE: 3 pk selects and 2 deletes
+    assert len(sessions) == 5
@@ -0,0 +1,129 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from dbrepos.core.types import Extra, mode, operator
+from tests.entities import TableEntity
+from tests.parametrize import multi_repo_parametrize
+
+
+def queued(runner, repo, Filter, FilterSeq):
+    return FilterSeq(runner)(
+        mode.and_,
+        Filter(runner)(repo.table_class, "name", "queued", operator.eq),
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize(
+    "ordering,expected_batches",
+    (
+        ((), [[0, 1], [3, 4], [5], []]),
+        (("-id",), [[5, 4], [3, 1], [0], []]),
+    ),
+)
+def test_claim_batch(
+    ordering,
+    expected_batches,
+    repo,
+    runner,
+    insert,
+    select_one,
+    Filter,
+    FilterSeq,
+    request,
+):
+    repo = request.getfixturevalue(repo)
+    pks = [
+        insert("table", runner, {"name": name, "is_deleted": False}).id
+        for name in ("queued", "queued", "done", "queued", "queued", "queued")
+    ]
+
+    batches = [
+        repo.claim_batch(
+            filters=queued(runner, repo, Filter, FilterSeq),
+            limit=2,
+            values={"name": "running"},
+            convert_to=TableEntity,
+            extra=Extra(ordering=ordering),
+        )
+        for _ in expected_batches
+    ]
+
+    assert batches == [
+        [
+            TableEntity(id=pks[index], name="running", is_deleted=False)
+            for index in batch
+        ]
+        for batch in expected_batches
+    ]
+    assert select_one("table", pks[2], runner, convert_to=TableEntity).name == "done"
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_claim_batch_skips_soft_deleted(
+    repo, runner, insert, Filter, FilterSeq, request
+):
+    repo = request.getfixturevalue(repo)
+    pks = [
+        insert("table", runner, {"name": "queued", "is_deleted": is_deleted}).id
+        for is_deleted in (True, False)
+    ]
+
+    claimed = repo.claim_batch(
+        filters=queued(runner, repo, Filter, FilterSeq),
+        limit=2,
+        values={"name": "running"},
+        convert_to=TableEntity,
+    )
+
+    assert [row.id for row in claimed] == (pks[1:] if repo.is_soft_deletable else pks)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "extra,expected",
+    (
+        (Extra(for_update=True), "FOR UPDATE"),
+        (Extra(for_update=True, skip_locked=True), "FOR UPDATE SKIP LOCKED"),
+        (Extra(for_update=True, nowait=True), "FOR UPDATE NOWAIT"),
+        (Extra(skip_locked=True), None),
+    ),
+)
+def test_lock_options_alchemy(extra, expected, alchemy_repo):
+    compiled = str(
+        alchemy_repo._resolve_extra(
+            qs=sa.select(alchemy_repo.table_class), extra=extra
+        ).compile(dialect=postgresql.dialect())
+    )
+
+    if expected is None:
+        assert "FOR UPDATE" not in compiled
+    else:
+        assert compiled.endswith(expected)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "extra,expected",
+    (
+        (Extra(for_update=True), (True, False, False)),
+        (Extra(for_update=True, skip_locked=True), (True, True, False)),
+        (Extra(for_update=True, nowait=True), (True, False, True)),
+        (Extra(skip_locked=True), (False, False, False)),
+    ),
+)
+def test_lock_options_django(extra, expected, django_repo):
+    query = django_repo._resolve_extra(
+        qs=django_repo.table_class.objects.all(), extra=extra
+    ).query
+
+    assert (
+        query.select_for_update,
+        query.select_for_update_skip_locked,
+        query.select_for_update_nowait,
+    ) == expected
@@ -1,10 +1,15 @@
-from dataclasses import fields
+import dataclasses
+from dataclasses import dataclass, fields
+from typing import List
 
 import pytest
+import sqlalchemy as sa
 
 from dbrepos.core.abstract import IRepo
+from dbrepos.core.types import returning
 from tests.entities import InsertTableEntity, TableEntity
 from tests.parametrize import multi_repo_parametrize
+from tests.sqlalchemy import AlchemySyncDatabase
 
 
 @pytest.mark.django_db
@@ -35,3 +40,104 @@ def test_create(entity, repo, runner, count, select_one, request):
         select_one("table", instance.id, runner),
     ):
         assert getattr(instance, field.name) == value
+
+
+@dataclass(slots=True)
+class InsertTableEntityWithExtraFields:
+    name: str
+    is_deleted: bool
+    tags: List[str] = dataclasses.field(default_factory=list)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_create_drops_non_column_fields(repo, runner, select_one, request):
+    repo: IRepo = request.getfixturevalue(repo)
+
+    instance = repo.create(
+        InsertTableEntityWithExtraFields(name="name", is_deleted=False, tags=["a"]),
+        convert_to=TableEntity,
+    )
+    repo.bulk_create(
+        [InsertTableEntityWithExtraFields(name="bulk", is_deleted=False, tags=["b"])]
+    )
+
+    assert select_one("table", instance.id, runner, convert_to=TableEntity) == (
+        TableEntity(id=instance.id, name="name", is_deleted=False)
+    )
+    assert repo.count_by_field(name="name", value="bulk") == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("convert_to", (None, TableEntity))
+def test_create_returning(convert_to, repo, runner, count, select_one, request):
+    repo: IRepo = request.getfixturevalue(repo)
+    entity = InsertTableEntity(name="name", is_deleted=False)
+
+    pk = repo.create(entity, returning_=returning.pk)
+    assert repo.create(entity, returning_=returning.none) is None
+    row = repo.create(entity, convert_to=convert_to, returning_=returning.row)
+
+    assert count("table", runner) == 3
+    assert select_one("table", pk, runner, convert_to=TableEntity) == TableEntity(
+        id=pk, name="name", is_deleted=False
+    )
+    assert row.id == pk + 2
+    if convert_to is not None:
+        assert row == TableEntity(id=pk + 2, name="name", is_deleted=False)
+
+
+@pytest.mark.integration
+def test_create_returning_sql(alchemy_repo_factory):
+    repo = alchemy_repo_factory()
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = AlchemySyncDatabase._engine
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        for returning_ in returning:
+            repo.create(
+                InsertTableEntity(name="name", is_deleted=False),
+                returning_=returning_,
+            )
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    inserts = [statement for statement in statements if statement.startswith("INSERT")]
+    assert [insert.partition("RETURNING")[2].strip() for insert in inserts] == [
+        "id, name, is_deleted",
+        "",
+        "",
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("batch_size", (2, 1000))
+def test_bulk_create_returning(batch_size, repo, runner, request):
+    repo: IRepo = request.getfixturevalue(repo)
+    entities = [InsertTableEntity(name=f"name{i}", is_deleted=False) for i in range(5)]
+
+    pks = repo.bulk_create(entities, batch_size=batch_size, returning_=returning.pk)
+    rows = repo.bulk_create(
+        entities,
+        batch_size=batch_size,
+        convert_to=TableEntity,
+        returning_=returning.row,
+    )
+
+    assert len(pks) == 5
+    assert rows == [
+        TableEntity(id=pks[0] + 5 + i, name=f"name{i}", is_deleted=False)
+        for i in range(5)
+    ]
+    assert [item.name for item in repo.all_by_pks(pks, convert_to=TableEntity)] == [
+        entity.name for entity in entities
+    ]
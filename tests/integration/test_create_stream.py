@@ -0,0 +1,111 @@
+from unittest import mock
+
+import pytest
+
+from dbrepos.core.types import StreamStats, returning
+from tests.entities import InsertTableEntity
+from tests.parametrize import multi_repo_parametrize
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("size", (0, 1, 1000))
+def test_bulk_create(size, repo, runner, select, request):
+    repo = request.getfixturevalue(repo)
+    entities = [
+        InsertTableEntity(name=f"name{i}", is_deleted=False) for i in range(size)
+    ]
+
+    assert repo.bulk_create(entities, batch_size=300) == size
+    assert [row[1] for row in select("table", runner)] == [
+        entity.name for entity in entities
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize(
+    "size,batch_size,commit_every,expected_batches,expected_commits",
+    (
+        (0, 3, 1, 0, 0),
+        (1, 3, 1, 1, 1),
+        (10, 3, 1, 4, 4),
+        (10, 3, 2, 4, 2),
+        (10, 5, 3, 2, 1),
+    ),
+)
+def test_create_stream(
+    size,
+    batch_size,
+    commit_every,
+    expected_batches,
+    expected_commits,
+    repo,
+    runner,
+    select,
+    request,
+):
+    repo = request.getfixturevalue(repo)
+    pulled = []
+
+    def entities():
+        for i in range(size):
+            pulled.append(i)
+            yield InsertTableEntity(name=f"name{i}", is_deleted=bool(i % 2))
+
+    def on_progress(stats):
+        # NOTE: at most one batch is pulled and not yet inserted
+        assert stats.rows <= len(pulled) <= stats.rows + batch_size
+
+    on_progress = mock.Mock(side_effect=on_progress)
+
+    stats = repo.create_stream(
+        entities(),
+        batch_size=batch_size,
+        commit_every=commit_every,
+        on_progress=on_progress,
+    )
+
+    assert (stats.rows, stats.batches, stats.commits) == (
+        size,
+        expected_batches,
+        expected_commits,
+    )
+    assert on_progress.call_count == expected_batches
+    assert [row[1] for row in select("table", runner)] == [
+        f"name{i}" for i in range(size)
+    ]
+
+
+@pytest.mark.integration
+def test_create_stream_with_session(alchemy_repo_factory, alchemy_session_factory):
+    repo = alchemy_repo_factory()
+
+    with alchemy_session_factory() as session:
+        stats = repo.create_stream(
+            (InsertTableEntity(name="name", is_deleted=False) for _ in range(5)),
+            batch_size=2,
+            session=session,
+        )
+
+    assert isinstance(stats, StreamStats)
+    assert (stats.rows, stats.batches, stats.commits) == (5, 3, 0)
+    assert repo.count_by_field(name="name", value="name") == 5
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("returning_", (returning.none, returning.pk))
+def test_bulk_create_failure(returning_, repo, runner, select, request):
+    repo = request.getfixturevalue(repo)
+    entities = [InsertTableEntity(name=f"name{i}", is_deleted=False) for i in range(5)]
+    # NOTE: invalid boolean fails the last batch
+    entities.append(InsertTableEntity(name="name5", is_deleted="invalid"))
+
+    with pytest.raises(Exception):
+        repo.bulk_create(entities, batch_size=2, returning_=returning_)
+
+    assert list(select("table", runner)) == []
@@ -0,0 +1,71 @@
+import pytest
+
+from dbrepos.core.types import Extra
+from tests.parametrize import multi_repo_parametrize
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize(
+    "preload,pks,include_soft_deleted,expected_preload_indexes_by_repo_soft_deletable",
+    (
+        ([], [1, 2], False, {False: [], True: []}),
+        ([{"name": "name", "is_deleted": False}], [], False, {False: [], True: []}),
+        (
+            [{"name": "name", "is_deleted": False}],
+            [0],
+            False,
+            {False: [0], True: [0]},
+        ),
+        (
+            [
+                {"name": "name1", "is_deleted": False},
+                {"name": "name2", "is_deleted": True},
+                {"name": "name3", "is_deleted": False},
+            ],
+            [0, 1, 2, 1, 0],
+            False,
+            {False: [0, 1, 2], True: [0, 2]},
+        ),
+        (
+            [
+                {"name": "name1", "is_deleted": False},
+                {"name": "name2", "is_deleted": True},
+                {"name": "name3", "is_deleted": False},
+            ],
+            [1, 2],
+            True,
+            {False: [1, 2], True: [1, 2]},
+        ),
+    ),
+)
+def test_exists_by_pks(
+    preload,
+    pks,
+    include_soft_deleted,
+    expected_preload_indexes_by_repo_soft_deletable,
+    repo,
+    runner,
+    insert,
+    request,
+):
+    repo = request.getfixturevalue(repo)
+
+    preload_ids = []
+    for row in preload:
+        preload_ids.append(insert("table", runner, row).id)
+    # NOTE: pks are preload indexes, missing ones are shifted out of range
+    pks = [preload_ids[pk] if pk < len(preload_ids) else pk + 1000 for pk in pks]
+
+    result = repo.exists_by_pks(
+        pks=pks,
+        extra=Extra(include_soft_deleted=include_soft_deleted),
+    )
+
+    assert result == {
+        preload_ids[index]
+        for index in expected_preload_indexes_by_repo_soft_deletable[
+            repo.is_soft_deletable
+        ]
+    }
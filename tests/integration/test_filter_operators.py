@@ -0,0 +1,115 @@
+import pytest
+
+from dbrepos.core.types import mode, operator
+from tests.parametrize import multi_repo_parametrize
+
+NAMES = ("apple", "apricot", "banana", "ap%ple")
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize(
+    "column_name,value,operator_,expected_ids",
+    (
+        ("name", "apple", operator.ne, [2, 3, 4]),
+        ("name", ["apple", "banana"], operator.not_in, [2, 4]),
+        ("id", (2, 3), operator.between, [2, 3]),
+        ("name", None, operator.is_not, [1, 2, 3, 4]),
+        ("name", "ap", operator.startswith, [1, 2, 4]),
+        ("name", "ap%", operator.startswith, [4]),
+        ("name", "", operator.startswith, [1, 2, 3, 4]),
+        ("name", "an", operator.contains, [3]),
+        ("name", "%", operator.contains, [4]),
+        ("name", "AN", operator.icontains, [3]),
+    ),
+)
+def test_filter_operators(
+    column_name,
+    value,
+    operator_,
+    expected_ids,
+    repo,
+    runner,
+    insert,
+    Filter,
+    FilterSeq,
+    request,
+):
+    repo = request.getfixturevalue(repo)
+    for name in NAMES:
+        insert("table", runner, {"name": name, "is_deleted": False})
+    filters = FilterSeq(runner)(
+        mode.and_,
+        Filter(runner)(repo.table_class, column_name, value, operator_),
+    )
+
+    assert [
+        row.id for row in repo.all_by_filters(filters=filters)
+    ] == expected_ids
+    assert repo.count_by_filters(filters=filters) == len(expected_ids)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize("value", ("ap", "AP", "Ap"))
+def test_startswith_mixed_case(
+    value, django_repo, alchemy_repo, insert, Filter, FilterSeq
+):
+    def ids(repo, runner):
+        for name in ("Apple", "apple", "APRICOT", "banana"):
+            insert("table", runner, {"name": name, "is_deleted": False})
+        filters = FilterSeq(runner)(
+            mode.and_,
+            Filter(runner)(repo.table_class, "name", value, operator.startswith),
+        )
+        return [row.id for row in repo.all_by_filters(filters=filters)]
+
+    # NOTE: both repos match case the way backend LIKE does
+    assert ids(alchemy_repo, "alchemy") == ids(django_repo, "django")
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "repo,runner",
+    (
+        ("django_purchase_repo", "django"),
+        ("alchemy_purchase_repo", "alchemy"),
+    ),
+)
+@pytest.mark.parametrize(
+    "value,operator_,expected",
+    (
+        (0, operator.ne, [1]),
+        ([0], operator.not_in, [1]),
+        (0, operator.is_not, [1, 2]),
+        (None, operator.is_not, [0, 1]),
+    ),
+)
+def test_filter_operators_nullable(
+    value, operator_, expected, repo, runner, insert, Filter, FilterSeq, request
+):
+    repo = request.getfixturevalue(repo)
+    customers = [
+        insert("customer", runner, {"name": name, "country": "de"}).id
+        for name in ("ann", "bob")
+    ]
+    pks = [
+        insert("purchase", runner, {"name": "x", "customer_id": customer_id}).id
+        for customer_id in (*customers, None)
+    ]
+    value = (
+        [customers[index] for index in value]
+        if isinstance(value, list)
+        else None if value is None else customers[value]
+    )
+    filters = FilterSeq(runner)(
+        mode.and_,
+        Filter(runner)(repo.table_class, "customer_id", value, operator_),
+    )
+
+    assert [row.id for row in repo.all_by_filters(filters=filters)] == [
+        pks[index] for index in expected
+    ]
+    assert repo.count_by_filters(filters=filters) == len(expected)
@@ -1,5 +1,9 @@
+import logging
+from unittest import mock
+
 import pytest
 
+from dbrepos.core.exceptions import NotFoundError
 from tests.entities import TableEntity
 from tests.parametrize import multi_repo_parametrize
 
@@ -58,3 +62,40 @@ def test_get_by_pks(preload, pk, expected_result, repo, runner, insert, request)
     assert (
         repo.get_by_pk(pk=pk, strict=False, convert_to=TableEntity) == expected_result
     )
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_get_by_pk_miss(repo, runner, request, caplog):
+    repo = request.getfixturevalue(repo)
+    module = type(repo).__module__
+
+    with mock.patch(f"{module}.get_object_or_404") as get_object_or_404:
+        assert repo.get_by_pk(pk=1, strict=False, convert_to=TableEntity) is None
+    get_object_or_404.assert_not_called()
+
+    with caplog.at_level(logging.DEBUG, logger="dbrepos.decorators"):
+        with pytest.raises(NotFoundError):
+            repo.get_by_pk(pk=1, convert_to=TableEntity)
+
+    records = [r for r in caplog.records if r.name == "dbrepos.decorators"]
+    assert records
+    assert all(record.levelno == logging.DEBUG for record in records)
+    assert all(record.exc_info is None for record in records)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_get_by_pk_fast_path(repo, runner, insert, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("table", runner, {"name": "name", "is_deleted": False}).id
+
+    with mock.patch.object(
+        type(repo), "get_by_field", side_effect=AssertionError
+    ) as get_by_field:
+        assert repo.get_by_pk(pk, convert_to=TableEntity) == TableEntity(
+            id=pk, name="name", is_deleted=False
+        )
+    get_by_field.assert_not_called()
@@ -0,0 +1,142 @@
+from unittest import mock
+
+import pytest
+import sqlalchemy as sa
+
+from dbrepos.core.types import Extra
+from tests.entities import TableEntity
+from tests.parametrize import multi_repo_parametrize
+from tests.sqlalchemy import AlchemySyncDatabase
+
+
+@pytest.fixture
+def rows(insert):
+    def _rows(runner):
+        return [
+            TableEntity(
+                id=insert("table", runner, {"name": name, "is_deleted": is_deleted}).id,
+                name=name,
+                is_deleted=is_deleted,
+            )
+            for name, is_deleted in (
+                ("a", False),
+                ("b", False),
+                ("c", False),
+                ("b", False),
+                ("d", True),
+            )
+        ]
+
+    return _rows
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("batch_size", (1, 2, 1000))
+def test_get_many_by_field(batch_size, repo, runner, rows, request):
+    repo = request.getfixturevalue(repo)
+    entities = rows(runner)
+
+    found = repo.get_many_by_field(
+        "name",
+        ["d", "c", "zz", "a", "c", "b"],
+        convert_to=TableEntity,
+        batch_size=batch_size,
+    )
+
+    expected = {"c": entities[2], "a": entities[0], "b": entities[1]}
+    if not repo.is_soft_deletable:
+        expected = {"d": entities[4], **expected}
+    assert found == expected
+    assert list(found) == list(expected)
+    assert repo.get_many_by_field("name", []) == {}
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_get_many_by_pks(repo, runner, rows, request):
+    repo = request.getfixturevalue(repo)
+    entities = rows(runner)
+    pks = [entity.id for entity in entities][::-1]
+
+    found = repo.get_many_by_pks(pks + [0], extra=Extra(include_soft_deleted=True))
+
+    assert list(found) == pks
+    assert [row.name for row in found.values()] == ["d", "b", "c", "b", "a"]
+    assert repo.get_many_by_pks(pks[:2], convert_to=TableEntity) == (
+        {pks[1]: entities[3]}
+        if repo.is_soft_deletable
+        else {pks[0]: entities[4], pks[1]: entities[3]}
+    )
+
+
+@pytest.mark.integration
+def test_get_many_query_per_batch(alchemy_repo, rows):
+    rows("alchemy")
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = AlchemySyncDatabase._engine
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        found = alchemy_repo.get_many_by_field(
+            "name", ["a", "b", "c", "a", "b"], batch_size=2
+        )
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert list(found) == ["a", "b", "c"]
+    assert len(statements) == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "repo,runner,name",
+    (
+        ("django_purchase_repo", "django", "customer"),
+        ("django_purchase_repo", "django", "customer_id"),
+        ("alchemy_purchase_repo", "alchemy", "customer_id"),
+    ),
+)
+def test_get_many_by_foreign_key(repo, runner, name, insert, request):
+    repo = request.getfixturevalue(repo)
+    customers = [
+        insert("customer", runner, {"name": name, "country": "de"}).id
+        for name in ("ann", "bob", "eve")
+    ]
+    pks = [
+        insert("purchase", runner, {"name": "x", "customer_id": customer_id}).id
+        for customer_id in (customers[1], customers[0], customers[1])
+    ]
+
+    found = repo.get_many_by_field(name, customers[::-1])
+
+    assert {key: row.id for key, row in found.items()} == {
+        customers[1]: pks[0],
+        customers[0]: pks[1],
+    }
+    assert list(found) == [customers[1], customers[0]]
+
+
+@pytest.mark.integration
+def test_get_many_converts_kept_rows(alchemy_versioned_repo, insert):
+    pks = [
+        insert("versioned", "alchemy", {"name": name, "version": 1}).id
+        for name in ("a", "b", "a", "a")
+    ]
+
+    with mock.patch.object(
+        alchemy_versioned_repo,
+        "_convert_many",
+        wraps=alchemy_versioned_repo._convert_many,
+    ) as convert_many:
+        found = alchemy_versioned_repo.get_many_by_field("name", ["a", "b"])
+
+    assert [row.id for row in found.values()] == pks[:2]
+    # NOTE: duplicates of the kept rows are neither converted nor tracked
+    assert convert_many.call_args.args[0] == list(found.values())
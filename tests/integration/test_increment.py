@@ -0,0 +1,161 @@
+import threading
+
+import pytest
+
+from dbrepos.core.types import mode, operator
+from tests.entities import CounterEntity, VersionedEntity
+
+counter_repo_parametrize = pytest.mark.parametrize(
+    "repo,runner",
+    (
+        ("django_counter_repo", "django"),
+        ("alchemy_counter_repo", "alchemy"),
+    ),
+)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@counter_repo_parametrize
+@pytest.mark.parametrize("by,expected", ((1, 11), (5, 15), (-3, 7)))
+@pytest.mark.parametrize("return_new", (False, True))
+def test_increment(return_new, by, expected, repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("counter", runner, {"name": "views", "value": 10}).id
+    other_pk = insert("counter", runner, {"name": "other", "value": 10}).id
+
+    new = repo.increment(pk, "value", by=by, return_new=return_new)
+
+    assert new == (expected if return_new else None)
+    assert select_one("counter", pk, runner, convert_to=CounterEntity).value == (
+        expected
+    )
+    assert select_one("counter", other_pk, runner, convert_to=CounterEntity).value == (
+        10
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@counter_repo_parametrize
+@pytest.mark.parametrize("return_new", (False, True))
+def test_increment_not_found(return_new, repo, runner, request):
+    repo = request.getfixturevalue(repo)
+
+    assert repo.increment(1, "value", return_new=return_new) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@counter_repo_parametrize
+@pytest.mark.parametrize("return_new", (False, True))
+def test_multi_increment(return_new, repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pks = [
+        insert("counter", runner, {"name": "views", "value": value}).id
+        for value in (1, 10, 100)
+    ]
+
+    new = repo.multi_increment(pks[:2], {"value": 2}, return_new=return_new)
+
+    if return_new:
+        assert new == {pks[0]: {"value": 3}, pks[1]: {"value": 12}}
+    else:
+        assert new is None
+    assert [
+        select_one("counter", pk, runner, convert_to=CounterEntity).value for pk in pks
+    ] == [3, 12, 100]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@counter_repo_parametrize
+@pytest.mark.parametrize(
+    "pks,deltas,return_new,expected",
+    (
+        ([], {"value": 1}, False, None),
+        ([], {"value": 1}, True, {}),
+        ([1], {}, False, None),
+        ([1], {}, True, {}),
+    ),
+)
+def test_multi_increment_empty(
+    pks, deltas, return_new, expected, repo, runner, request
+):
+    repo = request.getfixturevalue(repo)
+
+    assert repo.multi_increment(pks, deltas, return_new=return_new) == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@counter_repo_parametrize
+@pytest.mark.parametrize("batch_size", (None, 1, 5))
+def test_increment_by_filters(
+    batch_size, repo, runner, insert, select_one, Filter, FilterSeq, request
+):
+    repo = request.getfixturevalue(repo)
+    pks = [
+        insert("counter", runner, {"name": name, "value": 1}).id
+        for name in ("views", "other", "views")
+    ]
+
+    assert (
+        repo.increment_by_filters(
+            filters=FilterSeq(runner)(
+                mode.and_,
+                Filter(runner)(repo.table_class, "name", "views", operator.eq),
+            ),
+            deltas={"value": 4},
+            batch_size=batch_size,
+        )
+        == 2
+    )
+    assert [
+        select_one("counter", pk, runner, convert_to=CounterEntity).value for pk in pks
+    ] == [5, 1, 5]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "repo,runner",
+    (
+        ("django_versioned_repo", "django"),
+        ("alchemy_versioned_repo", "alchemy"),
+    ),
+)
+def test_increment_bumps_version(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("versioned", runner, {"name": "name", "version": 1}).id
+
+    repo.update(pk, values={"name": "new"}, expected_version=1)
+    repo.multi_increment([pk], {"id": 0})
+
+    assert select_one(
+        "versioned", pk, runner, convert_to=VersionedEntity
+    ) == VersionedEntity(id=pk, name="new", version=3)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+@counter_repo_parametrize
+def test_increment_concurrent(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("counter", runner, {"name": "views", "value": 0}).id
+    threads, increments = 4, 10
+
+    def work():
+        for _ in range(increments):
+            repo.increment(pk, "value")
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    # NOTE: no lost updates without explicit locking
+    assert select_one("counter", pk, runner, convert_to=CounterEntity).value == (
+        threads * increments
+    )
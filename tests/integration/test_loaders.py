@@ -0,0 +1,46 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from dbrepos.core.types import Extra
+from dbrepos.loaders import PkLoader
+from tests.entities import TableEntity
+from tests.parametrize import multi_repo_parametrize
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("include_soft_deleted", (False, True))
+def test_pk_loader(include_soft_deleted, repo, runner, insert, request):
+    repo = request.getfixturevalue(repo)
+    extra = Extra(include_soft_deleted=include_soft_deleted)
+
+    preload_ids = [
+        insert("table", runner, {"name": f"name{i}", "is_deleted": i == 1}).id
+        for i in range(3)
+    ]
+    pks = [preload_ids[2], preload_ids[0], preload_ids[1], preload_ids[2], 0]
+
+    async def resolve():
+        loader = PkLoader(repo)
+        return await asyncio.gather(
+            *(
+                loader.load(pk, convert_to=TableEntity, strict=False, extra=extra)
+                for pk in pks
+            )
+        )
+
+    with mock.patch.object(repo, "all_by_pks", wraps=repo.all_by_pks) as all_by_pks:
+        result = asyncio.run(resolve())
+
+    all_by_pks.assert_called_once()
+    hidden = repo.is_soft_deletable and not include_soft_deleted
+    assert [item and item.id for item in result] == [
+        preload_ids[2],
+        preload_ids[0],
+        None if hidden else preload_ids[1],
+        preload_ids[2],
+        None,
+    ]
@@ -0,0 +1,22 @@
+import logging
+
+import pytest
+
+from dbrepos.core.exceptions import BaseRepoException
+from dbrepos.throttle import LogThrottle
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize("runner", ("alchemy", "django"))
+def test_log_throttle(runner, alchemy_repo_factory, django_repo_factory, caplog):
+    factory = {"alchemy": alchemy_repo_factory, "django": django_repo_factory}[runner]
+    repo = factory(log_throttle=LogThrottle(min_interval=60))
+
+    with caplog.at_level(logging.ERROR, logger="dbrepos.decorators"):
+        for _ in range(3):
+            with pytest.raises(BaseRepoException):
+                repo.soft_delete(1)
+
+    records = [r for r in caplog.records if r.name == "dbrepos.decorators"]
+    assert [record.levelno for record in records] == [logging.ERROR]
@@ -0,0 +1,103 @@
+from unittest import mock
+
+import pytest
+
+from dbrepos.core.exceptions import BaseRepoException
+from dbrepos.core.types import Extra
+from tests.parametrize import multi_repo_parametrize
+
+PRELOAD = (
+    {"name": "name1", "is_deleted": False},
+    {"name": "name2", "is_deleted": True},
+    {"name": "name3", "is_deleted": False},
+    {"name": "name4", "is_deleted": False},
+)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("batch_size", (1, 2, 1000))
+@pytest.mark.parametrize(
+    "indexes,include_soft_deleted,expected_deleted_by_repo_soft_deletable",
+    (
+        ([], False, {False: set(), True: set()}),
+        ([0], False, {False: {0}, True: {0}}),
+        ([0, 1, 2], False, {False: {0, 1, 2}, True: {0, 2}}),
+        ([0, 1, 2], True, {False: {0, 1, 2}, True: {0, 1, 2}}),
+        ([3, 0, 3], False, {False: {0, 3}, True: {0, 3}}),
+    ),
+)
+def test_multi_delete(
+    batch_size,
+    indexes,
+    include_soft_deleted,
+    expected_deleted_by_repo_soft_deletable,
+    repo,
+    runner,
+    insert,
+    select_one,
+    request,
+):
+    repo = request.getfixturevalue(repo)
+    pks = [insert("table", runner, row).id for row in PRELOAD]
+    expected_deleted = expected_deleted_by_repo_soft_deletable[repo.is_soft_deletable]
+
+    assert repo.multi_delete(
+        [pks[index] for index in indexes],
+        batch_size=batch_size,
+        extra=Extra(include_soft_deleted=include_soft_deleted),
+    ) == len(expected_deleted)
+    for index, pk in enumerate(pks):
+        assert (select_one("table", pk, runner) is None) == (index in expected_deleted)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("batch_size", (1, 1000))
+def test_multi_delete_soft(batch_size, repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pks = [insert("table", runner, row).id for row in PRELOAD]
+
+    if not repo.is_soft_deletable:
+        with pytest.raises(BaseRepoException):
+            repo.multi_delete(pks, batch_size=batch_size, soft=True)
+        return
+
+    # NOTE: already soft deleted row is not counted
+    assert repo.multi_delete(pks[:3], batch_size=batch_size, soft=True) == 2
+    assert [bool(select_one("table", pk, runner)[2]) for pk in pks] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("soft", (False, True))
+def test_multi_delete_failure(soft, repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    if soft and not repo.is_soft_deletable:
+        return
+    pks = [insert("table", runner, row).id for row in PRELOAD]
+    resolve_extra, calls = repo._resolve_extra, []
+
+    def failing(*args, **kwargs):
+        calls.append(None)
+        if len(calls) == 2:
+            raise BaseRepoException("Failure.")
+        return resolve_extra(*args, **kwargs)
+
+    with mock.patch.object(repo, "_resolve_extra", failing):
+        with pytest.raises(BaseRepoException):
+            repo.multi_delete(pks, batch_size=1, soft=soft)
+
+    # NOTE: chunk deleted before the failure is rolled back
+    assert all(select_one("table", pk, runner) is not None for pk in pks)
+    assert [bool(select_one("table", pk, runner)[2]) for pk in pks] == [
+        row["is_deleted"] for row in PRELOAD
+    ]
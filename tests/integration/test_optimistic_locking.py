@@ -0,0 +1,288 @@
+import logging
+
+import pytest
+
+from dbrepos.core.exceptions import BaseRepoException, VersionConflictError
+from dbrepos.core.types import mode, operator
+from dbrepos.shortcuts import retry_on_conflict
+from tests.entities import VersionedEntity
+
+versioned_repo_parametrize = pytest.mark.parametrize(
+    "repo,runner",
+    (
+        ("django_versioned_repo", "django"),
+        ("alchemy_versioned_repo", "alchemy"),
+    ),
+)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@versioned_repo_parametrize
+def test_update(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("versioned", runner, {"name": "name", "version": 1}).id
+
+    repo.update(pk, values={"name": "new"}, expected_version=1)
+    assert select_one(
+        "versioned", pk, runner, convert_to=VersionedEntity
+    ) == VersionedEntity(id=pk, name="new", version=2)
+
+    # NOTE: version is bumped on unchecked updates too
+    repo.update(pk, values={"name": "newer"})
+    assert select_one(
+        "versioned", pk, runner, convert_to=VersionedEntity
+    ) == VersionedEntity(id=pk, name="newer", version=3)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@versioned_repo_parametrize
+def test_update_conflict(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("versioned", runner, {"name": "name", "version": 2}).id
+
+    with pytest.raises(VersionConflictError):
+        repo.update(pk, values={"name": "new"}, expected_version=1)
+    assert select_one(
+        "versioned", pk, runner, convert_to=VersionedEntity
+    ) == VersionedEntity(id=pk, name="name", version=2)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "repo,runner", (("django_repo", "django"), ("alchemy_repo", "alchemy"))
+)
+def test_update_not_versioned(repo, runner, insert, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("table", runner, {"name": "name", "is_deleted": False}).id
+
+    with pytest.raises(BaseRepoException):
+        repo.update(pk, values={"name": "new"}, expected_version=1)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@versioned_repo_parametrize
+@pytest.mark.parametrize(
+    "expected_versions,expected_error",
+    (
+        ({0: 1, 1: 5}, None),
+        ({0: 1, 1: 4}, VersionConflictError),
+    ),
+)
+def test_multi_update(
+    expected_versions, expected_error, repo, runner, insert, select_one, request
+):
+    repo = request.getfixturevalue(repo)
+    pks = [
+        insert("versioned", runner, {"name": "name", "version": version}).id
+        for version in (1, 5)
+    ]
+    expected_versions = {pks[i]: v for i, v in expected_versions.items()}
+
+    if expected_error is None:
+        repo.multi_update(
+            pks, values={"name": "new"}, expected_versions=expected_versions
+        )
+        expected = [
+            VersionedEntity(id=pks[0], name="new", version=2),
+            VersionedEntity(id=pks[1], name="new", version=6),
+        ]
+    else:
+        with pytest.raises(expected_error):
+            repo.multi_update(
+                pks, values={"name": "new"}, expected_versions=expected_versions
+            )
+        # NOTE: nothing is updated on conflict
+        expected = [
+            VersionedEntity(id=pks[0], name="name", version=1),
+            VersionedEntity(id=pks[1], name="name", version=5),
+        ]
+    assert [
+        select_one("versioned", pk, runner, convert_to=VersionedEntity) for pk in pks
+    ] == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "repo,runner", (("django_repo", "django"), ("alchemy_repo", "alchemy"))
+)
+def test_multi_update_not_versioned(repo, runner, insert, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("table", runner, {"name": "name", "is_deleted": False}).id
+
+    with pytest.raises(BaseRepoException, match="not versioned"):
+        repo.multi_update([pk], values={"name": "new"}, expected_versions={pk: 1})
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@versioned_repo_parametrize
+def test_multi_update_missing_version(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pks = [
+        insert("versioned", runner, {"name": "name", "version": 1}).id for _ in range(2)
+    ]
+
+    with pytest.raises(BaseRepoException, match="missing"):
+        repo.multi_update(pks, values={"name": "new"}, expected_versions={pks[0]: 1})
+    assert [
+        select_one("versioned", pk, runner, convert_to=VersionedEntity) for pk in pks
+    ] == [VersionedEntity(id=pk, name="name", version=1) for pk in pks]
+
+
+@pytest.mark.integration
+def test_multi_update_conflict_with_session(
+    alchemy_versioned_repo, alchemy_session_factory, insert, select_one
+):
+    repo = alchemy_versioned_repo
+    pks = [
+        insert("versioned", "alchemy", {"name": "name", "version": 1}).id
+        for _ in range(2)
+    ]
+
+    with alchemy_session_factory() as session:
+        repo.update(pks[0], values={"name": "first"}, session=session)
+        with pytest.raises(VersionConflictError):
+            repo.multi_update(
+                pks,
+                values={"name": "new"},
+                expected_versions={pks[0]: 1, pks[1]: 1},
+                session=session,
+            )
+        # NOTE: only the conflicting update is rolled back,
+        # caller session transaction is still committed
+    assert [
+        select_one("versioned", pk, "alchemy", convert_to=VersionedEntity) for pk in pks
+    ] == [
+        VersionedEntity(id=pks[0], name="first", version=2),
+        VersionedEntity(id=pks[1], name="name", version=1),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@versioned_repo_parametrize
+@pytest.mark.parametrize(
+    "expected_versions,expected_error",
+    (
+        ({0: 1, 1: 5}, None),
+        ({0: 1, 1: 4}, VersionConflictError),
+        ({0: 1}, BaseRepoException),
+    ),
+)
+def test_bulk_update_expected_versions(
+    expected_versions, expected_error, repo, runner, insert, select_one, request
+):
+    repo = request.getfixturevalue(repo)
+    pks = [
+        insert("versioned", runner, {"name": "name", "version": version}).id
+        for version in (1, 5)
+    ]
+    expected_versions = {pks[i]: v for i, v in expected_versions.items()}
+    values = {pks[0]: {"name": "first"}, pks[1]: {"name": "second"}}
+
+    if expected_error is None:
+        assert repo.bulk_update(values, expected_versions=expected_versions) == 2
+        expected = [
+            VersionedEntity(id=pks[0], name="first", version=2),
+            VersionedEntity(id=pks[1], name="second", version=6),
+        ]
+    else:
+        with pytest.raises(expected_error):
+            repo.bulk_update(values, expected_versions=expected_versions)
+        expected = [
+            VersionedEntity(id=pks[0], name="name", version=1),
+            VersionedEntity(id=pks[1], name="name", version=5),
+        ]
+    assert [
+        select_one("versioned", pk, runner, convert_to=VersionedEntity) for pk in pks
+    ] == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@versioned_repo_parametrize
+def test_conflict_is_not_logged_as_error(repo, runner, insert, request, caplog):
+    repo = request.getfixturevalue(repo)
+    pk = insert("versioned", runner, {"name": "name", "version": 2}).id
+
+    with caplog.at_level(logging.DEBUG, logger="dbrepos.decorators"):
+        with pytest.raises(VersionConflictError):
+            repo.update(pk, values={"name": "new"}, expected_version=1)
+        with pytest.raises(VersionConflictError):
+            repo.bulk_update({pk: {"name": "new"}}, expected_versions={pk: 1})
+
+    records = [r for r in caplog.records if r.name == "dbrepos.decorators"]
+    assert records
+    assert all(record.levelno == logging.DEBUG for record in records)
+    assert all(record.exc_info is None for record in records)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@versioned_repo_parametrize
+def test_save(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("versioned", runner, {"name": "name", "version": 1}).id
+    entity = repo.get_by_pk(pk, convert_to=VersionedEntity)
+    stale = repo.get_by_pk(pk, convert_to=VersionedEntity)
+
+    entity.name = "new"
+    assert repo.save(entity) is True
+    assert entity.version == 2
+    assert select_one("versioned", pk, runner, convert_to=VersionedEntity) == entity
+
+    stale.name = "stale"
+    with pytest.raises(VersionConflictError):
+        repo.save(stale)
+    assert select_one("versioned", pk, runner, convert_to=VersionedEntity) == entity
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@versioned_repo_parametrize
+def test_update_by_filters_bumps_version(
+    repo, runner, insert, select_one, Filter, FilterSeq, request
+):
+    repo = request.getfixturevalue(repo)
+    pk = insert("versioned", runner, {"name": "name", "version": 1}).id
+
+    assert (
+        repo.update_by_filters(
+            filters=FilterSeq(runner)(
+                mode.and_,
+                Filter(runner)(repo.table_class, "name", "name", operator.eq),
+            ),
+            values={"name": "new"},
+        )
+        == 1
+    )
+    assert select_one(
+        "versioned", pk, runner, convert_to=VersionedEntity
+    ) == VersionedEntity(id=pk, name="new", version=2)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@versioned_repo_parametrize
+def test_retry_on_conflict(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("versioned", runner, {"name": "name", "version": 1}).id
+    calls = []
+
+    def apply(entity):
+        calls.append(entity.version)
+        if len(calls) == 1:
+            # NOTE: concurrent writer wins the first attempt
+            repo.update(pk, values={"name": "concurrent"})
+        entity.name = entity.name + "!"
+
+    entity = retry_on_conflict(repo, pk, apply, convert_to=VersionedEntity)
+
+    assert calls == [1, 2]
+    assert entity == VersionedEntity(id=pk, name="concurrent!", version=3)
+    assert select_one("versioned", pk, runner, convert_to=VersionedEntity) == entity
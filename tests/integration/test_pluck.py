@@ -0,0 +1,82 @@
+import pytest
+
+from dbrepos.core.types import Extra, mode, operator
+from tests.parametrize import multi_repo_parametrize
+
+
+@pytest.fixture
+def rows(insert):
+    def _rows(runner):
+        return [
+            insert("table", runner, {"name": name, "is_deleted": is_deleted}).id
+            for name, is_deleted in (
+                ("b", False),
+                ("a", False),
+                ("b", False),
+                ("c", True),
+            )
+        ]
+
+    return _rows
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_pluck(repo, runner, rows, request):
+    repo = request.getfixturevalue(repo)
+    pks = rows(runner)
+    alive = slice(0, 3) if repo.is_soft_deletable else slice(0, 4)
+    names = ["b", "a", "b", "c"][alive]
+
+    assert repo.pluck("id") == pks[alive]
+    assert repo.pluck("name") == names
+    assert repo.pluck("name", flat=False) == [(name,) for name in names]
+    assert repo.pluck("id", extra=Extra(ordering=("-id",))) == pks[alive][::-1]
+    assert repo.pluck("name", distinct=True) == sorted(set(names))
+    assert repo.pluck(
+        "name", distinct=True, extra=Extra(ordering=("-name",))
+    ) == sorted(set(names), reverse=True)
+    assert repo.pluck("name", extra=Extra(include_soft_deleted=True)) == [
+        "b",
+        "a",
+        "b",
+        "c",
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_values(repo, runner, rows, Filter, FilterSeq, request):
+    repo = request.getfixturevalue(repo)
+    pks = rows(runner)
+    filters = FilterSeq(runner)(
+        mode.and_, Filter(runner)(repo.table_class, "name", "a", operator.ne)
+    )
+    expected = [(pks[0], "b"), (pks[2], "b")] + (
+        [] if repo.is_soft_deletable else [(pks[3], "c")]
+    )
+
+    assert repo.values(("id", "name"), filters=filters) == expected
+    assert repo.values(("name", "is_deleted"), distinct=True) == (
+        [("a", False), ("b", False)] + ([] if repo.is_soft_deletable else [("c", True)])
+    )
+    assert repo.values(("id",), filters=filters) == [(pk,) for pk, _ in expected]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_pluck_stream(repo, runner, rows, request):
+    repo = request.getfixturevalue(repo)
+    pks = rows(runner)
+
+    stream = repo.pluck("id", chunk_size=3, extra=Extra(include_soft_deleted=True))
+
+    assert not isinstance(stream, list)
+    assert next(stream) == pks[0]
+    assert list(stream) == pks[1:]
+    assert list(repo.values(("id", "name"), chunk_size=1)) == repo.values(
+        ("id", "name")
+    )
@@ -0,0 +1,127 @@
+import pytest
+
+from dbrepos.core.types import mode, operator
+
+purchase_repo_parametrize = pytest.mark.parametrize(
+    "repo,runner",
+    (
+        ("django_purchase_repo", "django"),
+        ("alchemy_purchase_repo", "alchemy"),
+    ),
+)
+
+
+@pytest.fixture
+def purchases(insert):
+    def _purchases(runner):
+        customers = []
+        for name, country in (("ann", "de"), ("bob", "fr"), ("cid", "de")):
+            customers.append(
+                insert(
+                    "customer",
+                    runner,
+                    {
+                        "name": name,
+                        "country": country,
+                        "referrer_id": customers[-1].id if customers else None,
+                    },
+                )
+            )
+        return [
+            insert(
+                "purchase",
+                runner,
+                {"name": name, "customer_id": customer.id if customer else None},
+            ).id
+            for name, customer in (
+                ("x", customers[0]),
+                ("y", customers[1]),
+                ("z", customers[2]),
+                ("w", None),
+            )
+        ]
+
+    return _purchases
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@purchase_repo_parametrize
+@pytest.mark.parametrize(
+    "mode_,conditions,expected",
+    (
+        (mode.and_, (("customer.country", "de", operator.eq),), [0, 2]),
+        (mode.and_, (("customer.referrer.country", "de", operator.eq),), [1]),
+        (
+            mode.and_,
+            (
+                ("customer.country", "de", operator.eq),
+                ("customer.name", "cid", operator.eq),
+            ),
+            [2],
+        ),
+        (
+            mode.or_,
+            (
+                ("customer.country", "fr", operator.eq),
+                ("name", "w", operator.eq),
+            ),
+            [1, 3],
+        ),
+        (mode.and_, (("customer.referrer.name", None, operator.is_),), [0, 3]),
+        (mode.and_, (("customer.country", "de", operator.ne),), [1]),
+        (mode.and_, (("customer.country", ["de"], operator.not_in),), [1]),
+        (mode.and_, (("customer.country", "de", operator.is_not),), [1, 3]),
+    ),
+)
+def test_related_filters(
+    mode_, conditions, expected, repo, runner, purchases, Filter, FilterSeq, request
+):
+    repo = request.getfixturevalue(repo)
+    pks = purchases(runner)
+    filters = FilterSeq(runner)(
+        mode_,
+        *(
+            Filter(runner)(repo.table_class, column_name, value, operator_)
+            for column_name, value, operator_ in conditions
+        ),
+    )
+
+    assert [row.id for row in repo.all_by_filters(filters=filters)] == [
+        pks[index] for index in expected
+    ]
+    assert repo.count_by_filters(filters=filters) == len(expected)
+    assert repo.exists_by_filters(filters=filters) is True
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@purchase_repo_parametrize
+def test_related_filters_writes(repo, runner, purchases, Filter, FilterSeq, request):
+    repo = request.getfixturevalue(repo)
+    pks = purchases(runner)
+
+    def by_country(country):
+        return FilterSeq(runner)(
+            mode.and_,
+            Filter(runner)(repo.table_class, "customer.country", country),
+        )
+
+    assert repo.update_by_filters(filters=by_country("de"), values={"name": "eu"}) == 2
+    assert repo.delete_by_filters(filters=by_country("fr")) == 1
+    assert [(row.id, row.name) for row in repo.all()] == [
+        (pks[0], "eu"),
+        (pks[2], "eu"),
+        (pks[3], "w"),
+    ]
+
+
+@pytest.mark.integration
+@purchase_repo_parametrize
+def test_related_filters_unknown_relation(repo, runner, Filter, request):
+    repo = request.getfixturevalue(repo)
+
+    with pytest.raises(AssertionError):
+        Filter(runner)(repo.table_class, "seller.country", "de")
+    with pytest.raises(AssertionError):
+        Filter(runner)(repo.table_class, "customer.city", "de")
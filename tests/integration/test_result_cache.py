@@ -0,0 +1,113 @@
+import threading
+from unittest import mock
+
+import pytest
+from django.db import transaction
+
+from dbrepos.cache import ResultCache
+from dbrepos.core.types import mode, operator
+from tests.entities import InsertTableEntity, TableEntity
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+@pytest.mark.parametrize("runner", ("alchemy", "django"))
+@pytest.mark.parametrize(
+    "write,write_kwargs",
+    (
+        ("create", {"entity": InsertTableEntity(name="name", is_deleted=False)}),
+        ("update", {"pk": 1, "values": {"name": "new"}}),
+        ("multi_update", {"pks": [1], "values": {"name": "new"}}),
+        ("delete", {"pk": 1}),
+        ("delete_by_field", {"name": "name", "value": "unknown"}),
+    ),
+)
+def test_result_cache(
+    runner,
+    write,
+    write_kwargs,
+    alchemy_repo_factory,
+    django_repo_factory,
+    insert,
+    Filter,
+    FilterSeq,
+):
+    repo = {"alchemy": alchemy_repo_factory, "django": django_repo_factory}[runner]()
+    repo.result_cache = ResultCache()
+
+    def filters():
+        return FilterSeq(runner)(
+            mode.and_,
+            Filter(runner)(repo.table_class, "name", "name", operator.eq),
+        )
+
+    insert("table", runner, {"name": "name", "is_deleted": False})
+
+    first = repo.all_by_filters(filters=filters(), convert_to=TableEntity)
+    assert repo.count_by_filters(filters=filters()) == 1
+    # NOTE: row inserted bypassing the repo is not visible until invalidation
+    insert("table", runner, {"name": "name", "is_deleted": False})
+    assert repo.all_by_filters(filters=filters(), convert_to=TableEntity) == first
+    assert repo.count_by_filters(filters=filters()) == 1
+    assert repo.result_cache.stats().hits == 2
+
+    getattr(repo, write)(**write_kwargs)
+
+    assert repo.all_by_filters(filters=filters(), convert_to=TableEntity) != first
+    assert repo.result_cache.stats().misses == 3
+
+
+@pytest.mark.integration
+def test_result_cache_alchemy_caller_session(
+    alchemy_repo_factory, insert, Filter, FilterSeq
+):
+    repo = alchemy_repo_factory()
+    repo.result_cache = ResultCache()
+
+    def count():
+        return repo.count_by_filters(
+            filters=FilterSeq("alchemy")(
+                mode.and_,
+                Filter("alchemy")(repo.table_class, "name", "name", operator.eq),
+            )
+        )
+
+    insert("table", "alchemy", {"name": "name", "is_deleted": False})
+    assert count() == 1
+
+    with repo.session_factory() as session:
+        repo.create(InsertTableEntity(name="name", is_deleted=False), session=session)
+        # NOTE: concurrent read caches rows of not yet committed transaction
+        reader = threading.Thread(target=count)
+        reader.start()
+        reader.join()
+
+    assert count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+def test_result_cache_django_atomic(django_repo_factory, Filter, FilterSeq):
+    repo = django_repo_factory()
+    repo.result_cache = mock.Mock(wraps=ResultCache())
+
+    def count():
+        return repo.count_by_filters(
+            filters=FilterSeq("django")(
+                mode.and_,
+                Filter("django")(repo.table_class, "name", "name", operator.eq),
+            )
+        )
+
+    assert count() == 0
+    with transaction.atomic():
+        repo.create(InsertTableEntity(name="name", is_deleted=False))
+        # NOTE: reads inside of transaction bypass the cache
+        assert count() == 1
+        assert repo.result_cache.get_or_load.call_count == 1
+        assert repo.result_cache.invalidate.call_count == 1
+
+    # NOTE: invalidated again after commit, rows of the old snapshot
+    # could be cached by concurrent reads until then
+    assert repo.result_cache.invalidate.call_count == 2
+    assert count() == 1
@@ -0,0 +1,113 @@
+import pytest
+import sqlalchemy as sa
+
+from dbrepos.cache import ResultCache
+from dbrepos.core.types import mode, operator
+from dbrepos.tracking import ChangeTracker
+from tests.entities import TableEntity
+from tests.parametrize import multi_repo_parametrize
+from tests.sqlalchemy import AlchemySyncDatabase
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("load", ("get_by_pk", "all_by_pks"))
+def test_save(load, repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    repo.change_tracker = ChangeTracker()
+    pk = insert("table", runner, {"name": "name", "is_deleted": False}).id
+
+    if load == "get_by_pk":
+        entity = repo.get_by_pk(pk, convert_to=TableEntity)
+    else:
+        (entity,) = repo.all_by_pks([pk], convert_to=TableEntity)
+
+    assert entity in repo.change_tracker
+    assert repo.save(entity) is False
+
+    entity.name = "new"
+    assert repo.save(entity) is True
+    assert select_one("table", pk, runner, convert_to=TableEntity) == TableEntity(
+        id=pk, name="new", is_deleted=False
+    )
+    # NOTE: snapshot is refreshed after save
+    assert repo.save(entity) is False
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_save_untracked(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("table", runner, {"name": "name", "is_deleted": False}).id
+
+    assert repo.save(TableEntity(id=pk, name="new", is_deleted=True)) is True
+    assert select_one("table", pk, runner, convert_to=TableEntity) == TableEntity(
+        id=pk, name="new", is_deleted=True
+    )
+
+
+@pytest.mark.integration
+def test_save_updates_only_changed_columns(alchemy_repo_factory, insert):
+    repo = alchemy_repo_factory()
+    repo.change_tracker = ChangeTracker()
+    pk = insert("table", "alchemy", {"name": "name", "is_deleted": False}).id
+    entity = repo.get_by_pk(pk, convert_to=TableEntity)
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = AlchemySyncDatabase._engine
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        repo.save(entity)
+        entity.is_deleted = True
+        repo.save(entity)
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert [statement.split(" WHERE ")[0] for statement in statements] == [
+        'UPDATE "table" SET is_deleted=?'
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+@pytest.mark.parametrize("runner", ("alchemy", "django"))
+def test_save_cached_read(
+    runner,
+    alchemy_repo_factory,
+    django_repo_factory,
+    insert,
+    select_one,
+    Filter,
+    FilterSeq,
+):
+    repo = {"alchemy": alchemy_repo_factory, "django": django_repo_factory}[runner]()
+    repo.change_tracker = ChangeTracker()
+    repo.result_cache = ResultCache()
+    pk = insert("table", runner, {"name": "name", "is_deleted": False}).id
+
+    def load():
+        (entity,) = repo.all_by_filters(
+            filters=FilterSeq(runner)(
+                mode.and_,
+                Filter(runner)(repo.table_class, "id", pk, operator.eq),
+            ),
+            convert_to=TableEntity,
+        )
+        return entity
+
+    first, second = load(), load()
+
+    assert repo.result_cache.stats().hits == 1
+    assert first in repo.change_tracker and second in repo.change_tracker
+    assert repo.save(second) is False
+    second.is_deleted = True
+    assert repo.change_tracker.changes(second) == {"is_deleted": True}
+    assert repo.save(second) is True
+    assert select_one("table", pk, runner, convert_to=TableEntity) == TableEntity(
+        id=pk, name="name", is_deleted=True
+    )
@@ -0,0 +1,106 @@
+import pytest
+
+from dbrepos.core.types import Extra, mode, operator
+from tests.entities import TableEntity
+from tests.parametrize import multi_repo_parametrize
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize(
+    "preload,n,use_filters,expected_preload_indexes_by_repo_soft_deletable",
+    (
+        ([], 4, False, {False: [], True: []}),
+        (
+            [{"name": "name", "is_deleted": False}],
+            4,
+            False,
+            {False: [0], True: [0]},
+        ),
+        (
+            [{"name": f"name{i}", "is_deleted": bool(i % 3 == 0)} for i in range(10)],
+            1,
+            False,
+            {False: list(range(10)), True: [1, 2, 4, 5, 7, 8]},
+        ),
+        (
+            [{"name": f"name{i}", "is_deleted": bool(i % 3 == 0)} for i in range(10)],
+            3,
+            False,
+            {False: list(range(10)), True: [1, 2, 4, 5, 7, 8]},
+        ),
+        (
+            [{"name": f"name{i}", "is_deleted": bool(i % 3 == 0)} for i in range(10)],
+            20,
+            False,
+            {False: list(range(10)), True: [1, 2, 4, 5, 7, 8]},
+        ),
+        (
+            [{"name": f"name{i}", "is_deleted": bool(i % 3 == 0)} for i in range(10)],
+            3,
+            True,
+            {False: [0, 1, 2], True: [1, 2]},
+        ),
+    ),
+)
+def test_scan_partitions(
+    preload,
+    n,
+    use_filters,
+    expected_preload_indexes_by_repo_soft_deletable,
+    repo,
+    runner,
+    insert,
+    Filter,
+    FilterSeq,
+    request,
+):
+    repo = request.getfixturevalue(repo)
+
+    preload_ids = []
+    for row in preload:
+        preload_ids.append(insert("table", runner, row).id)
+
+    filters = None
+    if use_filters:
+        filters = FilterSeq(runner)(
+            mode.and_,
+            Filter(runner)(
+                repo.table_class,
+                "name",
+                ["name0", "name1", "name2"],
+                operator.in_,
+            ),
+        )
+
+    result = list(repo.scan_partitions(n, filters=filters, convert_to=TableEntity))
+
+    expected_preload_indexes = expected_preload_indexes_by_repo_soft_deletable[
+        repo.is_soft_deletable
+    ]
+    assert [item.id for item in result] == [
+        preload_ids[index] for index in expected_preload_indexes
+    ]
+    assert all(isinstance(item, TableEntity) for item in result)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_scan_partitions_include_soft_deleted(repo, runner, insert, request):
+    repo = request.getfixturevalue(repo)
+
+    preload_ids = []
+    for i in range(6):
+        preload_ids.append(
+            insert("table", runner, {"name": "name", "is_deleted": bool(i % 2)}).id
+        )
+
+    result = repo.scan_partitions(
+        2,
+        convert_to=TableEntity,
+        extra=Extra(include_soft_deleted=True),
+    )
+
+    assert [item.id for item in result] == preload_ids
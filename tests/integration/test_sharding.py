@@ -0,0 +1,176 @@
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as orm
+
+from dbrepos.core.types import Extra, mode, operator, returning
+from dbrepos.sharding import HashRouter, RangeRouter, ShardedRepo
+from dbrepos.sqlalchemy.filters import AlchemyFilter, AlchemyFilterSeq
+from dbrepos.sqlalchemy.repo import AlchemyRepo
+from tests.entities import TableEntity
+from tests.sqlalchemy import AlchemyDatabase, AlchemyTable, metadata
+
+ROWS = [
+    TableEntity(id=id_, name=name, is_deleted=False)
+    for id_, name in ((1, "b"), (5, "a"), (12, "c"), (17, "a"), (23, "b"), (30, "c"))
+]
+
+
+@pytest.fixture
+def shards(tmp_path):
+    repos = []
+    for index in range(3):
+        database = AlchemyDatabase(
+            db_url=f"sqlite:///{tmp_path}/shard{index}.db",
+            create_engine=sa.create_engine,
+            scoped_session=orm.scoped_session,
+            session_maker=orm.sessionmaker,
+            session_class=orm.Session,
+        )
+        metadata.create_all(database._engine, tables=[AlchemyTable])
+        repos.append(
+            AlchemyRepo(table_class=AlchemyTable, session_factory=database.session)
+        )
+    return repos
+
+
+@pytest.fixture
+def sharded_repo(shards):
+    repo = ShardedRepo(shards, router=RangeRouter((10, 20)))
+    repo.bulk_create(ROWS)
+    yield repo
+    repo.close()
+
+
+def name_filter(value, operator_=operator.eq):
+    return AlchemyFilterSeq(
+        mode.and_, AlchemyFilter(AlchemyTable, "name", value, operator_)
+    )
+
+
+@pytest.mark.integration
+def test_rows_are_routed(sharded_repo, shards):
+    assert [
+        [row.id for row in shard.all(convert_to=TableEntity)] for shard in shards
+    ] == [[1, 5], [12, 17], [23, 30]]
+    assert sharded_repo.get_by_pk(17, convert_to=TableEntity) == ROWS[3]
+    assert [row.id for row in sharded_repo.all_by_pks([30, 1, 99])] == [1, 30]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "ordering,expected",
+    (
+        ((), [1, 5, 12, 17, 23, 30]),
+        (("-id",), [30, 23, 17, 12, 5, 1]),
+        (("name", "-id"), [17, 5, 23, 1, 30, 12]),
+    ),
+)
+def test_scatter_gather_merge(ordering, expected, sharded_repo):
+    rows = sharded_repo.all_by_filters(
+        filters=name_filter("z", operator.lt),
+        convert_to=TableEntity,
+        extra=Extra(ordering=ordering),
+    )
+
+    assert [row.id for row in rows] == expected
+    assert sharded_repo.get_by_filters(
+        filters=name_filter("a"),
+        convert_to=TableEntity,
+        extra=Extra(ordering=ordering or ("id",)),
+    ) == (ROWS[1] if "-id" not in ordering else ROWS[3])
+
+
+@pytest.mark.integration
+def test_scatter_gather_aggregates(sharded_repo):
+    assert sharded_repo.count_by_filters(filters=name_filter("a")) == 2
+    assert sharded_repo.count_by_field(name="name", value="c") == 2
+    assert sharded_repo.exists_by_filters(filters=name_filter("c")) is True
+    assert sharded_repo.exists_by_field(name="name", value="z") is False
+    assert sharded_repo.exists_by_pks([5, 23, 99]) == {5, 23}
+
+
+@pytest.mark.integration
+def test_writes(sharded_repo, shards):
+    sharded_repo.update(12, values={"name": "new"})
+    assert (
+        sharded_repo.update_by_filters(
+            filters=name_filter("b"), values={"is_deleted": True}
+        )
+        == 2
+    )
+    assert sharded_repo.multi_delete([5, 30]) == 2
+
+    assert [
+        (row.id, row.name, row.is_deleted)
+        for row in sharded_repo.all(convert_to=TableEntity)
+    ] == [(1, "b", True), (12, "new", False), (17, "a", False), (23, "b", True)]
+
+
+@pytest.mark.integration
+def test_create_returning_rows(shards):
+    repo = ShardedRepo(shards, router=HashRouter(3))
+    created = repo.bulk_create(ROWS, convert_to=TableEntity, returning_=returning.row)
+
+    assert created == ROWS
+    assert (
+        sum(
+            shard.count_by_filters(filters=name_filter("z", operator.lt))
+            for shard in shards
+        )
+        == 6
+    )
+    assert (
+        repo.create(
+            TableEntity(id=40, name="d", is_deleted=False), returning_=returning.pk
+        )
+        == 40
+    )
+    assert repo.get_by_pk(40, convert_to=TableEntity).name == "d"
+    repo.close()
+
+
+@pytest.mark.integration
+def test_field_shard_key(shards):
+    repo = ShardedRepo(shards, router=RangeRouter(("b", "c")), shard_key="name")
+    repo.bulk_create(ROWS)
+
+    assert [
+        sorted({row.name for row in shard.all(convert_to=TableEntity)})
+        for shard in shards
+    ] == [["a"], ["b"], ["c"]]
+    assert [row.id for row in repo.all_by_field(name="name", value="b")] == [1, 23]
+    # NOTE: pk lookups are scattered when pk is not the shard key
+    assert repo.get_by_pk(30, convert_to=TableEntity) == ROWS[5]
+    repo.delete(30)
+    assert repo.count_by_filters(filters=name_filter("c")) == 1
+    repo.close()
+
+
+@pytest.mark.integration
+def test_create_stream(shards):
+    repo = ShardedRepo(shards, router=RangeRouter((10, 20)))
+
+    stats = repo.create_stream(iter(ROWS), batch_size=2, commit_every=2)
+
+    assert (stats.rows, stats.batches, stats.commits) == (6, 3, 2)
+    assert [
+        shard.count_by_field(name="is_deleted", value=False) for shard in shards
+    ] == [2, 2, 2]
+    repo.close()
+
+
+@pytest.mark.integration
+def test_pluck(sharded_repo):
+    assert sharded_repo.pluck("id", extra=Extra(ordering=("-id",))) == [
+        30,
+        23,
+        17,
+        12,
+        5,
+        1,
+    ]
+    assert sharded_repo.pluck("name", distinct=True) == ["a", "b", "c"]
+    assert sharded_repo.values(("id", "name"), filters=name_filter("a")) == [
+        (5, "a"),
+        (17, "a"),
+    ]
@@ -0,0 +1,84 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from django.db import transaction
+
+from dbrepos.core.types import Extra, mode, operator
+from dbrepos.singleflight import SingleFlight
+from tests.entities import TableEntity
+from tests.parametrize import multi_repo_parametrize
+
+THREADS = 8
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize(
+    "method,kwargs",
+    (
+        ("get_by_filters", {"convert_to": TableEntity}),
+        ("all_by_filters", {"convert_to": TableEntity}),
+        ("all_by_filters", {"extra": Extra(ordering=("-id",))}),
+        ("count_by_filters", {}),
+        ("exists_by_filters", {}),
+    ),
+)
+def test_single_flight(
+    method, kwargs, repo, runner, insert, Filter, FilterSeq, request
+):
+    repo = request.getfixturevalue(repo)
+    for i in range(3):
+        insert("table", runner, {"name": f"name{i}", "is_deleted": i == 0})
+
+    def filters():
+        return FilterSeq(runner)(
+            mode.and_,
+            Filter(runner)(repo.table_class, "name", "name2", operator.lt),
+        )
+
+    expected = getattr(repo, method)(filters=filters(), **kwargs)
+    if method == "all_by_filters":
+        expected = list(expected)
+
+    repo.single_flight = SingleFlight()
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = list(
+            pool.map(
+                lambda _: getattr(repo, method)(filters=filters(), **kwargs),
+                range(THREADS),
+            )
+        )
+
+    if method == "all_by_filters":
+        results = [list(result) for result in results]
+    if kwargs.get("convert_to") is not None or method != "all_by_filters":
+        assert all(result == expected for result in results)
+    else:
+        assert all(len(result) == len(expected) for result in results)
+    stats = repo.single_flight.stats()
+    assert stats.executions + stats.coalesced == THREADS
+    assert stats.in_flight == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+def test_single_flight_django_atomic(django_repo, Filter, FilterSeq):
+    django_repo.single_flight = mock.Mock(wraps=SingleFlight())
+
+    def exists():
+        return django_repo.exists_by_filters(
+            filters=FilterSeq("django")(
+                mode.and_,
+                Filter("django")(django_repo.table_class, "name", "name", operator.eq),
+            )
+        )
+
+    # NOTE: transaction must not share rows with concurrent callers
+    with transaction.atomic():
+        assert not exists()
+    django_repo.single_flight.do.assert_not_called()
+
+    assert not exists()
+    django_repo.single_flight.do.assert_called_once()
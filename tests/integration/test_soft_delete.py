@@ -0,0 +1,114 @@
+import pytest
+
+from dbrepos.core.exceptions import BaseRepoException
+from dbrepos.core.types import Extra, SoftDeleteMarker, operator
+from tests.entities import TableEntity
+from tests.parametrize import multi_repo_parametrize
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize(
+    "preload,pk_index,expected_result",
+    (
+        (
+            [{"name": "name", "is_deleted": False}],
+            0,
+            [(1, "name", True)],
+        ),
+        (
+            [
+                {"name": "name1", "is_deleted": False},
+                {"name": "name2", "is_deleted": False},
+            ],
+            1,
+            [(1, "name1", False), (2, "name2", True)],
+        ),
+    ),
+)
+def test_soft_delete(
+    preload,
+    pk_index,
+    expected_result,
+    repo,
+    runner,
+    insert,
+    select,
+    request,
+):
+    repo = request.getfixturevalue(repo)
+
+    preload_ids = []
+    for row in preload:
+        preload_ids.append(insert("table", runner, row).id)
+
+    if not repo.is_soft_deletable:
+        with pytest.raises(BaseRepoException):
+            repo.soft_delete(preload_ids[pk_index])
+        return
+
+    assert repo.soft_delete(preload_ids[pk_index]) is None
+    assert [
+        (preload_ids.index(id_) + 1, name, bool(is_deleted))
+        for id_, name, is_deleted in select("table", runner)
+    ] == expected_result
+    assert repo.get_by_pk(preload_ids[pk_index], strict=False) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_bulk_soft_delete(repo, runner, insert, request):
+    repo = request.getfixturevalue(repo)
+
+    preload_ids = []
+    for is_deleted in (False, True, False, False):
+        preload_ids.append(
+            insert("table", runner, {"name": "name", "is_deleted": is_deleted}).id
+        )
+
+    if not repo.is_soft_deletable:
+        with pytest.raises(BaseRepoException):
+            repo.bulk_soft_delete(preload_ids)
+        return
+
+    assert repo.bulk_soft_delete([]) == 0
+    # NOTE: already soft deleted row is not updated again
+    assert repo.bulk_soft_delete(preload_ids[:3]) == 2
+    assert [item.id for item in repo.all(convert_to=TableEntity)] == preload_ids[3:]
+    assert [
+        item.is_deleted
+        for item in repo.all(
+            convert_to=TableEntity, extra=Extra(include_soft_deleted=True)
+        )
+    ] == [True, True, True, False]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize("runner", ("alchemy", "django"))
+def test_soft_delete_marker(runner, alchemy_repo_factory, django_repo_factory, insert):
+    repo = {"alchemy": alchemy_repo_factory, "django": django_repo_factory}[runner](
+        is_soft_deletable=True
+    )
+    # NOTE: marks rows named "deleted" as soft deleted
+    repo.soft_delete_marker = SoftDeleteMarker(
+        column="name",
+        alive="deleted",
+        operator_=operator.lt,
+        deleted=lambda: "deleted",
+    )
+
+    first = insert("table", runner, {"name": "a", "is_deleted": False}).id
+    second = insert("table", runner, {"name": "b", "is_deleted": True}).id
+
+    assert [item.id for item in repo.all(convert_to=TableEntity)] == [first, second]
+    assert repo.bulk_soft_delete([first]) == 1
+    assert [item.id for item in repo.all(convert_to=TableEntity)] == [second]
+    assert repo.get_by_pk(first, convert_to=TableEntity, strict=False) is None
+    assert repo.get_by_pk(
+        first,
+        convert_to=TableEntity,
+        extra=Extra(include_soft_deleted=True),
+    ) == TableEntity(id=first, name="deleted", is_deleted=False)
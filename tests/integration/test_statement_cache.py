@@ -0,0 +1,67 @@
+from unittest import mock
+
+import pytest
+
+from dbrepos.core.types import CacheStats, Extra
+from dbrepos.sqlalchemy.repo import AlchemyRepo
+from tests.entities import TableEntity
+from tests.sqlalchemy import AlchemyTable
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("is_soft_deletable", (False, True))
+def test_statement_cache(is_soft_deletable, alchemy_repo_factory, insert):
+    repo = alchemy_repo_factory(is_soft_deletable=is_soft_deletable)
+    first = insert("table", "alchemy", {"name": "name1", "is_deleted": False})
+    second = insert("table", "alchemy", {"name": "name2", "is_deleted": False})
+
+    assert repo.get_by_pk(first.id, convert_to=TableEntity).id == first.id
+    assert repo.get_by_pk(second.id, convert_to=TableEntity).id == second.id
+    assert repo.get_by_pk(first.id, convert_to=TableEntity).id == first.id
+    assert repo.statement_cache.stats() == CacheStats(hits=2, misses=1, size=1)
+
+    assert repo.get_by_pk(first.id, extra=Extra(ordering=("-id",))) is not None
+    assert repo.exists_by_field(name="name", value="name2") is True
+    assert repo.exists_by_field(name="name", value=None) is False
+    assert repo.exists_by_pks([first.id, second.id, 0]) == {first.id, second.id}
+    assert repo.exists_by_pks([second.id]) == {second.id}
+    assert repo.statement_cache.stats() == CacheStats(hits=3, misses=5, size=5)
+    # NOTE: ordering passed as a list is keyed as the equal tuple
+    assert repo.get_by_pk(first.id, extra=Extra(ordering=["-id"])) is not None
+    assert repo.statement_cache.stats() == CacheStats(hits=4, misses=5, size=5)
+
+    repo.delete(first.id)
+    repo.delete_by_field(name="name", value="name2")
+
+    assert repo.all() == []
+
+
+@pytest.mark.integration
+def test_statement_cache_disabled(alchemy_session_factory):
+    repo = AlchemyRepo(
+        table_class=AlchemyTable,
+        session_factory=alchemy_session_factory,
+        statement_cache_size=0,
+    )
+
+    assert repo.statement_cache is None
+    assert repo.get_by_pk(1, strict=False) is None
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("prepare_threshold", (None, 1))
+def test_statement_cache_prepare_threshold(prepare_threshold, alchemy_session_factory):
+    repo = AlchemyRepo(
+        table_class=AlchemyTable,
+        session_factory=alchemy_session_factory,
+        prepare_threshold=prepare_threshold,
+    )
+    session = mock.Mock()
+    connection = session.connection.return_value.connection.dbapi_connection
+    connection.prepare_threshold = 5
+
+    repo.get_by_pk(1, strict=False, session=session)
+
+    assert connection.prepare_threshold == (prepare_threshold or 5)
+    # NOTE: drivers without server-side prepares are left untouched
+    assert repo.get_by_pk(1, strict=False) is None
@@ -0,0 +1,90 @@
+import pytest
+import sqlalchemy as sa
+
+from dbrepos.core.types import mode, operator
+from dbrepos.sqlalchemy.filters import AlchemyFilter, AlchemyFilterSeq
+from tests.parametrize import multi_repo_parametrize
+from tests.sqlalchemy import AlchemySyncDatabase
+
+
+def counter_repo_for(runner, request):
+    return request.getfixturevalue(f"{runner}_counter_repo")
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+@pytest.mark.parametrize("operator_", (operator.in_subquery, operator.exists_subquery))
+def test_subquery_filter(operator_, repo, runner, insert, Filter, FilterSeq, request):
+    repo = request.getfixturevalue(repo)
+    counter_repo = counter_repo_for(runner, request)
+    for name in ("a", "b", "c", "d"):
+        insert("table", runner, {"name": name, "is_deleted": False})
+    for name, value in (("a", 5), ("c", 0), ("d", 7), ("d", 9)):
+        insert("counter", runner, {"name": name, "value": value})
+    busy = counter_repo.subquery(
+        "name",
+        filters=FilterSeq(runner)(
+            mode.and_,
+            Filter(runner)(counter_repo.table_class, "value", 1, operator.gt),
+        ),
+    )
+    filters = FilterSeq(runner)(
+        mode.and_, Filter(runner)(repo.table_class, "name", busy, operator_)
+    )
+
+    assert [row.name for row in repo.all_by_filters(filters=filters)] == ["a", "d"]
+    assert repo.count_by_filters(filters=filters) == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@multi_repo_parametrize
+def test_subquery_skips_soft_deleted(repo, runner, insert, Filter, FilterSeq, request):
+    repo = request.getfixturevalue(repo)
+    counter_repo = counter_repo_for(runner, request)
+    for name, is_deleted in (("a", False), ("b", True)):
+        insert("table", runner, {"name": name, "is_deleted": is_deleted})
+    for name in ("a", "b", "c"):
+        insert("counter", runner, {"name": name, "value": 0})
+    filters = FilterSeq(runner)(
+        mode.and_,
+        Filter(runner)(
+            counter_repo.table_class,
+            "name",
+            repo.subquery("name"),
+            operator.in_subquery,
+        ),
+    )
+
+    assert [row.name for row in counter_repo.all_by_filters(filters=filters)] == (
+        ["a"] if repo.is_soft_deletable else ["a", "b"]
+    )
+
+
+@pytest.mark.integration
+def test_subquery_is_single_statement(alchemy_repo, alchemy_counter_repo, insert):
+    insert("table", "alchemy", {"name": "a", "is_deleted": False})
+    insert("counter", "alchemy", {"name": "a", "value": 0})
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    busy = alchemy_counter_repo.subquery("name")
+    engine = AlchemySyncDatabase._engine
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        assert alchemy_repo.exists_by_filters(
+            filters=AlchemyFilterSeq(
+                mode.and_,
+                AlchemyFilter(
+                    alchemy_repo.table_class, "name", busy, operator.exists_subquery
+                ),
+            )
+        )
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(statements) == 1
+    assert "EXISTS (SELECT counter.name" in statements[0]
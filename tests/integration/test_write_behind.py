@@ -0,0 +1,114 @@
+import pytest
+import sqlalchemy as sa
+
+from dbrepos.writebehind import WriteBehindBuffer
+from tests.entities import CounterEntity, VersionedEntity
+from tests.sqlalchemy import AlchemySyncDatabase
+
+counter_repo_parametrize = pytest.mark.parametrize(
+    "repo,runner",
+    (
+        ("django_counter_repo", "django"),
+        ("alchemy_counter_repo", "alchemy"),
+    ),
+)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@counter_repo_parametrize
+def test_bulk_update(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pks = [
+        insert("counter", runner, {"name": "name", "value": value}).id
+        for value in (1, 10, 100)
+    ]
+
+    assert (
+        repo.bulk_update(
+            {pks[0]: {"name": "a"}, pks[1]: {"name": "b", "value": 5}},
+            deltas={pks[0]: {"value": 2}, pks[1]: {"value": -1}},
+        )
+        == 2
+    )
+    assert [
+        select_one("counter", pk, runner, convert_to=CounterEntity) for pk in pks
+    ] == [
+        CounterEntity(id=pks[0], name="a", value=3),
+        CounterEntity(id=pks[1], name="b", value=4),
+        CounterEntity(id=pks[2], name="name", value=100),
+    ]
+    assert repo.bulk_update({}) == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "repo,runner",
+    (
+        ("django_versioned_repo", "django"),
+        ("alchemy_versioned_repo", "alchemy"),
+    ),
+)
+def test_bulk_update_bumps_version(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pk = insert("versioned", runner, {"name": "name", "version": 1}).id
+
+    repo.bulk_update({pk: {"name": "new"}})
+
+    assert select_one(
+        "versioned", pk, runner, convert_to=VersionedEntity
+    ) == VersionedEntity(id=pk, name="new", version=2)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@counter_repo_parametrize
+def test_write_behind(repo, runner, insert, select_one, request):
+    repo = request.getfixturevalue(repo)
+    pks = [insert("counter", runner, {"name": "name", "value": 0}).id for _ in range(2)]
+
+    with WriteBehindBuffer(repo, flush_interval=None) as buffer:
+        for _ in range(50):
+            buffer.increment(pks[0], "value")
+            buffer.update(pks[1], values={"name": "seen"})
+        buffer.increment(pks[1], "value", by=3)
+
+        assert (
+            select_one("counter", pks[0], runner, convert_to=CounterEntity).value == 0
+        )
+        assert buffer.flush() == 2
+
+    assert [
+        select_one("counter", pk, runner, convert_to=CounterEntity) for pk in pks
+    ] == [
+        CounterEntity(id=pks[0], name="name", value=50),
+        CounterEntity(id=pks[1], name="seen", value=3),
+    ]
+    assert buffer.stats().flushes == 1
+
+
+@pytest.mark.integration
+def test_write_behind_single_statement(alchemy_counter_repo, insert):
+    pks = [
+        insert("counter", "alchemy", {"name": "name", "value": 0}).id for _ in range(10)
+    ]
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    buffer = WriteBehindBuffer(alchemy_counter_repo, flush_interval=None)
+    for pk in pks:
+        buffer.increment(pk, "value")
+        buffer.update(pk, values={"name": f"name{pk}"})
+
+    engine = AlchemySyncDatabase._engine
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        buffer.close()
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE counter SET")
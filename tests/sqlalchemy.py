@@ -21,6 +21,35 @@ AlchemyTable = sa.Table(
     sa.Column("name", sa.String(100)),
     sa.Column("is_deleted", sa.Boolean),
 )
+AlchemyVersionedTable = sa.Table(
+    "versioned",
+    metadata,
+    sa.Column("id", sa.BigInteger, primary_key=True),
+    sa.Column("name", sa.String(100)),
+    sa.Column("version", sa.Integer),
+)
+AlchemyCounterTable = sa.Table(
+    "counter",
+    metadata,
+    sa.Column("id", sa.BigInteger, primary_key=True),
+    sa.Column("name", sa.String(100)),
+    sa.Column("value", sa.Integer),
+)
+AlchemyCustomerTable = sa.Table(
+    "customer",
+    metadata,
+    sa.Column("id", sa.BigInteger, primary_key=True),
+    sa.Column("name", sa.String(100)),
+    sa.Column("country", sa.String(100)),
+    sa.Column("referrer_id", sa.BigInteger, sa.ForeignKey("customer.id")),
+)
+AlchemyPurchaseTable = sa.Table(
+    "purchase",
+    metadata,
+    sa.Column("id", sa.BigInteger, primary_key=True),
+    sa.Column("name", sa.String(100)),
+    sa.Column("customer_id", sa.BigInteger, sa.ForeignKey("customer.id")),
+)
 
 
 class AlchemyDatabase:
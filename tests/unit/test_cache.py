@@ -0,0 +1,146 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from dbrepos.cache import ResultCache, _approximate_size
+from dbrepos.core.types import CacheStats
+from tests.entities import TableEntity
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+def test_result_cache_hit_and_ttl():
+    clock = Clock()
+    cache = ResultCache(ttl=10, clock=clock)
+    load = mock.Mock(side_effect=["first", "second"])
+
+    assert cache.get_or_load("table", "key", load) == "first"
+    clock.now = 9.9
+    assert cache.get_or_load("table", "key", load) == "first"
+    clock.now = 10
+    assert cache.get_or_load("table", "key", load) == "second"
+
+    assert load.call_count == 2
+    assert cache.stats() == CacheStats(hits=1, misses=2, size=1)
+
+
+@pytest.mark.unit
+def test_result_cache_lru_eviction():
+    cache = ResultCache(maxsize=2)
+    load = mock.Mock(side_effect=["a", "b", "c", "b2"])
+
+    assert cache.get_or_load("table", "a", load) == "a"
+    assert cache.get_or_load("table", "b", load) == "b"
+    assert cache.get_or_load("table", "a", load) == "a"
+    assert cache.get_or_load("table", "c", load) == "c"
+    assert cache.get_or_load("table", "a", load) == "a"
+    assert cache.get_or_load("table", "b", load) == "b2"
+
+    assert cache.stats() == CacheStats(hits=2, misses=4, size=2)
+
+
+@pytest.mark.unit
+def test_result_cache_invalidate():
+    cache = ResultCache()
+    load = mock.Mock(side_effect=["first", "other", "second"])
+
+    assert cache.get_or_load("table", "key", load) == "first"
+    assert cache.get_or_load("other", "key", load) == "other"
+    cache.invalidate("table")
+    assert cache.get_or_load("table", "key", load) == "second"
+    assert cache.get_or_load("other", "key", load) == "other"
+
+    assert load.call_count == 3
+
+
+@pytest.mark.unit
+def test_result_cache_load_error_is_not_cached():
+    cache = ResultCache()
+    load = mock.Mock(side_effect=[ValueError, "result"])
+
+    with pytest.raises(ValueError):
+        cache.get_or_load("table", "key", load)
+    assert cache.get_or_load("table", "key", load) == "result"
+
+
+@pytest.mark.unit
+def test_result_cache_stampede_protection():
+    cache = ResultCache()
+    calls = []
+    barrier = threading.Barrier(8)
+    results = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return "result"
+
+    def worker():
+        barrier.wait()
+        results.append(cache.get_or_load("table", "key", load))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["result"] * 8
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kwargs", ({"maxsize": 0}, {"ttl": 0}, {"maxbytes": 0}))
+def test_result_cache_wrong_params(kwargs):
+    with pytest.raises(AssertionError):
+        ResultCache(**kwargs)
+
+
+@pytest.mark.unit
+def test_result_cache_invalidate_purges_table():
+    cache = ResultCache()
+    for key in ("a", "b"):
+        cache.get_or_load("table", key, lambda: key)
+    cache.get_or_load("other", "a", lambda: "other")
+
+    cache.invalidate("table")
+
+    assert cache.stats().size == 1
+    assert cache.get_or_load("other", "a", mock.Mock()) == "other"
+
+
+@pytest.mark.unit
+def test_result_cache_maxbytes():
+    small, large = list(range(10)), list(range(1000))
+    cache = ResultCache(maxbytes=3 * _approximate_size(small))
+
+    for key in ("a", "b", "c"):
+        cache.get_or_load("table", key, lambda: list(small))
+    assert cache.stats().size == 3
+    # NOTE: result larger than the whole cache is returned, but not cached
+    assert cache.get_or_load("table", "large", lambda: large) is large
+    assert cache.stats().size == 3
+
+    cache.get_or_load("table", "d", lambda: list(small))
+    load = mock.Mock(return_value=small)
+    cache.get_or_load("table", "a", load)
+
+    load.assert_called_once()
+    assert cache.stats().size == 3
+
+
+@pytest.mark.unit
+def test_approximate_size():
+    entities = [TableEntity(i, f"name{i}", False) for i in range(10)]
+
+    assert _approximate_size(entities) > _approximate_size(entities[:5])
+    assert _approximate_size(entities[0]) > _approximate_size(0)
@@ -1,10 +1,13 @@
+import importlib
 import inspect
 from unittest import mock
 
 import pytest
 
-from dbrepos.core.exceptions import BaseRepoException
-from dbrepos.decorators import convert, handle_error, session, strict
+from dbrepos.cache import ResultCache
+from dbrepos.core.exceptions import BaseRepoException, NotFoundError
+from dbrepos.core.types import Extra
+from dbrepos.decorators import convert, handle_error, repo_method, session, strict
 from tests.entities import TableEntity
 
 
@@ -84,6 +87,78 @@ def test_handle_error(return_value, side_effect, exceptions, expected_exception)
     func.assert_called_once()
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "side_effect,expected",
+    (
+        (NotFoundError, (NotFoundError,)),
+        (CustomRepoException, (BaseRepoException,)),
+    ),
+)
+def test_handle_error_expected(side_effect, expected):
+    func, logger = mock.Mock(side_effect=side_effect("Not found.")), mock.Mock()
+
+    with pytest.raises(side_effect):
+        handle_error(func, logger=logger, expected=expected)()
+
+    logger.debug.assert_called_once_with("Expected error - %s", func.side_effect)
+    logger.error.assert_not_called()
+    logger.critical.assert_not_called()
+
+
+@pytest.mark.unit
+def test_handle_error_throttle():
+    func, logger = mock.Mock(side_effect=BaseRepoException("error")), mock.Mock()
+    throttle = mock.Mock()
+    throttle.acquire.side_effect = [0, None, None, 2]
+    decorated = handle_error(
+        func, logger=logger, exceptions=(BaseRepoException,), throttle=throttle
+    )
+
+    for _ in range(4):
+        with pytest.raises(BaseRepoException):
+            decorated()
+
+    assert logger.error.call_args_list == [
+        mock.call("Expected error - error", exc_info=func.side_effect),
+        mock.call(
+            "Expected error - error (2 similar suppressed)",
+            exc_info=func.side_effect,
+        ),
+    ]
+    assert logger.debug.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("decorator_throttle", (False, True))
+def test_repo_method_log_throttle(decorator_throttle):
+    func, logger = mock.Mock(side_effect=BaseRepoException("error")), mock.Mock()
+    func.__name__ = "func"
+    repo, throttle = mock.Mock(), mock.Mock()
+    throttle.acquire.side_effect = [0, None, 1]
+    if decorator_throttle:
+        repo.log_throttle = mock.Mock()
+        decorated = repo_method(func, logger=logger, throttle=throttle)
+    else:
+        repo.log_throttle = throttle
+        decorated = repo_method(func, logger=logger)
+
+    for _ in range(3):
+        with pytest.raises(BaseRepoException):
+            decorated(repo)
+
+    assert throttle.acquire.call_args_list == [mock.call(BaseRepoException)] * 3
+    assert logger.error.call_args_list == [
+        mock.call("Expected error - error", exc_info=func.side_effect),
+        mock.call(
+            "Expected error - error (1 similar suppressed)",
+            exc_info=func.side_effect,
+        ),
+    ]
+    if decorator_throttle:
+        repo.log_throttle.acquire.assert_not_called()
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "session_factory,expected_error",
@@ -184,3 +259,249 @@ def test_convert(many, orm, convert_to, result, expected_result):
     func = mock.Mock(return_value=result)
 
     assert convert(func, many=many, orm=orm)(convert_to=convert_to) == expected_result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "use_cache,kwargs,expected_calls",
+    (
+        (False, {}, 2),
+        (True, {}, 1),
+        (True, {"session": "session"}, 2),
+        (True, {"extra": Extra(for_update=True)}, 2),
+        (True, {"extra": Extra(ordering=("-id",))}, 1),
+    ),
+)
+@pytest.mark.parametrize("many", (False, True))
+def test_repo_method_cached(use_cache, kwargs, expected_calls, many):
+    repo = mock.Mock()
+    repo.result_cache = ResultCache() if use_cache else None
+    func = mock.Mock(return_value=obj)
+    func.__name__ = "func"
+    if many:
+        func.side_effect = lambda *args, **kwargs: iter([1, 2])
+
+    first = repo_method(func, cached=True, many=many)(repo, **kwargs)
+    second = repo_method(func, cached=True, many=many)(repo, **kwargs)
+
+    assert func.call_count == expected_calls
+    if many:
+        assert list(first) == list(second) == [1, 2]
+        assert first is not second
+    else:
+        assert first == second == obj
+        assert (first is second) is (expected_calls == 2)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("many", (False, True))
+def test_repo_method_cached_copies(many):
+    repo = mock.Mock()
+    repo.result_cache = ResultCache()
+    entity = TableEntity(1, "name", False)
+    func = mock.Mock(return_value=[entity] if many else entity)
+    func.__name__ = "func"
+
+    first = repo_method(func, cached=True, many=many)(repo)
+    (first[0] if many else first).name = "changed"
+    second = repo_method(func, cached=True, many=many)(repo)
+
+    assert func.call_count == 1
+    assert second == ([TableEntity(1, "name", False)] if many else entity)
+    assert (second[0] if many else second) is not entity
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "use_group,kwargs,expect_group",
+    (
+        (False, {}, False),
+        (True, {}, True),
+        (True, {"session": "session"}, False),
+        (True, {"extra": Extra(for_update=True)}, False),
+        (True, {"extra": Extra(ordering=("-id",))}, True),
+    ),
+)
+@pytest.mark.parametrize("many", (False, True))
+def test_repo_method_singleflight(use_group, kwargs, expect_group, many):
+    repo = mock.Mock()
+    repo.single_flight = (
+        mock.Mock(do=mock.Mock(side_effect=lambda key, load: load()))
+        if use_group
+        else None
+    )
+    func = mock.Mock(return_value=iter([1, 2]) if many else obj)
+    func.__name__ = "func"
+
+    result = repo_method(func, singleflight=True, many=many)(repo, **kwargs)
+
+    func.assert_called_once_with(repo, **kwargs)
+    if many:
+        assert list(result) == [1, 2]
+    else:
+        assert result == obj
+        assert (result is obj) is not expect_group
+    if expect_group:
+        repo.single_flight.do.assert_called_once()
+        key = repo.single_flight.do.call_args.args[0]
+        assert key[:2] == (repo.table_class, "func")
+    elif use_group:
+        repo.single_flight.do.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "session_factory,expected_error",
+    ((None, BaseRepoException), ("session_factory_mock", None)),
+)
+@pytest.mark.parametrize(
+    "session_,expect_internal",
+    ((None, True), ("session_mock", False)),
+)
+def test_repo_method_session(
+    session_,
+    expect_internal,
+    session_factory,
+    expected_error,
+    internal_session_mock,
+    request,
+):
+    session_, session_factory = (
+        request.getfixturevalue(session_) if session_ else session_,
+        (
+            request.getfixturevalue(session_factory)
+            if session_factory
+            else session_factory
+        ),
+    )
+    repo = mock.Mock()
+    repo.session_factory = session_factory
+    func = mock.Mock()
+    func.__name__ = "func"
+    logger = mock.Mock()
+
+    if expected_error:
+        with pytest.raises(expected_error):
+            repo_method(func, session=True, logger=logger)(repo, session=session_)
+        func.assert_not_called()
+        logger.error.assert_called_once()
+    else:
+        repo_method(func, session=True, logger=logger)(repo, session=session_)
+        func.assert_called_once_with(
+            repo, session=internal_session_mock if expect_internal else session_
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "side_effect,strict_,expected_result",
+    (
+        (None, False, obj),
+        (None, True, obj),
+        (NotFoundError, False, None),
+        (NotFoundError, True, NotFoundError),
+        (CustomRepoException, False, None),
+        (CustomRepoException, True, CustomRepoException),
+        (ValueError, False, ValueError),
+    ),
+)
+def test_repo_method_strict(side_effect, strict_, expected_result):
+    func, logger = mock.Mock(return_value=obj, side_effect=side_effect), mock.Mock()
+    func.__name__ = "func"
+    decorated = repo_method(func, strict=True, logger=logger)
+
+    if inspect.isclass(expected_result):
+        with pytest.raises(expected_result):
+            decorated(mock.Mock(), strict=strict_)
+    else:
+        assert decorated(mock.Mock(), strict=strict_) is expected_result
+
+    if side_effect is NotFoundError and strict_:
+        logger.debug.assert_called_once()
+        logger.error.assert_not_called()
+    elif side_effect is not None and expected_result is side_effect:
+        logger.error.assert_called_once()
+    else:
+        logger.debug.assert_not_called()
+        logger.error.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "many,convert_to,result,expected_result",
+    (
+        (False, None, [(1, "name", False)], (1, "name", False)),
+        (True, None, [(1, "name", False)], [(1, "name", False)]),
+        (False, TableEntity, (1, "name", False), TableEntity(1, "name", False)),
+        (True, TableEntity, [(1, "name", False)], [TableEntity(1, "name", False)]),
+    ),
+)
+def test_repo_method_convert(many, convert_to, result, expected_result):
+    repo = mock.Mock()
+    func = mock.Mock(return_value=result)
+    func.__name__ = "func"
+
+    assert (
+        repo_method(func, convert=True, many=many, orm="alchemy")(
+            repo, convert_to=convert_to
+        )
+        == expected_result
+    )
+    if convert_to is not None:
+        assert repo.change_tracker.track.call_count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "kwargs,expected_calls,expected_group_calls",
+    (
+        ({}, 1, 1),
+        ({"session": "session"}, 2, 0),
+        ({"extra": Extra(for_update=True)}, 2, 0),
+    ),
+)
+def test_repo_method_cached_singleflight(kwargs, expected_calls, expected_group_calls):
+    repo = mock.Mock()
+    repo.result_cache = ResultCache()
+    repo.single_flight = mock.Mock(do=mock.Mock(side_effect=lambda key, load: load()))
+    func = mock.Mock(side_effect=lambda *args, **kwargs: iter([1, 2]))
+    func.__name__ = "func"
+    decorated = repo_method(func, cached=True, singleflight=True, many=True)
+
+    first, second = decorated(repo, **kwargs), decorated(repo, **kwargs)
+
+    assert list(first) == list(second) == [1, 2]
+    assert first is not second
+    assert func.call_count == expected_calls
+    assert repo.single_flight.do.call_count == expected_group_calls
+    if expected_group_calls:
+        key = repo.single_flight.do.call_args.args[0]
+        assert key[:2] == (repo.table_class, "func")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("side_effect", (None, BaseRepoException))
+def test_repo_method_invalidates(side_effect):
+    repo = mock.Mock()
+    func = mock.Mock(side_effect=side_effect)
+    func.__name__ = "func"
+
+    if side_effect is not None:
+        with pytest.raises(side_effect):
+            repo_method(func, invalidates=True, logger=mock.Mock())(repo)
+    else:
+        repo_method(func, invalidates=True)(repo)
+
+    func.assert_called_once_with(repo)
+    repo.result_cache.invalidate.assert_called_once_with(repo.table_class)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("module", ("dbrepos.sqlalchemy.repo", "dbrepos.django.repo"))
+def test_repo_module_aliases(module):
+    repo_module = importlib.import_module(module)
+
+    assert repo_module.strict is strict
+    assert repo_module.handle_error is handle_error
+    assert repo_module.repo_method is repo_method
+    assert repo_module.convert is convert
@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+import pytest
+
+from dbrepos.core.extractors import field_extractor
+
+
+@dataclass
+class Nested:
+    value: int
+
+
+@dataclass
+class Entity:
+    name: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    nested: Nested | None = None
+
+
+@dataclass(slots=True)
+class SlottedEntity:
+    name: str
+    is_deleted: bool
+
+
+class Base:
+    __slots__ = ("name",)
+
+
+class Slotted(Base):
+    __slots__ = ("is_deleted", "__weakref__")
+
+    def __init__(self, name, is_deleted):
+        self.name = name
+        self.is_deleted = is_deleted
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "entity,columns,expected",
+    (
+        (Entity("a"), None, {"name": "a", "payload": {}, "nested": None}),
+        (Entity("a"), frozenset({"name", "payload"}), {"name": "a", "payload": {}}),
+        (Entity("a"), frozenset({"name", "other"}), {"name": "a"}),
+        (Entity("a"), frozenset(), {}),
+        (SlottedEntity("a", False), None, {"name": "a", "is_deleted": False}),
+        (Slotted("a", True), None, {"name": "a", "is_deleted": True}),
+        (Slotted("a", True), frozenset({"is_deleted"}), {"is_deleted": True}),
+    ),
+)
+def test_field_extractor(entity, columns, expected):
+    assert field_extractor(type(entity), columns)(entity) == expected
+
+
+@pytest.mark.unit
+def test_field_extractor_is_shallow_and_cached():
+    entity = Entity("a", payload={"key": [1]}, nested=Nested(1))
+
+    values = field_extractor(Entity)(entity)
+
+    assert values["payload"] is entity.payload
+    assert values["nested"] is entity.nested
+    assert field_extractor(Entity) is field_extractor(Entity)
+
+
+@pytest.mark.unit
+def test_field_extractor_unsupported_class():
+    class Plain:
+        pass
+
+    with pytest.raises(TypeError):
+        field_extractor(Plain)
@@ -1,11 +1,12 @@
 import pytest
 from django.db.models import Q
+from sqlalchemy.dialects import sqlite
 
 from dbrepos.core.types import operator
 from dbrepos.django.filters import DjangoFilter
-from dbrepos.sqlalchemy.filters import AlchemyFilter
+from dbrepos.sqlalchemy.filters import AlchemyFilter, _join
 from tests.django.tables.models import DjangoTable
-from tests.sqlalchemy import AlchemyTable
+from tests.sqlalchemy import AlchemyPurchaseTable, AlchemyTable
 
 
 @pytest.mark.unit
@@ -141,6 +142,31 @@ def test_filter_second_step(filter, value, operator, expected_value, expected_op
         (DjangoFilter(DjangoTable, "id", 1, operator.ge), Q(id__gte=1)),
         (DjangoFilter(DjangoTable, "id", [1], operator.in_), Q(id__in=[1])),
         (DjangoFilter(DjangoTable, "id", 1, operator.is_), Q(id=1)),
+        (
+            DjangoFilter(DjangoTable, "id", 1, operator.ne),
+            ~Q(id=1) & Q(id__isnull=False),
+        ),
+        (
+            DjangoFilter(DjangoTable, "id", [1], operator.not_in),
+            ~Q(id__in=[1]) & Q(id__isnull=False),
+        ),
+        (
+            DjangoFilter(DjangoTable, "id", (1, 2), operator.between),
+            Q(id__range=(1, 2)),
+        ),
+        (DjangoFilter(DjangoTable, "id", None, operator.is_not), ~Q(id=None)),
+        (
+            DjangoFilter(DjangoTable, "name", "a", operator.startswith),
+            Q(name__startswith="a"),
+        ),
+        (
+            DjangoFilter(DjangoTable, "name", "a", operator.contains),
+            Q(name__contains="a"),
+        ),
+        (
+            DjangoFilter(DjangoTable, "name", "a", operator.icontains),
+            Q(name__icontains="a"),
+        ),
         (AlchemyFilter(AlchemyTable, "id", 1, operator.eq), '"table".id = :id_1'),
         (AlchemyFilter(AlchemyTable, "id", 1, operator.lt), '"table".id < :id_1'),
         (AlchemyFilter(AlchemyTable, "id", 1, operator.le), '"table".id <= :id_1'),
@@ -151,7 +177,95 @@ def test_filter_second_step(filter, value, operator, expected_value, expected_op
             '"table".id IN (__[POSTCOMPILE_id_1])',
         ),
         (AlchemyFilter(AlchemyTable, "id", 1, operator.is_), '"table".id IS :id_1'),
+        (AlchemyFilter(AlchemyTable, "id", 1, operator.ne), '"table".id != :id_1'),
+        (
+            AlchemyFilter(AlchemyTable, "id", [1], operator.not_in),
+            '("table".id NOT IN (__[POSTCOMPILE_id_1]))',
+        ),
+        (
+            AlchemyFilter(AlchemyTable, "id", (1, 2), operator.between),
+            '"table".id BETWEEN :id_1 AND :id_2',
+        ),
+        (
+            AlchemyFilter(AlchemyTable, "id", None, operator.is_not),
+            '"table".id IS NOT NULL',
+        ),
+        (
+            AlchemyFilter(AlchemyTable, "name", "a", operator.contains),
+            "\"table\".name LIKE '%' || :name_1 || '%' ESCAPE '/'",
+        ),
+        (
+            AlchemyFilter(AlchemyTable, "name", "a", operator.icontains),
+            "lower(\"table\".name) LIKE '%' || lower(:name_1) || '%' ESCAPE '/'",
+        ),
     ),
 )
 def test_filter_compile(filter, expected_compiled):
     assert str(filter.compile()) == str(expected_compiled)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "prefix,expected_compiled",
+    (
+        (
+            "ab",
+            "\"table\".name >= 'ab' AND \"table\".name < 'ac' "
+            "AND (\"table\".name LIKE 'ab' || '%' ESCAPE '/')",
+        ),
+        (
+            "a\U0010ffff",
+            "\"table\".name >= 'a\U0010ffff' AND \"table\".name < 'b' "
+            "AND (\"table\".name LIKE 'a\U0010ffff' || '%' ESCAPE '/')",
+        ),
+        (
+            "\ud7ff",
+            "\"table\".name >= '\ud7ff' AND \"table\".name < '\ue000' "
+            "AND (\"table\".name LIKE '\ud7ff' || '%' ESCAPE '/')",
+        ),
+        ("", "\"table\".name LIKE '' || '%' ESCAPE '/'"),
+    ),
+)
+def test_startswith_compiles_to_range(prefix, expected_compiled):
+    compiled = AlchemyFilter(
+        AlchemyTable, "name", prefix, operator.startswith
+    ).compile()
+
+    assert (
+        str(compiled.compile(compile_kwargs={"literal_binds": True}))
+        == expected_compiled
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "prefix,expected_compiled",
+    (
+        ("ab", "\"table\".name LIKE 'ab' || '%' ESCAPE '/'"),
+        (1, "\"table\".name LIKE 1 || '%'"),
+    ),
+)
+def test_startswith_compiles_to_like(prefix, expected_compiled):
+    compiled = AlchemyFilter(
+        AlchemyTable, "name", prefix, operator.startswith
+    ).compile()
+
+    assert (
+        str(
+            compiled.compile(
+                dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        == expected_compiled
+    )
+
+
+@pytest.mark.unit
+def test_related_filters_share_join_alias():
+    first = AlchemyFilter(AlchemyPurchaseTable, "customer.country", "de")
+    second = AlchemyFilter(AlchemyPurchaseTable, "customer.name", "ann")
+
+    (first_join,) = first.joins
+    (second_join,) = second.joins
+    assert first_join.target is second_join.target
+    assert _join.cache_info().maxsize is not None
@@ -3,11 +3,11 @@ from unittest import mock
 import pytest
 from django.db.models import Q
 
-from dbrepos.core.types import mode
+from dbrepos.core.types import mode, operator
 from dbrepos.django.filters import DjangoFilter, DjangoFilterSeq
 from dbrepos.sqlalchemy.filters import AlchemyFilter, AlchemyFilterSeq
-from tests.django.tables.models import DjangoTable
-from tests.sqlalchemy import AlchemyTable
+from tests.django.tables.models import DjangoPurchaseTable, DjangoTable
+from tests.sqlalchemy import AlchemyPurchaseTable, AlchemyTable
 
 
 @pytest.mark.unit
@@ -154,3 +154,81 @@ def test_filterseq_compile(filterseq_class, mode, filters_results, expected_resu
     assert str(filterseq_class(mode, *filters).compile()) == str(expected_result)
     for filter in filters:
         filter.compile.assert_called_once_with()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "filterseq,expected_joins",
+    (
+        (
+            AlchemyFilterSeq(
+                mode.and_,
+                AlchemyFilter(AlchemyPurchaseTable, "customer.country", "de"),
+                AlchemyFilter(AlchemyPurchaseTable, "customer.name", "ann"),
+            ),
+            [("customer", False)],
+        ),
+        (
+            AlchemyFilterSeq(
+                mode.or_,
+                AlchemyFilter(AlchemyPurchaseTable, "customer.referrer.name", "ann"),
+                AlchemyFilter(AlchemyPurchaseTable, "name", "x"),
+            ),
+            [("customer", True), ("customer.referrer", True)],
+        ),
+        (
+            AlchemyFilterSeq(
+                mode.and_,
+                AlchemyFilter(AlchemyPurchaseTable, "customer.country", "de"),
+                AlchemyFilterSeq(
+                    mode.or_,
+                    AlchemyFilter(AlchemyPurchaseTable, "customer.name", None),
+                ),
+                AlchemyFilter(
+                    AlchemyPurchaseTable, "customer.referrer.name", None, operator.is_
+                ),
+            ),
+            [("customer", True), ("customer.referrer", True)],
+        ),
+        (
+            AlchemyFilterSeq(
+                mode.and_,
+                AlchemyFilter(
+                    AlchemyPurchaseTable, "customer.country", "de", operator.ne
+                ),
+            ),
+            [("customer", True)],
+        ),
+        (AlchemyFilterSeq(mode.and_, AlchemyFilter(AlchemyPurchaseTable, "name")), []),
+    ),
+)
+def test_filterseq_joins(filterseq, expected_joins):
+    joins = filterseq.joins
+
+    assert [(join.path, join.isouter) for join in joins] == expected_joins
+    assert len({id(join.target) for join in joins}) == len(joins)
+
+
+@pytest.mark.unit
+def test_filterseq_joins_share_aliases():
+    first = AlchemyFilter(AlchemyPurchaseTable, "customer.country", "de")
+    second = AlchemyFilter(AlchemyPurchaseTable, "customer.referrer.country", "de")
+
+    assert first.joins[0].target is second.joins[0].target
+    assert first.column.table is first.joins[0].target
+    assert str(first.compile()) == "purchase__customer.country = :country_1"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "column_name,expected_compiled",
+    (
+        ("customer.country", Q(customer__country="de")),
+        ("customer.referrer.country", Q(customer__referrer__country="de")),
+    ),
+)
+def test_django_related_filter(column_name, expected_compiled):
+    filter = DjangoFilter(DjangoPurchaseTable, column_name, "de")
+
+    assert filter.compile() == expected_compiled
+    assert filter.column_name == column_name
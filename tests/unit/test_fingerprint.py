@@ -0,0 +1,50 @@
+import pytest
+
+from dbrepos.core.fingerprint import fingerprint
+from dbrepos.core.types import Extra, mode, operator
+from dbrepos.django.filters import DjangoFilter, DjangoFilterSeq
+from dbrepos.sqlalchemy.filters import AlchemyFilter, AlchemyFilterSeq
+from tests.django.tables.models import DjangoTable
+from tests.entities import TableEntity
+from tests.sqlalchemy import AlchemyTable
+
+
+def alchemy_filters(value, operator_=operator.eq, mode_=mode.and_):
+    return AlchemyFilterSeq(
+        mode_,
+        AlchemyFilter(AlchemyTable, "name", value, operator_),
+        AlchemyFilterSeq(mode.or_, AlchemyFilter(AlchemyTable, "id", 1)),
+    )
+
+
+def django_filters(value, operator_=operator.eq, mode_=mode.and_):
+    return DjangoFilterSeq(
+        mode_,
+        DjangoFilter(DjangoTable, "name", value, operator_),
+        DjangoFilterSeq(mode.or_, DjangoFilter(DjangoTable, "id", 1)),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "left,right,expect_equal",
+    (
+        (alchemy_filters("a"), alchemy_filters("a"), True),
+        (alchemy_filters(["a", "b"]), alchemy_filters(["a", "b"]), True),
+        (alchemy_filters(["a", "b"]), alchemy_filters(["b", "a"]), False),
+        (alchemy_filters("a"), alchemy_filters("b"), False),
+        (alchemy_filters("a"), alchemy_filters("a", operator.ge), False),
+        (alchemy_filters("a"), alchemy_filters("a", mode_=mode.or_), False),
+        (django_filters("a"), django_filters("a"), True),
+        (django_filters({"a", "b"}), django_filters({"b", "a"}), True),
+        (django_filters("a"), django_filters("b"), False),
+        (Extra(), Extra(), True),
+        (Extra(ordering=("id",)), Extra(ordering=("-id",)), False),
+        ({"a": [1], "b": {"c": 2}}, {"b": {"c": 2}, "a": [1]}, True),
+        (TableEntity(1, "a", False), TableEntity(1, "a", False), True),
+        (TableEntity, TableEntity, True),
+    ),
+)
+def test_fingerprint(left, right, expect_equal):
+    hash(fingerprint(left))
+    assert (fingerprint(left) == fingerprint(right)) is expect_equal
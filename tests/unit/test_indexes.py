@@ -0,0 +1,141 @@
+from datetime import datetime
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateIndex
+
+from dbrepos.core.types import SoftDeleteMarker, operator
+from dbrepos.sqlalchemy.indexes import soft_delete_index
+from dbrepos.sqlalchemy.repo import AlchemyRepo
+from tests.sqlalchemy import AlchemySyncDatabase, AlchemyTable
+
+EventTable = sa.Table(
+    "event",
+    sa.MetaData(),
+    sa.Column("id", sa.BigInteger, primary_key=True),
+    sa.Column("name", sa.String(100)),
+    sa.Column("deleted_at", sa.DateTime, nullable=True),
+)
+DELETED_AT = SoftDeleteMarker("deleted_at", None, operator.is_, datetime.now)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "table,columns,marker,kwargs,dialect,expected_ddl",
+    (
+        (
+            AlchemyTable,
+            ("name",),
+            SoftDeleteMarker(),
+            {},
+            postgresql.dialect(),
+            'CREATE INDEX ix_name ON "table" (name) WHERE is_deleted = false',
+        ),
+        (
+            AlchemyTable,
+            ("name", "id"),
+            SoftDeleteMarker(),
+            {"unique": True},
+            sqlite.dialect(),
+            'CREATE UNIQUE INDEX ix_name_id ON "table" (name, id) '
+            "WHERE is_deleted = 0",
+        ),
+        (
+            EventTable,
+            ("name",),
+            DELETED_AT,
+            {},
+            postgresql.dialect(),
+            "CREATE INDEX ix_name ON event (name) WHERE deleted_at IS NULL",
+        ),
+    ),
+)
+def test_soft_delete_index(table, columns, marker, kwargs, dialect, expected_ddl):
+    name = "_".join(("ix", *columns))
+    index = soft_delete_index(name, table, *columns, marker=marker, **kwargs)
+
+    assert str(CreateIndex(index).compile(dialect=dialect)) == expected_ddl
+
+
+@pytest.mark.unit
+def test_soft_delete_index_existing():
+    table = sa.Table(
+        "indexed",
+        sa.MetaData(),
+        sa.Column("id", sa.BigInteger, primary_key=True),
+        sa.Column("name", sa.String(100)),
+        sa.Column("is_deleted", sa.Boolean),
+    )
+
+    index = soft_delete_index("ix", table, "name")
+
+    assert soft_delete_index("ix", table, "name") is index
+    assert table.indexes == {index}
+    with pytest.raises(AssertionError):
+        soft_delete_index("ix", table, "id")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "marker,kwargs",
+    (
+        (SoftDeleteMarker(alive=True), {}),
+        (SoftDeleteMarker("name", "removed", operator.ne), {}),
+        (SoftDeleteMarker(), {"unique": True}),
+        (SoftDeleteMarker(), {"postgresql_using": "hash"}),
+    ),
+)
+def test_soft_delete_index_existing_mismatch(marker, kwargs):
+    table = sa.Table(
+        "indexed",
+        sa.MetaData(),
+        sa.Column("id", sa.BigInteger, primary_key=True),
+        sa.Column("name", sa.String(100)),
+        sa.Column("is_deleted", sa.Boolean),
+    )
+    soft_delete_index("ix", table, "name")
+
+    with pytest.raises(AssertionError):
+        soft_delete_index("ix", table, "name", marker=marker, **kwargs)
+
+
+@pytest.mark.unit
+def test_soft_delete_index_existing_same_params():
+    table = sa.Table(
+        "indexed",
+        sa.MetaData(),
+        sa.Column("id", sa.BigInteger, primary_key=True),
+        sa.Column("name", sa.String(100)),
+        sa.Column("is_deleted", sa.Boolean),
+    )
+    kwargs = {"unique": True, "postgresql_using": "hash"}
+
+    index = soft_delete_index("ix", table, "name", **kwargs)
+
+    assert soft_delete_index("ix", table, "name", **kwargs) is index
+
+
+@pytest.mark.unit
+def test_repo_soft_delete_index_matches_read_predicate():
+    repo = AlchemyRepo(
+        table_class=EventTable,
+        is_soft_deletable=True,
+        session_factory=AlchemySyncDatabase.session,
+        soft_delete_marker=DELETED_AT,
+    )
+
+    index = repo.soft_delete_index("ix_name", "name")
+    query = repo._resolve_extra(qs=repo._select(), extra=None)
+
+    assert str(index.dialect_options["postgresql"]["where"]) in str(query)
+    assert "event.deleted_at IS NULL" in str(query)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "marker,expected_type",
+    ((SoftDeleteMarker(), bool), (DELETED_AT, datetime)),
+)
+def test_soft_delete_marker_deleted_value(marker, expected_type):
+    assert isinstance(marker.deleted_value(), expected_type)
@@ -1,5 +1,6 @@
 import pytest
 
+from dbrepos.core.types import SoftDeleteMarker
 from dbrepos.django.repo import DjangoRepo
 from dbrepos.sqlalchemy.repo import AlchemyRepo
 from tests.django.tables.models import DjangoTable
@@ -13,6 +14,33 @@ from tests.sqlalchemy import AlchemySyncDatabase, AlchemyTable
         (DjangoRepo, {"table_class": DjangoTable, "pk_field_name": "id"}, False),
         (DjangoRepo, {"table_class": DjangoTable, "pk_field_name": "pk"}, False),
         (DjangoRepo, {"table_class": DjangoTable, "pk_field_name": "od"}, True),
+        (
+            DjangoRepo,
+            {
+                "table_class": DjangoTable,
+                "is_soft_deletable": True,
+                "soft_delete_marker": SoftDeleteMarker(column="deleted_at"),
+            },
+            True,
+        ),
+        (
+            DjangoRepo,
+            {
+                "table_class": DjangoTable,
+                "soft_delete_marker": SoftDeleteMarker(column="deleted_at"),
+            },
+            False,
+        ),
+        (
+            AlchemyRepo,
+            {
+                "table_class": AlchemyTable,
+                "session_factory": AlchemySyncDatabase.session,
+                "is_soft_deletable": True,
+                "soft_delete_marker": SoftDeleteMarker(column="deleted_at"),
+            },
+            True,
+        ),
         (
             AlchemyRepo,
             {
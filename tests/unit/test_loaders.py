@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from unittest import mock
+
+import pytest
+
+from dbrepos.core.exceptions import BaseRepoException
+from dbrepos.core.types import Extra
+from dbrepos.loaders import PkLoader
+
+
+@dataclass
+class Row:
+    id: int
+
+
+class Repo:
+    pk_field_name = "id"
+
+    def __init__(self, existing):
+        self.existing = existing
+        self.all_by_pks = mock.Mock(side_effect=self._all_by_pks)
+
+    def _all_by_pks(self, pks, *, convert_to=None, extra=None):
+        return [Row(pk) for pk in pks if pk in self.existing]
+
+
+async def gather(*coros):
+    return await asyncio.gather(*coros, return_exceptions=True)
+
+
+@pytest.mark.unit
+def test_pk_loader_coalesces_tick():
+    repo = Repo(existing={1, 2, 3})
+    loader = PkLoader(repo)
+
+    result = asyncio.run(
+        gather(
+            loader.load(1),
+            loader.load(2),
+            loader.load(1),
+            loader.load(4, strict=False),
+            loader.load(4),
+        )
+    )
+
+    assert result[:4] == [Row(1), Row(2), Row(1), None]
+    assert isinstance(result[4], BaseRepoException)
+    repo.all_by_pks.assert_called_once_with([1, 2, 4], convert_to=None, extra=None)
+
+
+@pytest.mark.unit
+def test_pk_loader_batch_key():
+    repo = Repo(existing={1})
+    loader = PkLoader(repo)
+    extra = Extra(include_soft_deleted=True)
+
+    result = asyncio.run(
+        gather(
+            loader.load(1),
+            loader.load(1, convert_to=Row),
+            loader.load(1, extra=extra),
+            loader.load(1, extra=Extra(include_soft_deleted=True)),
+        )
+    )
+
+    assert result == [Row(1)] * 4
+    assert repo.all_by_pks.call_args_list == [
+        mock.call([1], convert_to=None, extra=None),
+        mock.call([1], convert_to=Row, extra=None),
+        mock.call([1], convert_to=None, extra=extra),
+    ]
+
+
+@pytest.mark.unit
+def test_pk_loader_window_and_batch_size():
+    repo = Repo(existing={1, 2, 3})
+    loader = PkLoader(repo, window=0.01, max_batch_size=2)
+
+    async def staggered():
+        first = asyncio.ensure_future(loader.load_many([1]))
+        await asyncio.sleep(0)
+        return await gather(first, loader.load_many([2, 3]))
+
+    assert asyncio.run(staggered()) == [[Row(1)], [Row(2), Row(3)]]
+    assert repo.all_by_pks.call_args_list == [
+        mock.call([1, 2], convert_to=None, extra=None),
+        mock.call([3], convert_to=None, extra=None),
+    ]
+
+
+@pytest.mark.unit
+def test_pk_loader_error_propagates():
+    repo = Repo(existing=set())
+    repo.all_by_pks.side_effect = RuntimeError("db is down")
+    loader = PkLoader(repo)
+
+    result = asyncio.run(gather(loader.load(1), loader.load(2, strict=False)))
+
+    assert [type(item) for item in result] == [RuntimeError, RuntimeError]
+    repo.all_by_pks.assert_called_once()
+
+
+@pytest.mark.unit
+def test_pk_loader_cancelled_batch_cancels_loads():
+    repo = Repo(existing={1})
+    started, release = threading.Event(), threading.Event()
+
+    def all_by_pks(pks, **kwargs):
+        started.set()
+        release.wait(5)
+        return [Row(pk) for pk in pks]
+
+    repo.all_by_pks.side_effect = all_by_pks
+    loader = PkLoader(repo)
+
+    async def main():
+        load = asyncio.ensure_future(loader.load(1))
+        while not loader._tasks:
+            await asyncio.sleep(0)
+        (task,) = loader._tasks
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+        try:
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(load, 5)
+        finally:
+            release.set()
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert not loader._tasks
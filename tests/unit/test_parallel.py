@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from dbrepos.parallel import fan_out, split_range
+
+
+def _double(value):
+    return value * 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "low,high,n,expected_result",
+    (
+        (1, 10, 1, [(1, 10)]),
+        (1, 10, 2, [(1, 5), (6, 10)]),
+        (1, 10, 3, [(1, 4), (5, 8), (9, 10)]),
+        (1, 3, 5, [(1, 1), (2, 2), (3, 3)]),
+        (5, 5, 4, [(5, 5)]),
+        (5, 4, 4, []),
+        (-2, 1, 2, [(-2, -1), (0, 1)]),
+    ),
+)
+def test_split_range(low, high, n, expected_result):
+    assert split_range(low, high, n) == expected_result
+
+
+@pytest.mark.unit
+def test_split_range_non_positive():
+    with pytest.raises(AssertionError):
+        split_range(1, 10, 0)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "transform,processes,expected_result",
+    (
+        (None, None, [1, 2, 3, 4, 5]),
+        (_double, None, [2, 4, 6, 8, 10]),
+        (_double, 2, [2, 4, 6, 8, 10]),
+    ),
+)
+def test_fan_out(transform, processes, expected_result):
+    threads = set()
+
+    def loader(items):
+        def _load():
+            threads.add(threading.get_ident())
+            return items
+
+        return _load
+
+    result = fan_out(
+        [loader([1, 2]), loader([]), loader([3]), loader([4, 5])],
+        transform=transform,
+        processes=processes,
+    )
+
+    assert list(result) == expected_result
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.unit
+def test_fan_out_no_loaders():
+    assert list(fan_out([])) == []
+
+
+@pytest.mark.unit
+def test_fan_out_bounded():
+    started, produced, closed = set(), {}, set()
+
+    def loader(index):
+        def _load():
+            started.add(index)
+            try:
+                for item in range(100):
+                    produced[index] = item + 1
+                    yield (index, item)
+            finally:
+                closed.add(index)
+
+        return _load
+
+    result = fan_out(
+        [loader(index) for index in range(4)], max_workers=2, buffer_size=3
+    )
+
+    assert next(result) == (0, 0)
+    # NOTE: give running loaders time to fill their buffers
+    time.sleep(0.3)
+    assert started == {0, 1}
+    assert max(produced.values()) <= 5
+    result.close()
+    assert closed == {0, 1}
+
+
+@pytest.mark.unit
+def test_fan_out_streams_in_order():
+    def loader(index):
+        return lambda: iter(range(index * 10, index * 10 + 10))
+
+    assert list(
+        fan_out([loader(index) for index in range(5)], max_workers=2, buffer_size=2)
+    ) == list(range(50))
+
+
+@pytest.mark.unit
+def test_fan_out_error():
+    def failing():
+        yield 1
+        raise ValueError("boom")
+
+    result = fan_out([lambda: iter([0]), failing, lambda: iter([2])])
+
+    assert next(result) == 0
+    assert next(result) == 1
+    with pytest.raises(ValueError):
+        next(result)
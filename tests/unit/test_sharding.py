@@ -0,0 +1,406 @@
+import inspect
+from dataclasses import dataclass
+from unittest import mock
+
+import pytest
+
+from dbrepos.core.abstract import IShardRouter
+from dbrepos.core.exceptions import BaseRepoException
+from dbrepos.core.types import Extra, mode, operator, returning
+from dbrepos.sharding import HashRouter, RangeRouter, ShardedRepo, sort_key
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+
+
+class Filter:
+    def __init__(self, column_name, value, operator_=operator.eq):
+        self.column_name = column_name
+        self.value = value
+        self.operator_ = operator_
+
+
+class FilterSeq:
+    def __init__(self, mode_, *filters):
+        self.mode_ = mode_
+        self.filters = filters
+
+
+def make_repo(shards=3, **kwargs):
+    repos = []
+    for _ in range(shards):
+        repo = mock.Mock()
+        repo.pk_field_name = "id"
+        repo.default_ordering = ("id",)
+        repos.append(repo)
+    return ShardedRepo(repos, router=RangeRouter((10, 20)), **kwargs), repos
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("router", (HashRouter(4), RangeRouter((1, 2, 3))))
+def test_router_protocol(router):
+    assert isinstance(router, IShardRouter)
+    assert router.shards == 4
+
+
+@pytest.mark.unit
+def test_hash_router():
+    router = HashRouter(4)
+    shards = [router.shard_for(value) for value in range(1000)]
+
+    assert shards == [HashRouter(4).shard_for(value) for value in range(1000)]
+    assert set(shards) == {0, 1, 2, 3}
+    assert min(shards.count(shard) for shard in range(4)) > 200
+    assert 0 <= router.shard_for("uuid") < 4
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value,expected", ((-5, 0), (9, 0), (10, 1), (19, 1), (20, 2), (10**9, 2))
+)
+def test_range_router(value, expected):
+    assert RangeRouter((10, 20)).shard_for(value) == expected
+
+
+@pytest.mark.unit
+def test_range_router_unsorted():
+    with pytest.raises(AssertionError):
+        RangeRouter((20, 10))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "ordering,expected",
+    (
+        (("id",), [1, 2, 3, 4]),
+        (("-id",), [4, 3, 2, 1]),
+        (("name", "id"), [1, 3, 2, 4]),
+        (("name", "-id"), [3, 1, 4, 2]),
+        (("-name", "id"), [2, 4, 1, 3]),
+    ),
+)
+def test_sort_key(ordering, expected):
+    rows = [Row(1, "a"), Row(2, "b"), Row(3, "a"), Row(4, "b")]
+
+    assert [row.id for row in sorted(rows, key=sort_key(ordering))] == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "filters,expected",
+    (
+        (Filter("id", 5), {0}),
+        (Filter("id", [5, 25], operator.in_), {0, 2}),
+        (Filter("id", 5, operator.gt), None),
+        (Filter("name", 5), None),
+        (FilterSeq(mode.and_, Filter("name", "a"), Filter("id", 15)), {1}),
+        (
+            FilterSeq(
+                mode.and_,
+                Filter("id", [5, 15], operator.in_),
+                Filter("id", [15, 25], operator.in_),
+            ),
+            {1},
+        ),
+        (FilterSeq(mode.or_, Filter("id", 5), Filter("id", 25)), {0, 2}),
+        (FilterSeq(mode.or_, Filter("id", 5), Filter("name", "a")), None),
+        (
+            FilterSeq(
+                mode.or_,
+                FilterSeq(mode.and_, Filter("name", "a"), Filter("id", 5)),
+                Filter("id", 15),
+            ),
+            {0, 1},
+        ),
+        (True, None),
+    ),
+)
+def test_pinned_shards(filters, expected):
+    repo, _ = make_repo()
+
+    assert repo._pinned_shards(filters) == expected
+
+
+@pytest.mark.unit
+def test_get_by_pk_is_routed():
+    repo, shards = make_repo()
+    shards[1].get_by_pk.return_value = Row(15, "a")
+
+    assert repo.get_by_pk(15) == Row(15, "a")
+    shards[1].get_by_pk.assert_called_once_with(
+        15, convert_to=None, strict=False, extra=None
+    )
+    shards[0].get_by_pk.assert_not_called()
+    shards[2].get_by_pk.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("strict", (False, True))
+def test_get_by_pk_is_scattered(strict):
+    repo, shards = make_repo(shard_key="name")
+    for shard in shards:
+        shard.get_by_pk.return_value = None
+
+    if strict:
+        with pytest.raises(BaseRepoException):
+            repo.get_by_pk(15, strict=strict)
+    else:
+        assert repo.get_by_pk(15, strict=strict) is None
+    for shard in shards:
+        shard.get_by_pk.assert_called_once()
+
+
+@pytest.mark.unit
+def test_all_by_filters_merges_ordered_shards():
+    repo, shards = make_repo()
+    shards[0].all_by_filters.return_value = iter([Row(3, "a"), Row(1, "c")])
+    shards[1].all_by_filters.return_value = iter([Row(2, "b")])
+    shards[2].all_by_filters.return_value = iter([Row(4, "b"), Row(5, "d")])
+
+    rows = repo.all_by_filters(filters=True, extra=Extra(ordering=("name", "-id")))
+
+    assert [row.id for row in rows] == [3, 4, 2, 1, 5]
+
+
+@pytest.mark.unit
+def test_counts_and_exists():
+    repo, shards = make_repo()
+    for count, shard in zip((1, 0, 2), shards):
+        shard.count_by_filters.return_value = count
+        shard.exists_by_filters.return_value = bool(count)
+        shard.exists_by_pks.side_effect = lambda pks, extra: set(pks[:1])
+
+    assert repo.count_by_filters(filters=True) == 3
+    assert repo.exists_by_filters(filters=True) is True
+    assert repo.exists_by_pks([1, 2, 15, 25]) == {1, 15, 25}
+
+
+@pytest.mark.unit
+def test_bulk_create_keeps_entities_order():
+    repo, shards = make_repo()
+    for shard in shards:
+        shard.bulk_create.side_effect = lambda entities, **kwargs: [
+            entity.id for entity in entities
+        ]
+    entities = [Row(id_, "a") for id_ in (25, 1, 15, 2)]
+
+    assert repo.bulk_create(entities, returning_=returning.pk) == [25, 1, 15, 2]
+    assert shards[0].bulk_create.call_args.args == ([entities[1], entities[3]],)
+
+
+@pytest.mark.unit
+def test_create_without_shard_key():
+    repo, _ = make_repo()
+
+    with pytest.raises(BaseRepoException):
+        repo.create(Row(None, "a"))
+
+
+@pytest.mark.unit
+def test_version_checks_require_pk_routing():
+    repo, shards = make_repo(shard_key="name")
+
+    with pytest.raises(BaseRepoException):
+        repo.update(1, values={"name": "a"}, expected_version=1)
+    with pytest.raises(BaseRepoException):
+        repo.multi_update([1], values={"name": "a"}, expected_versions={1: 1})
+    for shard in shards:
+        shard.update.assert_not_called()
+        shard.multi_update.assert_not_called()
+
+
+@pytest.mark.unit
+def test_router_must_cover_shards():
+    with pytest.raises(AssertionError):
+        ShardedRepo([mock.Mock()], router=HashRouter(2))
+
+
+@pytest.mark.unit
+def test_claim_batch_never_exceeds_limit():
+    repo, shards = make_repo()
+    shards[0].claim_batch.side_effect = lambda limit, **kwargs: [Row(1, "a")]
+    shards[1].claim_batch.side_effect = lambda limit, **kwargs: [
+        Row(id_, "a") for id_ in range(10, 20)
+    ][:limit]
+
+    claimed = repo.claim_batch(filters=True, limit=3, values={"name": "b"})
+
+    assert [row.id for row in claimed] == [1, 10, 11]
+    assert shards[1].claim_batch.call_args.kwargs["limit"] == 2
+    shards[2].claim_batch.assert_not_called()
+
+
+@pytest.mark.unit
+def test_subquery_is_not_supported():
+    repo, _ = make_repo()
+
+    with pytest.raises(BaseRepoException):
+        repo.subquery("id")
+
+
+@pytest.mark.unit
+def test_sort_key_of_tuples():
+    rows = [(1, "a"), (2, "b"), (3, "a")]
+
+    assert sorted(rows, key=sort_key(("name", "-id"), fields=("id", "name"))) == [
+        (3, "a"),
+        (1, "a"),
+        (2, "b"),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "ordering,nulls_largest,expected",
+    (
+        (("name", "id"), False, [2, 4, 1, 3]),
+        (("-name", "id"), False, [3, 1, 2, 4]),
+        (("name", "id"), True, [1, 3, 2, 4]),
+        (("-name", "id"), True, [2, 4, 3, 1]),
+    ),
+)
+def test_sort_key_nulls(ordering, nulls_largest, expected):
+    rows = [Row(1, "a"), Row(2, None), Row(3, "b"), Row(4, None)]
+
+    assert [
+        row.id
+        for row in sorted(rows, key=sort_key(ordering, nulls_largest=nulls_largest))
+    ] == expected
+
+
+@pytest.mark.unit
+def test_merge_nulls():
+    repo, shards = make_repo(nulls_largest=True)
+    shards[0].all.return_value = [Row(1, "a"), Row(3, None)]
+    shards[1].all.return_value = [Row(2, "b"), Row(4, None)]
+    shards[2].all.return_value = []
+
+    assert [row.id for row in repo.all(extra=mock.Mock(ordering=("name",)))] == [
+        1,
+        2,
+        3,
+        4,
+    ]
+
+
+@pytest.mark.unit
+def test_values_merge():
+    repo, shards = make_repo()
+    shards[0].values.return_value = [(1, "a"), (3, "c")]
+    shards[1].values.return_value = [(12, "a"), (15, "b")]
+    shards[2].values.return_value = []
+
+    assert repo.values(("id", "name"), extra=Extra(ordering=("name", "id"))) == [
+        (1, "a"),
+        (12, "a"),
+        (15, "b"),
+        (3, "c"),
+    ]
+    # NOTE: not selected ordering columns cannot be merged
+    assert repo.pluck("id", extra=Extra(ordering=("name", "id"))) == [1, 3, 12, 15]
+    shards[0].values.assert_called_with(
+        ("id",),
+        filters=None,
+        extra=Extra(ordering=("name", "id")),
+        distinct=False,
+        chunk_size=None,
+    )
+
+
+@pytest.mark.unit
+def test_values_distinct():
+    repo, shards = make_repo()
+    for names, shard in zip((["a", "c"], ["a", "b"], ["c"]), shards):
+        shard.values.return_value = [(name,) for name in names]
+
+    assert repo.pluck("name", distinct=True) == ["a", "b", "c"]
+    assert list(repo.pluck("name", distinct=True, chunk_size=10)) == ["a", "b", "c"]
+
+
+@pytest.mark.unit
+def test_get_many_by_pks_is_routed():
+    repo, shards = make_repo()
+    for shard in shards:
+        shard.get_many_by_field.side_effect = lambda name, values, **kwargs: {
+            value: Row(value, "a") for value in values if value != 2
+        }
+
+    found = repo.get_many_by_pks([25, 1, 2, 15, 1])
+
+    assert list(found) == [25, 1, 15]
+    assert shards[0].get_many_by_field.call_args.args == ("id", [1, 2])
+    assert shards[1].get_many_by_field.call_args.args == ("id", [15])
+
+
+@pytest.mark.unit
+def test_merge_is_lazy():
+    repo, shards = make_repo()
+    pulled = []
+
+    def rows(*ids):
+        for id_ in ids:
+            pulled.append(id_)
+            yield Row(id_, "a")
+
+    shards[0].all.return_value = rows(1, 4)
+    shards[1].all.return_value = rows(2, 5)
+    shards[2].all.return_value = rows(3, 6)
+
+    merged = repo.all()
+    assert next(merged) == Row(1, "a")
+    # NOTE: only the heads of shard results are pulled
+    assert sorted(pulled) == [1, 2, 3]
+    assert [row.id for row in merged] == [2, 3, 4, 5, 6]
+
+
+@pytest.mark.unit
+def test_routed_methods_keep_signatures():
+    repo, shards = make_repo()
+    for shard in shards:
+        shard.delete_by_filters.return_value = 1
+
+    assert list(inspect.signature(repo.delete_by_filters).parameters) == [
+        "filters",
+        "batch_size",
+        "extra",
+        "session",
+    ]
+    assert repo.delete_by_filters(filters=True, session=None) == 3
+    shards[0].delete_by_filters.assert_called_once_with(
+        filters=True, batch_size=None, extra=None
+    )
+    with pytest.raises(TypeError):
+        repo.delete_by_filters(True)
+
+
+@pytest.mark.unit
+def test_context_manager_closes():
+    with make_repo()[0] as repo:
+        assert repo.exists_by_filters(filters=True) is True
+
+    with pytest.raises(RuntimeError):
+        repo._executor.submit(print)
+
+
+@pytest.mark.unit
+def test_create_stream_commits_every_batches():
+    repo, shards = make_repo()
+    rows = [Row(id_, "a") for id_ in (1, 2, 15, 3, 25)]
+
+    stats = repo.create_stream(iter(rows), batch_size=2, commit_every=2)
+
+    assert (stats.rows, stats.batches, stats.commits) == (5, 3, 2)
+    assert [call.args for call in shards[0].create_stream.call_args_list] == [
+        ([rows[0], rows[1], rows[3]],)
+    ]
+    assert shards[0].create_stream.call_args.kwargs == {
+        "batch_size": 2,
+        "commit_every": 2,
+    }
+    assert shards[2].create_stream.call_args.kwargs == {
+        "batch_size": 2,
+        "commit_every": 1,
+    }
@@ -1,7 +1,13 @@
+from unittest.mock import Mock
+
 import pytest
 
-from dbrepos.core.exceptions import BaseRepoException
-from dbrepos.shortcuts import BASE_MSG, get_object_or_404
+from dbrepos.core.exceptions import (
+    BaseRepoException,
+    NotFoundError,
+    VersionConflictError,
+)
+from dbrepos.shortcuts import BASE_MSG, get_object_or_404, retry_on_conflict
 
 
 class CustomException(BaseRepoException):
@@ -26,3 +32,32 @@ def test_get_object_or_404(exc, msg, obj, expected_exception):
         assert str(exc.value) == (msg or BASE_MSG)
     else:
         assert get_object_or_404(**kwargs) == obj
+
+
+@pytest.mark.unit
+def test_get_object_or_404_not_found():
+    with pytest.raises(NotFoundError):
+        get_object_or_404(None)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "conflicts,attempts,expected_error",
+    ((0, 3, None), (2, 3, None), (3, 3, VersionConflictError)),
+)
+def test_retry_on_conflict(conflicts, attempts, expected_error):
+    repo = Mock()
+    repo.save.side_effect = [VersionConflictError()] * conflicts + [True]
+    apply = Mock()
+
+    if expected_error is not None:
+        with pytest.raises(expected_error):
+            retry_on_conflict(repo, 1, apply, convert_to=dict, attempts=attempts)
+    else:
+        entity = retry_on_conflict(repo, 1, apply, convert_to=dict, attempts=attempts)
+        assert entity is repo.get_by_pk.return_value
+
+    calls = min(conflicts + 1, attempts)
+    assert repo.get_by_pk.call_count == calls
+    assert apply.call_count == calls
+    assert repo.save.call_count == calls
@@ -0,0 +1,79 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from dbrepos.core.types import SingleFlightStats
+from dbrepos.singleflight import SingleFlight
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out"
+        time.sleep(0.001)
+
+
+def run_coalesced(group, key, load, followers):
+    release = threading.Event()
+    results = []
+
+    def blocking_load():
+        release.wait()
+        return load()
+
+    def call(load):
+        try:
+            results.append(group.do(key, load))
+        except Exception as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=call, args=(blocking_load,))]
+    threads[0].start()
+    wait_for(lambda: group.stats().in_flight == 1)
+    before = group.stats().coalesced
+    for _ in range(followers):
+        threads.append(threading.Thread(target=call, args=(load,)))
+        threads[-1].start()
+    wait_for(lambda: group.stats().coalesced == before + followers)
+    release.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.mark.unit
+def test_single_flight_coalesces_concurrent_calls():
+    group = SingleFlight()
+    load = mock.Mock(return_value=["row"])
+
+    results = run_coalesced(group, "key", load, followers=5)
+
+    load.assert_called_once()
+    assert len(results) == 6
+    assert all(result is results[0] for result in results)
+    assert group.stats() == SingleFlightStats(executions=1, coalesced=5, in_flight=0)
+
+
+@pytest.mark.unit
+def test_single_flight_shares_error():
+    group = SingleFlight()
+    error = RuntimeError("db is down")
+    load = mock.Mock(side_effect=error)
+
+    results = run_coalesced(group, "key", load, followers=2)
+
+    load.assert_called_once()
+    assert results == [error] * 3
+
+
+@pytest.mark.unit
+def test_single_flight_does_not_keep_results():
+    group = SingleFlight()
+    load = mock.Mock(side_effect=["first", "second", "other"])
+
+    assert group.do("key", load) == "first"
+    assert group.do("key", load) == "second"
+    assert group.do("other", load) == "other"
+    assert group.stats() == SingleFlightStats(executions=3, coalesced=0, in_flight=0)
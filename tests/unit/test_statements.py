@@ -0,0 +1,40 @@
+from unittest import mock
+
+import pytest
+
+from dbrepos.core.types import CacheStats
+from dbrepos.sqlalchemy.statements import StatementCache
+
+
+@pytest.mark.unit
+def test_statement_cache_get_or_build():
+    cache = StatementCache(maxsize=2)
+    build = mock.Mock(side_effect=["first", "second", "third", "fourth"])
+
+    assert cache.get_or_build("a", build) == "first"
+    assert cache.get_or_build("a", build) == "first"
+    assert cache.get_or_build("b", build) == "second"
+    assert cache.get_or_build("a", build) == "first"
+    # NOTE: "b" is the least recently used one, so it is evicted
+    assert cache.get_or_build("c", build) == "third"
+    assert cache.get_or_build("a", build) == "first"
+    assert cache.get_or_build("b", build) == "fourth"
+
+    assert build.call_count == 4
+    assert cache.stats() == CacheStats(hits=3, misses=4, size=2)
+
+
+@pytest.mark.unit
+def test_statement_cache_clear():
+    cache = StatementCache()
+    cache.get_or_build("a", mock.Mock(return_value="statement"))
+
+    cache.clear()
+
+    assert cache.stats() == CacheStats(hits=0, misses=0, size=0)
+
+
+@pytest.mark.unit
+def test_statement_cache_non_positive_size():
+    with pytest.raises(AssertionError):
+        StatementCache(maxsize=0)
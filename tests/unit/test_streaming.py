@@ -0,0 +1,81 @@
+from unittest import mock
+
+import pytest
+
+from dbrepos.core.types import StreamStats
+from dbrepos.streaming import StreamProgress, batched
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "items,batch_size,expected_batches",
+    (
+        ([], 2, []),
+        ([1], 2, [[1]]),
+        ([1, 2], 2, [[1, 2]]),
+        ([1, 2, 3, 4, 5], 2, [[1, 2], [3, 4], [5]]),
+        ([1, 2, 3], 1, [[1], [2], [3]]),
+    ),
+)
+def test_batched(items, batch_size, expected_batches):
+    assert list(batched(iter(items), batch_size=batch_size)) == expected_batches
+
+
+@pytest.mark.unit
+def test_batched_is_lazy():
+    pulled = []
+
+    def items():
+        for i in range(5):
+            pulled.append(i)
+            yield i
+
+    batches = batched(items(), batch_size=2)
+
+    assert next(batches) == [0, 1]
+    assert pulled == [0, 1]
+
+
+@pytest.mark.unit
+def test_batched_flush_interval():
+    clock = Clock()
+
+    def items():
+        yield 1
+        clock.now = 5
+        yield 2
+        clock.now = 6
+        yield 3
+
+    assert list(batched(items(), batch_size=10, flush_interval=5, clock=clock)) == [
+        [1, 2],
+        [3],
+    ]
+
+
+@pytest.mark.unit
+def test_stream_progress():
+    clock = Clock()
+    on_progress = mock.Mock()
+    progress = StreamProgress(on_progress, clock=clock)
+
+    clock.now = 2
+    progress.flushed(10)
+    progress.committed()
+    clock.now = 4
+    progress.flushed(6)
+
+    assert on_progress.call_args_list == [
+        mock.call(StreamStats(rows=10, batches=1, commits=0, elapsed=2)),
+        mock.call(StreamStats(rows=16, batches=2, commits=1, elapsed=4)),
+    ]
+    assert progress.stats().rows_per_second == 4
+    assert StreamStats().rows_per_second == 0
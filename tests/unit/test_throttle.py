@@ -0,0 +1,56 @@
+from unittest import mock
+
+import pytest
+
+from dbrepos.throttle import LogThrottle
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "sample_rate,min_interval,expect_error",
+    ((1.0, None, False), (0.0, 0.0, False), (1.5, None, True), (1.0, -1.0, True)),
+)
+def test_log_throttle_init(sample_rate, min_interval, expect_error):
+    if expect_error:
+        with pytest.raises(AssertionError):
+            LogThrottle(sample_rate=sample_rate, min_interval=min_interval)
+        return
+
+    LogThrottle(sample_rate=sample_rate, min_interval=min_interval)
+
+
+@pytest.mark.unit
+def test_log_throttle_sample_rate():
+    throttle = LogThrottle(
+        sample_rate=0.5, rand=mock.Mock(side_effect=[0.9, 0.7, 0.1, 0.4, 0.5])
+    )
+
+    assert [throttle.acquire() for _ in range(5)] == [None, None, 2, 0, None]
+
+
+@pytest.mark.unit
+def test_log_throttle_min_interval():
+    throttle = LogThrottle(
+        min_interval=10, clock=mock.Mock(side_effect=[0, 5, 9.9, 10, 25])
+    )
+
+    assert [throttle.acquire() for _ in range(5)] == [0, None, None, 2, 0]
+
+
+@pytest.mark.unit
+def test_log_throttle_disabled():
+    throttle = LogThrottle()
+
+    assert [throttle.acquire() for _ in range(3)] == [0, 0, 0]
+
+
+@pytest.mark.unit
+def test_log_throttle_keys():
+    throttle = LogThrottle(
+        min_interval=10, clock=mock.Mock(side_effect=[0, 1, 2, 3, 10, 11])
+    )
+
+    assert [
+        throttle.acquire(key) for key in (KeyError, ValueError, KeyError, KeyError)
+    ] == [0, 0, None, None]
+    assert [throttle.acquire(key) for key in (KeyError, ValueError)] == [2, 0]
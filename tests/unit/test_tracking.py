@@ -0,0 +1,76 @@
+import gc
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+from dbrepos.tracking import ChangeTracker
+
+
+@dataclass
+class Entity:
+    id: int
+    name: str
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SlottedEntity:
+    id: int
+    name: str
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("entity_class", (Entity, SlottedEntity))
+def test_change_tracker_changes(entity_class):
+    tracker = ChangeTracker()
+    entity = entity_class(id=1, name="name")
+
+    assert tracker.changes(entity) is None
+    assert tracker.track(entity) is entity
+    assert entity in tracker
+    assert tracker.changes(entity) == {}
+
+    entity.name = "name"
+    assert tracker.changes(entity) == {}
+    entity.name = "new"
+    assert tracker.changes(entity) == {"name": "new"}
+
+    tracker.track(entity)
+    assert tracker.changes(entity) == {}
+
+    tracker.untrack(entity)
+    assert entity not in tracker
+    assert len(tracker) == 0
+
+
+@pytest.mark.unit
+def test_change_tracker_is_shallow():
+    tracker = ChangeTracker()
+    entity = tracker.track(Entity(id=1, name="name", tags=["a"]))
+
+    # NOTE: snapshot shares the list, so in-place mutation is not detected
+    entity.tags.append("b")
+    assert tracker.changes(entity) == {}
+    entity.tags = ["c"]
+    assert tracker.changes(entity) == {"tags": ["c"]}
+
+
+@pytest.mark.unit
+def test_change_tracker_drops_collected_entities():
+    tracker = ChangeTracker()
+    tracker.track(Entity(id=1, name="name"))
+    gc.collect()
+
+    assert len(tracker) == 0
+
+
+@pytest.mark.unit
+def test_change_tracker_equal_entities_are_tracked_separately():
+    tracker = ChangeTracker()
+    first = tracker.track(Entity(id=1, name="name"))
+    second = Entity(id=1, name="name")
+
+    assert first == second
+    assert second not in tracker
+    assert tracker.changes(second) is None
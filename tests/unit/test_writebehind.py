@@ -0,0 +1,178 @@
+import gc
+import logging
+import threading
+import weakref
+from unittest import mock
+
+import pytest
+
+from dbrepos.core.exceptions import BaseRepoException
+from dbrepos.core.types import WriteBehindStats
+from dbrepos.writebehind import WriteBehindBuffer
+
+
+class FakeRepo:
+    def __init__(self, fail=0):
+        self.calls = []
+        self.fail = fail
+        self.written = threading.Event()
+
+    def bulk_update(self, values, *, deltas=None):
+        if self.fail:
+            self.fail -= 1
+            raise RuntimeError("db is down")
+        self.calls.append((values, deltas))
+        self.written.set()
+        return len(set(values) | set(deltas))
+
+
+@pytest.mark.unit
+def test_write_behind_coalesces_changes():
+    repo = FakeRepo()
+    buffer = WriteBehindBuffer(repo, flush_interval=None)
+
+    buffer.update(1, values={"name": "a", "seen": 1})
+    buffer.update(1, values={"name": "b"})
+    buffer.increment(1, "views")
+    buffer.increment(1, "views", by=4)
+    buffer.increment(2, "views", by=-1)
+    buffer.increment(1, "seen", by=2)
+    buffer.increment(2, "views")
+    buffer.update(2, values={"views": 10})
+    buffer.increment(2, "views")
+
+    assert repo.calls == []
+    assert buffer.stats() == WriteBehindStats(depth=2, writes=9, coalesced=7)
+    assert buffer.flush() == 2
+    assert repo.calls == [
+        ({1: {"name": "b", "seen": 3}, 2: {"views": 11}}, {1: {"views": 5}})
+    ]
+    assert buffer.stats().depth == 0
+    assert buffer.flush() == 0
+    assert len(repo.calls) == 1
+    buffer.close()
+
+
+@pytest.mark.unit
+def test_write_behind_flushes_on_size():
+    repo = FakeRepo()
+    buffer = WriteBehindBuffer(repo, max_size=2, flush_interval=None)
+
+    buffer.increment(1, "views")
+    buffer.increment(1, "views")
+    assert repo.calls == []
+    buffer.increment(2, "views")
+
+    assert repo.calls == [({}, {1: {"views": 2}, 2: {"views": 1}})]
+    assert buffer.stats().depth == 0
+    buffer.close()
+
+
+@pytest.mark.unit
+def test_write_behind_flushes_on_interval():
+    repo = FakeRepo()
+    buffer = WriteBehindBuffer(repo, flush_interval=0.01)
+
+    buffer.increment(1, "views")
+
+    assert repo.written.wait(5)
+    assert repo.calls == [({}, {1: {"views": 1}})]
+    buffer.close()
+
+
+@pytest.mark.unit
+def test_write_behind_close():
+    repo = FakeRepo()
+    with WriteBehindBuffer(repo, flush_interval=60) as buffer:
+        buffer.update(1, values={"name": "a"})
+
+    assert not buffer._finalizer.alive
+    assert repo.calls == [({1: {"name": "a"}}, {})]
+    with pytest.raises(BaseRepoException):
+        buffer.increment(1, "views")
+    buffer.close()
+    assert len(repo.calls) == 1
+
+
+@pytest.mark.unit
+def test_write_behind_close_failure_keeps_changes():
+    repo = FakeRepo(fail=1)
+    buffer = WriteBehindBuffer(repo, flush_interval=60)
+    buffer.update(1, values={"name": "a"})
+
+    with pytest.raises(RuntimeError):
+        buffer.close()
+    buffer.increment(1, "views")
+    assert buffer.stats().depth == 1
+    buffer.close()
+
+    assert repo.calls == [({1: {"name": "a"}}, {1: {"views": 1}})]
+    assert not buffer._finalizer.alive
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("flush_interval", (None, 60))
+def test_write_behind_flushes_dropped_buffer(flush_interval):
+    repo = FakeRepo()
+    buffer = WriteBehindBuffer(repo, flush_interval=flush_interval)
+    buffer.update(1, values={"name": "a"})
+    thread = buffer._thread
+    ref = weakref.ref(buffer)
+
+    del buffer
+    gc.collect()
+
+    assert ref() is None
+    assert repo.calls == [({1: {"name": "a"}}, {})]
+    if thread is not None:
+        thread.join(5)
+        assert not thread.is_alive()
+
+
+@pytest.mark.unit
+def test_write_behind_requeues_failed_flush():
+    repo = FakeRepo(fail=1)
+    buffer = WriteBehindBuffer(repo, flush_interval=None)
+    buffer.update(1, values={"name": "a"})
+    buffer.increment(1, "views")
+
+    with pytest.raises(RuntimeError):
+        buffer.flush()
+    buffer.update(1, values={"name": "b"})
+    buffer.increment(1, "views")
+
+    assert buffer.stats().failed_flushes == 1
+    assert buffer.flush() == 1
+    assert repo.calls == [({1: {"name": "b"}}, {1: {"views": 2}})]
+    buffer.close()
+
+
+@pytest.mark.unit
+def test_write_behind_logs_background_errors(caplog):
+    repo = FakeRepo(fail=1)
+    buffer = WriteBehindBuffer(repo, flush_interval=0.01)
+
+    with caplog.at_level(logging.ERROR, logger="dbrepos.writebehind"):
+        buffer.increment(1, "views")
+        assert repo.written.wait(5)
+    buffer.close()
+
+    assert "db is down" in caplog.text
+    assert repo.calls == [({}, {1: {"views": 1}})]
+
+
+@pytest.mark.unit
+def test_write_behind_flush_latency():
+    clock = mock.Mock(side_effect=[10.0, 10.5, 20.0, 20.25])
+    buffer = WriteBehindBuffer(FakeRepo(), flush_interval=None, clock=clock)
+
+    buffer.increment(1, "views")
+    buffer.flush()
+    buffer.increment(1, "views")
+    buffer.flush()
+
+    stats = buffer.stats()
+    assert (stats.flushes, stats.flushed_rows) == (2, 2)
+    assert stats.last_flush_latency == 0.25
+    assert stats.max_flush_latency == 0.5
+    buffer.close()